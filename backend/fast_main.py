@@ -3,21 +3,26 @@ Pure Python FastAPI backend for syft-objects with integrated HTML generation
 No Node.js dependencies - serves HTML directly from Python
 """
 
+import asyncio
 import os
+import shutil
+import stat
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
 from pathlib import Path as PathLib
 
 from fastapi import FastAPI, Depends, HTTPException, Body, Path, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse, RedirectResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse, RedirectResponse, FileResponse, ORJSONResponse, StreamingResponse
 from loguru import logger
 from fastapi.staticfiles import StaticFiles
 
 # Import filesystem editor components
 import sys
 sys.path.append(str(PathLib(__file__).parent))
-from filesystem_editor import FileSystemManager, generate_editor_html
+from filesystem_editor import FileSystemManager, generate_editor_page, generate_editor_page_gzip
 from single_object_viewer import generate_single_object_viewer_html
 
 try:
@@ -35,6 +40,13 @@ except ImportError:
     get_syftbox_client = None
     SYFTBOX_AVAILABLE = False
 
+# Home and SyftBox locations, resolved once instead of on every request
+_HOME = PathLib.home()
+_HOME_STR = str(_HOME)
+_SYFTBOX_ROOT = _HOME / "SyftBox"
+_SYFTBOX_ROOT_STR = str(_SYFTBOX_ROOT)
+_SYFTBOX_DATASITES = _SYFTBOX_ROOT / "datasites"
+
 
 app = FastAPI(
     title="Syft Objects API (Pure Python)",
@@ -57,6 +69,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress file contents and listings; small JSON replies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Custom HTML generation removed - now serving actual Next.js application
 
 # All custom HTML generation functions removed - now serving actual Next.js application
@@ -71,6 +86,135 @@ try:
 except Exception as e:
     logger.warning(f"Could not mount Next.js static files: {e}")
 
+# Lookup index over the objects collection. The collection swaps in a fresh
+# _objects list every time it reloads, so the index is rebuilt lazily the first
+# time a request notices the list has changed.
+_index_source = None
+_url_index: Dict[str, tuple] = {}
+_uid_index: Dict[str, Any] = {}
+_owner_index: Dict[int, tuple] = {}
+# Objects created since the last reload only show up after one, so a miss reloads
+# the collection - at most once per interval, so a burst of 404s stays cheap
+_MISS_RELOAD_INTERVAL = 1.0
+_last_miss_reload = float('-inf')
+
+
+def _normalize_email(email: Optional[str]) -> Optional[str]:
+    """Lower-case, strip and intern an email so equal addresses share one string."""
+    if not isinstance(email, str) or not email.strip() or email == 'unknown':
+        return None
+    return sys.intern(email.lower().strip())
+
+
+def _resolve_owner_email(obj) -> str:
+    """Read the owner email from a CleanSyftObject or raw SyftObject."""
+    # Get owner email using CleanSyftObject's get_owner method
+    owner_email = obj.get_owner() if hasattr(obj, 'get_owner') else 'unknown'
+
+    # If we still don't have owner email, try to get it from raw object
+    if owner_email == 'unknown' and hasattr(obj, '_CleanSyftObject__obj'):
+        raw_obj = obj._CleanSyftObject__obj
+        if hasattr(raw_obj, 'get_owner_email'):
+            owner_email = raw_obj.get_owner_email()
+    elif owner_email == 'unknown' and hasattr(obj, 'get_owner_email'):
+        owner_email = obj.get_owner_email()
+    return owner_email
+
+
+def _rebuild_object_indexes() -> None:
+    """Rebuild the syft:// URL, UID and owner indexes from the objects collection."""
+    global _index_source, _url_index, _uid_index, _owner_index
+    url_index = {}
+    uid_index = {}
+    owner_index = {}
+    for obj in objects:
+        # Handle both CleanSyftObject and raw SyftObject via the per-type UID
+        # accessor instead of a hasattr probe per object; keys are always strings
+        get_uid = _caps(obj)['get_uid']
+        obj_uid = get_uid(obj) if get_uid else obj.uid
+        uid_index.setdefault(str(obj_uid), obj)
+
+        try:
+            owner_email = _resolve_owner_email(obj)
+            owner_index[id(obj)] = (owner_email, _normalize_email(owner_email))
+        except Exception:
+            pass
+
+        # Handle both CleanSyftObject and raw SyftObject
+        if hasattr(obj, 'get_urls'):
+            urls = obj.get_urls()
+            private_url = urls.get('private', '')
+            mock_url = urls.get('mock', '')
+        else:
+            raw_obj = obj._obj if hasattr(obj, '_obj') else obj
+            private_url = raw_obj.private_url
+            mock_url = raw_obj.mock_url
+
+        # First object wins, private before mock - same order as a linear scan.
+        # Keys are interned so repeat lookups of the same URL compare by identity.
+        if isinstance(private_url, str) and private_url:
+            url_index.setdefault(sys.intern(private_url), (obj, 'private'))
+        if isinstance(mock_url, str) and mock_url:
+            url_index.setdefault(sys.intern(mock_url), (obj, 'mock'))
+
+    _url_index = url_index
+    _uid_index = uid_index
+    _owner_index = owner_index
+    # Iterating may have reloaded the collection, so read the source afterwards
+    _index_source = getattr(objects, '_objects', None)
+
+
+def _indexes_stale() -> bool:
+    """Check whether the collection has reloaded since the indexes were built."""
+    source = getattr(objects, '_objects', None)
+    return source is None or source is not _index_source
+
+
+def _lookup(probe):
+    """Run an index probe, rebuilding the indexes when they are stale or miss.
+
+    The shared collection only reloads when something iterates or refreshes it,
+    so an object created after the last reload is missing from the index. A miss
+    reloads from disk and probes again, rate-limited by _MISS_RELOAD_INTERVAL.
+    """
+    global _last_miss_reload
+    if _indexes_stale():
+        _rebuild_object_indexes()
+    hit = probe()
+    now = time.monotonic()
+    if hit is None and now - _last_miss_reload >= _MISS_RELOAD_INTERVAL:
+        _last_miss_reload = now
+        # Uncached collections reload when the rebuild iterates them; only
+        # cached ones need an explicit refresh
+        if getattr(objects, '_cached', True):
+            objects.refresh()
+        _rebuild_object_indexes()
+        hit = probe()
+    return hit
+
+
+def _lookup_url(syft_url: str) -> Optional[tuple]:
+    """Return (object, 'private' | 'mock') for a syft:// URL, or None if unknown."""
+    return _lookup(lambda: _url_index.get(syft_url))
+
+
+def _get_by_uid(object_uid: str):
+    """Return the object with the given UID, or None if unknown."""
+    return _lookup(lambda: _uid_index.get(object_uid))
+
+
+def _owner_emails(obj) -> tuple:
+    """Return (owner_email, normalized_owner_email) for an object.
+
+    Uses the value captured at index-build time when the object belongs to
+    the current index, otherwise resolves it directly.
+    """
+    entry = _owner_index.get(id(obj)) if not _indexes_stale() else None
+    if entry is None:
+        owner_email = _resolve_owner_email(obj)
+        entry = (owner_email, _normalize_email(owner_email))
+    return entry
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -598,7 +742,7 @@ async def reinstall_syftbox_app() -> Dict[str, Any]:
             detail=f"Error reinstalling SyftBox app: {str(e)}"
         )
 
-@app.get("/api/objects/{object_uid}")
+@app.get("/api/objects/{object_uid}", response_class=ORJSONResponse)
 async def get_object_details(object_uid: str) -> Dict[str, Any]:
     """Get detailed information about a specific object."""
     if objects is None:
@@ -606,12 +750,7 @@ async def get_object_details(object_uid: str) -> Dict[str, Any]:
     
     try:
         # Find the object by UID
-        target_obj = None
-        for obj in objects:
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
@@ -739,7 +878,7 @@ async def get_object_details(object_uid: str) -> Dict[str, Any]:
         logger.error(f"Error getting object details: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving object details: {str(e)}")
 
-@app.get("/api/metadata/emails")
+@app.get("/api/metadata/emails", response_class=ORJSONResponse)
 async def get_unique_emails() -> Dict[str, Any]:
     """Get list of unique email addresses."""
     if objects is None:
@@ -755,7 +894,7 @@ async def get_unique_emails() -> Dict[str, Any]:
         logger.error(f"Error getting unique emails: {e}")
         raise HTTPException(status_code=500, detail=f"Error retrieving emails: {str(e)}")
 
-@app.get("/api/metadata/names")
+@app.get("/api/metadata/names", response_class=ORJSONResponse)
 async def get_unique_names() -> Dict[str, Any]:
     """Get list of unique object names."""
     if objects is None:
@@ -778,38 +917,21 @@ async def get_file_content(syft_url: str) -> PlainTextResponse:
         raise HTTPException(status_code=503, detail="Syft objects not available")
     
     try:
-        # Convert syft:// URL to local file path
-        if not syft_url.startswith("syft://"):
-            raise HTTPException(status_code=400, detail="Invalid syft:// URL")
-        
+        # Intern so the index lookup can match the stored key by identity
+        syft_url = sys.intern(syft_url) if isinstance(syft_url, str) else syft_url
+
         # Find the object that has this URL
-        target_obj = None
-        is_private = False
-        is_mock = False
-        
-        for obj in objects:
-            # Handle both CleanSyftObject and raw SyftObject
-            if hasattr(obj, 'get_urls'):
-                urls = obj.get_urls()
-                private_url = urls.get('private', '')
-                mock_url = urls.get('mock', '')
-            else:
-                raw_obj = obj._obj if hasattr(obj, '_obj') else obj
-                private_url = raw_obj.private_url
-                mock_url = raw_obj.mock_url
-                
-            if private_url == syft_url:
-                target_obj = obj
-                is_private = True
-                break
-            elif mock_url == syft_url:
-                target_obj = obj
-                is_mock = True
-                break
-        
-        if not target_obj:
+        hit = _lookup_url(syft_url)
+        if hit is None:
+            # Object URLs are always syft:// URLs, so only a miss needs the prefix check
+            if not syft_url.startswith("syft://"):
+                raise HTTPException(status_code=400, detail="Invalid syft:// URL")
             raise HTTPException(status_code=404, detail="File not found")
-        
+
+        target_obj, url_type = hit
+        is_private = url_type == 'private'
+        is_mock = url_type == 'mock'
+
         # Get the file path
         if is_private:
             if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path'):
@@ -855,6 +977,27 @@ async def get_file_content(syft_url: str) -> PlainTextResponse:
         logger.error(f"Error serving file {syft_url}: {e}")
         raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
 
+class _ObjectPaths(NamedTuple):
+    private_path: Optional[str]
+    mock_path: Optional[str]
+
+
+def _paths(target_obj) -> _ObjectPaths:
+    """Resolve the private and mock file paths of a CleanSyftObject or raw SyftObject."""
+    raw_obj = target_obj._CleanSyftObject__obj if hasattr(target_obj, '_CleanSyftObject__obj') else target_obj
+
+    if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path'):
+        private_path = target_obj.private.get_path()
+    else:
+        private_path = raw_obj.private_path
+
+    if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_path'):
+        mock_path = target_obj.mock.get_path()
+    else:
+        mock_path = raw_obj.mock_path
+
+    return _ObjectPaths(private_path, mock_path)
+
 @app.put("/api/objects/{object_uid}/file/{file_type}")
 async def save_file_content(
     object_uid: str,
@@ -874,13 +1017,7 @@ async def save_file_content(
         content_str = content.decode('utf-8')
         
         # Find the object by UID
-        target_obj = None
-        for obj in objects:
-            # Handle both CleanSyftObject and raw SyftObject
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
@@ -921,19 +1058,9 @@ async def save_file_content(
             logger.error(f"Error checking write permissions: {e}")
             raise HTTPException(status_code=403, detail="Permission verification failed")
         
-        # Get the file path
-        if file_type == 'private':
-            if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path'):
-                file_path = target_obj.private.get_path()
-            else:
-                raw_obj = target_obj._CleanSyftObject__obj if hasattr(target_obj, '_CleanSyftObject__obj') else target_obj
-                file_path = raw_obj.private_path
-        else:  # mock
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_path'):
-                file_path = target_obj.mock.get_path()
-            else:
-                raw_obj = target_obj._CleanSyftObject__obj if hasattr(target_obj, '_CleanSyftObject__obj') else target_obj
-                file_path = raw_obj.mock_path
+        # Resolve both file paths once - the validation below needs them too
+        private_path, mock_path = _paths(target_obj)
+        file_path = private_path if file_type == 'private' else mock_path
         
         if not file_path:
             raise HTTPException(status_code=400, detail=f"No {file_type} file path found for this object")
@@ -947,20 +1074,10 @@ async def save_file_content(
         
         # Validate mock/real compatibility after update
         try:
-            # Get both file paths
-            if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path'):
-                private_path = target_obj.private.get_path()
-            else:
-                private_path = raw_obj.private_path
-                
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_path'):
-                mock_path = target_obj.mock.get_path()
-            else:
-                mock_path = raw_obj.mock_path
-            
             # Only validate if both files exist
             if private_path and mock_path and PathLib(private_path).exists() and PathLib(mock_path).exists():
-                validate_mock_real_compatibility(mock_path, private_path, skip_validation=False)
+                # Validation reads both files, so keep it off the event loop
+                await asyncio.to_thread(validate_mock_real_compatibility, mock_path, private_path, skip_validation=False)
         except MockRealValidationError as e:
             # Validation failed - provide helpful error message
             logger.warning(f"Mock/Real validation failed after file update: {e}")
@@ -1004,13 +1121,7 @@ async def update_object_permissions(
     
     try:
         # Find the object by UID
-        target_obj = None
-        for obj in objects:
-            # Handle both CleanSyftObject and raw SyftObject
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
@@ -1041,70 +1152,23 @@ async def update_object_permissions(
         
         # Log the current and new permissions for debugging
         logger.info(f"Updating permissions for object {object_uid}")
-        logger.info(f"Current permissions: {target_obj.__dict__}")
-        logger.info(f"New permissions: {permissions}")
-        
-        # Update the object's permissions using proper setter methods
-        updated_fields = []
-        
-        # Update discovery permissions (syftobject read)
-        if 'discovery_read' in permissions:
-            if hasattr(target_obj, 'set_discovery_permissions'):
-                target_obj.set_discovery_permissions(permissions['discovery_read'])
-                updated_fields.append('discovery_read')
-            else:
-                logger.warning(f"Object {object_uid} does not support set_discovery_permissions")
-        
-        # Update mock permissions
-        if 'mock_read' in permissions:
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'set_read_permissions'):
-                target_obj.mock.set_read_permissions(permissions['mock_read'])
-                updated_fields.append('mock_read')
-            else:
-                logger.warning(f"Object {object_uid} does not support mock.set_read_permissions")
-                
-        if 'mock_write' in permissions:
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'set_write_permissions'):
-                target_obj.mock.set_write_permissions(permissions['mock_write'])
-                updated_fields.append('mock_write')
-            else:
-                logger.warning(f"Object {object_uid} does not support mock.set_write_permissions")
-        
-        if 'mock_admin' in permissions:
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'set_admin_permissions'):
-                target_obj.mock.set_admin_permissions(permissions['mock_admin'])
-                updated_fields.append('mock_admin')
-            else:
-                logger.warning(f"Object {object_uid} does not support mock.set_admin_permissions")
-        
-        # Update private permissions
-        if 'private_read' in permissions:
-            if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'set_read_permissions'):
-                target_obj.private.set_read_permissions(permissions['private_read'])
-                updated_fields.append('private_read')
-            else:
-                logger.warning(f"Object {object_uid} does not support private.set_read_permissions")
-                
-        if 'private_write' in permissions:
-            if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'set_write_permissions'):
-                target_obj.private.set_write_permissions(permissions['private_write'])
-                updated_fields.append('private_write')
-            else:
-                logger.warning(f"Object {object_uid} does not support private.set_write_permissions")
+        # Lazy so the object's __dict__ is only walked when debug logging is on
+        logger.opt(lazy=True).debug("Current permissions: {}", lambda: target_obj.__dict__)
+        logger.debug("New permissions: {}", permissions)
         
-        if 'private_admin' in permissions:
-            if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'set_admin_permissions'):
-                target_obj.private.set_admin_permissions(permissions['private_admin'])
-                updated_fields.append('private_admin')
-            else:
-                logger.warning(f"Object {object_uid} does not support private.set_admin_permissions")
+        # Apply all changes in one call so each file's permissions are written once
+        if hasattr(target_obj, 'apply_permissions'):
+            updated_fields = target_obj.apply_permissions(permissions)
+        else:
+            updated_fields = []
+            logger.warning(f"Object {object_uid} does not support apply_permissions")
         
-        logger.info(f"Updated fields: {updated_fields}")
+        logger.debug("Updated fields: {}", updated_fields)
         
-        # The setter methods handle syncing to disk automatically
-        logger.info("Permissions updated and synced to disk via setter methods")
+        logger.info("Permissions updated and synced to disk")
         
         # Refresh the collection to reflect changes
+        _META_CACHE.pop(object_uid, None)
         objects.refresh()
         logger.info("Objects collection refreshed")
         
@@ -1121,6 +1185,65 @@ async def update_object_permissions(
         logger.error(f"Error updating permissions for object {object_uid}: {e}")
         raise HTTPException(status_code=500, detail=f"Error updating permissions: {str(e)}")
 
+def _scan_queue_jobs(queue_dir: PathLib, status_dir: str, job_uid: str) -> Optional[PathLib]:
+    """Find a job directory under <queue_dir>/*/jobs/<status_dir> whose name contains job_uid.
+
+    Uses os.scandir so entries are matched on their names and d_type, and only
+    the matching entry is turned into a Path.
+    """
+    try:
+        with os.scandir(queue_dir) as it:
+            queues = [entry.path for entry in it if entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return None
+
+    for queue in queues:
+        try:
+            with os.scandir(os.path.join(queue, "jobs", status_dir)) as it:
+                for entry in it:
+                    if job_uid in entry.name and entry.is_dir(follow_symlinks=False):
+                        return PathLib(entry.path)
+        except OSError:
+            continue
+    return None
+
+
+def _find_syft_queue_job_dir(job_uid: str, status_dirs: List[str]) -> Optional[PathLib]:
+    """Search every syft-queue for a job directory with this UID, in status_dirs order."""
+    # Common syft-queue base paths
+    potential_bases = [
+        _SYFTBOX_DATASITES,
+        PathLib("/tmp"),  # fallback
+    ]
+
+    for base in potential_bases:
+        if not base.exists():
+            continue
+        for queue_dir in base.rglob("**/syft-queues"):
+            for status_dir in status_dirs:
+                job_dir = _scan_queue_jobs(queue_dir, status_dir, job_uid)
+                if job_dir:
+                    return job_dir
+    return None
+
+
+def _remove_path(path_str: str) -> Optional[str]:
+    """Remove a file or directory without checking first that it exists.
+
+    Returns "file" or "directory" for what was removed, or None if nothing was there.
+    """
+    try:
+        os.unlink(path_str)
+        return "file"
+    except FileNotFoundError:
+        return None
+    except (IsADirectoryError, PermissionError):
+        # unlink() on a directory fails with EISDIR on Linux but EPERM on macOS
+        if not os.path.isdir(path_str):
+            raise
+    shutil.rmtree(path_str)
+    return "directory"
+
 @app.delete("/api/objects/{object_uid}")
 async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, Any]:
     """Delete a syft object by UID."""
@@ -1129,13 +1252,7 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
     
     try:
         # Find the object by UID
-        target_obj = None
-        for obj in objects:
-            # Handle both CleanSyftObject and raw SyftObject
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
@@ -1150,24 +1267,15 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
             except:
                 pass
         
-        # Get owner email using CleanSyftObject's get_owner method
-        owner_email = target_obj.get_owner() if hasattr(target_obj, 'get_owner') else 'unknown'
-        
-        # If we still don't have owner email, try to get it from raw object
-        if owner_email == 'unknown' and hasattr(target_obj, '_CleanSyftObject__obj'):
-            raw_obj = target_obj._CleanSyftObject__obj
-            if hasattr(raw_obj, 'get_owner_email'):
-                owner_email = raw_obj.get_owner_email()
-        elif owner_email == 'unknown' and hasattr(target_obj, 'get_owner_email'):
-            owner_email = target_obj.get_owner_email()
+        # Owner email is normalized and interned when the index is built
+        owner_email, normalized_owner_email = _owner_emails(target_obj)
         
-        # Simple permission check: normalize emails and compare directly
-        normalized_user_email = user_email.lower().strip() if user_email else None
-        normalized_owner_email = owner_email.lower().strip() if owner_email and owner_email != 'unknown' else None
+        # Simple permission check: both sides are interned, so identity is equality
+        normalized_user_email = _normalize_email(user_email)
         
         # User can delete if they are the owner
-        can_delete = (normalized_user_email and normalized_owner_email and 
-                     normalized_user_email == normalized_owner_email)
+        can_delete = (normalized_user_email is not None and
+                     normalized_user_email is normalized_owner_email)
         
         if not can_delete:
             logger.warning(f"User {user_email or 'unknown'} attempted to delete object {object_uid} owned by {owner_email} - DENIED")
@@ -1183,8 +1291,9 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
             try:
                 result = target_obj.delete_obj(user_email)
                 if result:
-                    # Refresh the objects collection to reflect the deletion
-                    objects.refresh()
+                    # Drop the deleted object from the collection
+                    _META_CACHE.pop(object_uid, None)
+                    objects.invalidate(object_uid)
                     return {
                         "message": f"Syft object {object_uid} deleted successfully",
                         "deleted_files": ["object deleted via delete_obj method"],
@@ -1224,30 +1333,9 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                 metadata = target_obj.get_metadata() if hasattr(target_obj, 'get_metadata') else getattr(raw_obj, 'metadata', {})
                 if not folder_path and metadata and metadata.get('type') == 'SyftBox Job':
                     job_uid = target_obj.get_uid() if hasattr(target_obj, 'get_uid') else str(raw_obj.uid)
-                    
-                    # Common syft-queue base paths
-                    potential_bases = [
-                        PathLib.home() / "SyftBox" / "datasites",
-                        PathLib("/tmp"),  # fallback
-                    ]
-                    
-                    for base in potential_bases:
-                        if base.exists():
-                            # Search for job directories with this UID across all status folders
-                            for queue_dir in base.rglob("**/syft-queues"):
-                                for status_dir in ["inbox", "running", "completed", "failed"]:
-                                    status_path = queue_dir / f"*_queue" / "jobs" / status_dir
-                                    for job_dir in status_path.parent.glob(f"jobs/{status_dir}/*"):
-                                        if job_dir.is_dir() and job_uid in job_dir.name:
-                                            folder_path = job_dir
-                                            logger.info(f"Found syft-queue job folder: {folder_path}")
-                                            break
-                                    if folder_path:
-                                        break
-                                if folder_path:
-                                    break
-                        if folder_path:
-                            break
+                    folder_path = _find_syft_queue_job_dir(job_uid, ["inbox", "running", "completed", "failed"])
+                    if folder_path:
+                        logger.info(f"Found syft-queue job folder: {folder_path}")
                 
                 # Strategy 3: Check folder paths in metadata with validation
                 if not folder_path and metadata:
@@ -1256,8 +1344,9 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                         metadata_path = PathLib(folder_paths['private'])
                         logger.info(f"Found folder path via metadata: {metadata_path}")
                         
-                        # Check if the metadata path actually exists
-                        if metadata_path.exists() and metadata_path.is_dir():
+                        # Check if the metadata path actually exists - is_dir() is
+                        # False for a missing path, so one stat covers both checks
+                        if metadata_path.is_dir():
                             folder_path = metadata_path
                             logger.info(f"Metadata path exists and is valid")
                         else:
@@ -1266,27 +1355,10 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                             
                             # The metadata path is stale - search for the job in current location
                             job_uid = str(target_obj.uid)
-                            potential_bases = [
-                                PathLib.home() / "SyftBox" / "datasites",
-                                PathLib("/tmp"),  # fallback
-                            ]
-                            
-                            for base in potential_bases:
-                                if base.exists():
-                                    # Search for job directories with this UID across all status folders
-                                    for queue_dir in base.rglob("**/syft-queues"):
-                                        for status_dir in ["running", "completed", "failed", "inbox"]:  # prioritize current status
-                                            for job_dir in queue_dir.rglob(f"*/jobs/{status_dir}/*{job_uid}*"):
-                                                if job_dir.is_dir():
-                                                    folder_path = job_dir
-                                                    logger.info(f"Found job in {status_dir} folder: {folder_path}")
-                                                    break
-                                            if folder_path:
-                                                break
-                                        if folder_path:
-                                            break
-                                if folder_path:
-                                    break
+                            # Prioritize the statuses a job is most likely to have moved to
+                            folder_path = _find_syft_queue_job_dir(job_uid, ["running", "completed", "failed", "inbox"])
+                            if folder_path:
+                                logger.info(f"Found job in {folder_path.parent.name} folder: {folder_path}")
                 
                 # Fallback to private_path if it's a directory
                 private_path_str = None
@@ -1299,13 +1371,22 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                     
                 if not folder_path and private_path_str:
                     private_path = PathLib(private_path_str)
-                    if private_path.exists() and private_path.is_dir():
+                    if private_path.is_dir():
                         folder_path = private_path
                         logger.info(f"Found folder path via private_path: {folder_path}")
                 
-                if folder_path and folder_path.exists() and folder_path.is_dir():
-                    import shutil
-                    shutil.rmtree(str(folder_path))
+                # One stat answers both "exists" and "is a directory"
+                folder_stat = None
+                if folder_path:
+                    try:
+                        folder_stat = os.stat(folder_path)
+                    except FileNotFoundError:
+                        pass
+                
+                if folder_stat is not None and stat.S_ISDIR(folder_stat.st_mode):
+                    # shutil.rmtree already walks with dir-fd relative unlinkat on
+                    # Linux; run it off the event loop so large folders don't stall it
+                    await asyncio.to_thread(shutil.rmtree, str(folder_path))
                     deleted_files.append("folder_directory")
                     logger.info(f"Deleted folder directory: {folder_path}")
                 else:
@@ -1323,8 +1404,8 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                     logger.warning(f"   metadata: {getattr(target_obj, 'metadata', {})}")
                     if folder_path:
                         logger.warning(f"   folder_path found but invalid: {folder_path}")
-                        logger.warning(f"   exists: {folder_path.exists()}")
-                        logger.warning(f"   is_dir: {folder_path.is_dir() if folder_path.exists() else 'N/A'}")
+                        logger.warning(f"   exists: {folder_stat is not None}")
+                        logger.warning(f"   is_dir: {stat.S_ISDIR(folder_stat.st_mode) if folder_stat is not None else 'N/A'}")
                     is_folder = False
             except Exception as e:
                 logger.warning(f"Failed to delete folder directory: {e}")
@@ -1333,7 +1414,6 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
         
         # Delete individual files (for non-folder objects or fallback)
         if not is_folder:
-            # Delete private file if it exists
             private_path_str = None
             if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path'):
                 private_path_str = target_obj.private.get_path()
@@ -1341,21 +1421,7 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                 private_path_str = target_obj._CleanSyftObject__obj.private_path
             elif hasattr(target_obj, 'private_path'):
                 private_path_str = target_obj.private_path
-                
-            if private_path_str and PathLib(private_path_str).exists():
-                try:
-                    private_path = PathLib(private_path_str)
-                    if private_path.is_file():
-                        private_path.unlink()
-                        deleted_files.append("private")
-                    elif private_path.is_dir():
-                        import shutil
-                        shutil.rmtree(str(private_path))
-                        deleted_files.append("private_directory")
-                except Exception as e:
-                    logger.warning(f"Failed to delete private file/directory: {e}")
             
-            # Delete mock file if it exists
             mock_path_str = None
             if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_path'):
                 mock_path_str = target_obj.mock.get_path()
@@ -1363,21 +1429,7 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                 mock_path_str = target_obj._CleanSyftObject__obj.mock_path
             elif hasattr(target_obj, 'mock_path'):
                 mock_path_str = target_obj.mock_path
-                
-            if mock_path_str and PathLib(mock_path_str).exists():
-                try:
-                    mock_path = PathLib(mock_path_str)
-                    if mock_path.is_file():
-                        mock_path.unlink()
-                        deleted_files.append("mock")
-                    elif mock_path.is_dir():
-                        import shutil
-                        shutil.rmtree(str(mock_path))
-                        deleted_files.append("mock_directory")
-                except Exception as e:
-                    logger.warning(f"Failed to delete mock file/directory: {e}")
             
-            # Delete syftobject file if it exists
             syftobject_path_str = None
             if hasattr(target_obj, 'syftobject_config') and hasattr(target_obj.syftobject_config, 'get_path'):
                 syftobject_path_str = target_obj.syftobject_config.get_path()
@@ -1385,16 +1437,28 @@ async def delete_object(object_uid: str, user_email: str = None) -> Dict[str, An
                 syftobject_path_str = target_obj._CleanSyftObject__obj.syftobject_path
             elif hasattr(target_obj, 'syftobject_path'):
                 syftobject_path_str = target_obj.syftobject_path
-                
-            if syftobject_path_str and PathLib(syftobject_path_str).exists():
+            
+            # One pass over the candidates: unlink directly and treat a missing
+            # path as already deleted, rather than stat-ing each one first
+            candidates = [(name, path_str) for name, path_str in (
+                ("private", private_path_str),
+                ("mock", mock_path_str),
+                ("syftobject", syftobject_path_str),
+            ) if path_str]
+            for name, path_str in candidates:
                 try:
-                    PathLib(syftobject_path_str).unlink()
-                    deleted_files.append("syftobject")
+                    removed = _remove_path(path_str)
                 except Exception as e:
-                    logger.warning(f"Failed to delete syftobject file: {e}")
+                    logger.warning(f"Failed to delete {name} file/directory: {e}")
+                    continue
+                if removed == "file":
+                    deleted_files.append(name)
+                elif removed == "directory":
+                    deleted_files.append(f"{name}_directory")
         
-        # Refresh the objects collection to reflect the deletion
-        objects.refresh()
+        # Drop the deleted object from the collection
+        _META_CACHE.pop(object_uid, None)
+        objects.invalidate(object_uid)
         
         object_type = "folder" if is_folder else "file"
         return {
@@ -1419,12 +1483,7 @@ async def view_single_object(object_uid: str) -> HTMLResponse:
     
     try:
         # Find the object by UID
-        target_obj = None
-        for obj in objects:
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             return HTMLResponse(content=f"<div>Object {object_uid} not found</div>", status_code=404)
@@ -1437,7 +1496,121 @@ async def view_single_object(object_uid: str) -> HTMLResponse:
         logger.error(f"Error generating viewer for object {object_uid}: {e}")
         return HTMLResponse(content=f"<div>Error: {str(e)}</div>", status_code=500)
 
-@app.get("/api/object/{object_uid}/metadata")
+# Capabilities of each object/accessor type, resolved once per class. Methods are
+# looked up on the class so the cache holds plain functions called as f(obj).
+_CAP_NAMES = (
+    'get_uid', 'get_name', 'get_description', 'get_created_at', 'get_updated_at',
+    'get_file_type', 'get_metadata', 'get_discovery_permissions', 'get_urls',
+    'get_owner', 'get_info', 'set_name', 'set_description', 'set_metadata',
+    'get_read_permissions', 'get_write_permissions', 'get_admin_permissions',
+    'get_path', 'get_note', 'set_note',
+)
+_CAPS: Dict[type, Dict[str, Any]] = {}
+
+
+def _caps(obj) -> Dict[str, Any]:
+    """Return {method name: function or None} for the type of obj."""
+    cls = type(obj)
+    caps = _CAPS.get(cls)
+    if caps is None:
+        caps = {}
+        for name in _CAP_NAMES:
+            func = getattr(cls, name, None)
+            caps[name] = func if callable(func) else None
+        _CAPS[cls] = caps
+    return caps
+
+# Sentinel for dict lookups where None is a legitimate stored value
+_MISSING = object()
+
+
+def _build_object_metadata(target_obj) -> Dict[str, Any]:
+    """Collect the full metadata snapshot served for a single object."""
+    # Extract all metadata using the getters the object's type provides
+    caps = _caps(target_obj)
+    mock = getattr(target_obj, 'mock', None)
+    private = getattr(target_obj, 'private', None)
+    config = getattr(target_obj, 'syftobject_config', None)
+    mock_caps, private_caps, config_caps = _caps(mock), _caps(private), _caps(config)
+
+    created_at = caps['get_created_at'](target_obj) if caps['get_created_at'] else None
+    created_at = created_at or getattr(target_obj, 'created_at', None)
+    updated_at = caps['get_updated_at'](target_obj) if caps['get_updated_at'] else None
+    updated_at = updated_at or getattr(target_obj, 'updated_at', None)
+
+    metadata = {
+        "uid": caps['get_uid'](target_obj) if caps['get_uid'] else str(target_obj.uid),
+        "name": caps['get_name'](target_obj) if caps['get_name'] else target_obj.name,
+        "description": caps['get_description'](target_obj) if caps['get_description'] else target_obj.description,
+        # datetimes are serialized natively by the response encoder
+        "created_at": created_at or None,
+        "updated_at": updated_at or None,
+        "file_type": caps['get_file_type'](target_obj) if caps['get_file_type'] else getattr(target_obj, 'file_type', None),
+        "is_folder": (target_obj.type == "folder" if hasattr(target_obj, 'type') else getattr(target_obj, 'is_folder', False)),
+        "metadata": caps['get_metadata'](target_obj) if caps['get_metadata'] else getattr(target_obj, 'metadata', {}),
+        "permissions": {
+            "discovery_permissions": caps['get_discovery_permissions'](target_obj) if caps['get_discovery_permissions'] else [],
+            "mock_permissions": {
+                "read": mock_caps['get_read_permissions'](mock) if mock_caps['get_read_permissions'] else [],
+                "write": mock_caps['get_write_permissions'](mock) if mock_caps['get_write_permissions'] else [],
+                "admin": mock_caps['get_admin_permissions'](mock) if mock_caps['get_admin_permissions'] else []
+            },
+            "private_permissions": {
+                "read": private_caps['get_read_permissions'](private) if private_caps['get_read_permissions'] else [],
+                "write": private_caps['get_write_permissions'](private) if private_caps['get_write_permissions'] else [],
+                "admin": private_caps['get_admin_permissions'](private) if private_caps['get_admin_permissions'] else []
+            }
+        },
+        "urls": caps['get_urls'](target_obj) if caps['get_urls'] else {
+            "private": getattr(target_obj, 'private_url', None),
+            "mock": getattr(target_obj, 'mock_url', None),
+            "syftobject": getattr(target_obj, 'syftobject', None)
+        },
+        "paths": {
+            "private": private_caps['get_path'](private) if private_caps['get_path'] else getattr(target_obj, 'private_path', None),
+            "mock": mock_caps['get_path'](mock) if mock_caps['get_path'] else getattr(target_obj, 'mock_path', None),
+            "syftobject": config_caps['get_path'](config) if config_caps['get_path'] else getattr(target_obj, 'syftobject_path', None)
+        }
+    }
+
+    if caps['get_owner']:
+        metadata["owner_email"] = caps['get_owner'](target_obj)
+    elif caps['get_info']:
+        md = caps['get_info'](target_obj)["metadata"]
+        metadata["owner_email"] = md.get("owner_email", md.get("email", "unknown"))
+    else:
+        md = getattr(target_obj, 'metadata', None) or {}
+        metadata["owner_email"] = md.get("owner_email", md.get("email", "unknown"))
+
+    # Add mock note if available
+    if mock_caps['get_note']:
+        metadata["mock_note"] = mock_caps['get_note'](mock)
+    else:
+        mock_note = metadata["metadata"].get("mock_note", _MISSING)
+        if mock_note is not _MISSING:
+            metadata["mock_note"] = mock_note
+
+    return metadata
+
+# Metadata snapshots by UID: (object, updated_at, permission stamp, cached_at, metadata).
+# A snapshot is reused while the collection still holds the same object, its
+# updated_at is unchanged and the permission files beside its files are untouched.
+# Permission edits don't bump updated_at, and rules inherited from further up the
+# tree aren't stamped, so snapshots also expire after a few seconds.
+_META_CACHE: Dict[str, tuple] = {}
+_META_CACHE_TTL = 5.0
+
+def _permission_stamp(paths: Dict[str, Any]) -> tuple:
+    """mtime_ns of the syft.pub.yaml next to each of an object's files, None where absent."""
+    stamp = []
+    for folder in dict.fromkeys(os.path.dirname(str(path)) for path in paths.values() if path):
+        try:
+            stamp.append(os.stat(os.path.join(folder, "syft.pub.yaml")).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+@app.get("/api/object/{object_uid}/metadata", response_class=ORJSONResponse)
 async def get_object_metadata(object_uid: str) -> Dict[str, Any]:
     """Get all metadata for a single object."""
     if objects is None:
@@ -1445,68 +1618,25 @@ async def get_object_metadata(object_uid: str) -> Dict[str, Any]:
     
     try:
         # Find the object
-        target_obj = None
-        for obj in objects:
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
         
-        # Extract all metadata using CleanSyftObject getters
-        metadata = {
-            "uid": target_obj.get_uid() if hasattr(target_obj, 'get_uid') else str(target_obj.uid),
-            "name": target_obj.get_name() if hasattr(target_obj, 'get_name') else target_obj.name,
-            "description": target_obj.get_description() if hasattr(target_obj, 'get_description') else target_obj.description,
-            "created_at": (lambda: (
-                target_obj.get_created_at().isoformat() if hasattr(target_obj, 'get_created_at') and target_obj.get_created_at() else
-                target_obj.created_at.isoformat() if hasattr(target_obj, 'created_at') and target_obj.created_at else None
-            ))(),
-            "updated_at": (lambda: (
-                target_obj.get_updated_at().isoformat() if hasattr(target_obj, 'get_updated_at') and target_obj.get_updated_at() else
-                target_obj.updated_at.isoformat() if hasattr(target_obj, 'updated_at') and target_obj.updated_at else None
-            ))(),
-            "file_type": target_obj.get_file_type() if hasattr(target_obj, 'get_file_type') else getattr(target_obj, 'file_type', None),
-            "is_folder": (target_obj.type == "folder" if hasattr(target_obj, 'type') else getattr(target_obj, 'is_folder', False)),
-            "metadata": target_obj.get_metadata() if hasattr(target_obj, 'get_metadata') else getattr(target_obj, 'metadata', {}),
-            "permissions": (lambda: {
-                "discovery_permissions": target_obj.get_discovery_permissions() if hasattr(target_obj, 'get_discovery_permissions') else [],
-                "mock_permissions": {
-                    "read": target_obj.mock.get_read_permissions() if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_read_permissions') else [],
-                    "write": target_obj.mock.get_write_permissions() if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_write_permissions') else [],
-                    "admin": target_obj.mock.get_admin_permissions() if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_admin_permissions') else []
-                },
-                "private_permissions": {
-                    "read": target_obj.private.get_read_permissions() if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_read_permissions') else [],
-                    "write": target_obj.private.get_write_permissions() if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_write_permissions') else [],
-                    "admin": target_obj.private.get_admin_permissions() if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_admin_permissions') else []
-                }
-            })(),
-            "urls": target_obj.get_urls() if hasattr(target_obj, 'get_urls') else {
-                "private": getattr(target_obj, 'private_url', None),
-                "mock": getattr(target_obj, 'mock_url', None),
-                "syftobject": getattr(target_obj, 'syftobject', None)
-            },
-            "paths": {
-                "private": target_obj.private.get_path() if hasattr(target_obj, 'private') and hasattr(target_obj.private, 'get_path') else getattr(target_obj, 'private_path', None),
-                "mock": target_obj.mock.get_path() if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_path') else getattr(target_obj, 'mock_path', None),
-                "syftobject": target_obj.syftobject_config.get_path() if hasattr(target_obj, 'syftobject_config') and hasattr(target_obj.syftobject_config, 'get_path') else getattr(target_obj, 'syftobject_path', None)
-            },
-            "owner_email": (
-                target_obj.get_owner() if hasattr(target_obj, 'get_owner') else 
-                target_obj.get_info()["metadata"].get("owner_email", target_obj.get_info()["metadata"].get("email", "unknown")) if hasattr(target_obj, 'get_info') else 
-                getattr(target_obj, 'metadata', {}).get("owner_email", getattr(target_obj, 'metadata', {}).get("email", "unknown"))
-            )
-        }
+        caps = _caps(target_obj)
+        updated_at = caps['get_updated_at'](target_obj) if caps['get_updated_at'] else None
+        updated_at = updated_at or getattr(target_obj, 'updated_at', None)
         
-        # Add mock note if available
-        if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'get_note'):
-            metadata["mock_note"] = target_obj.mock.get_note()
-        elif "mock_note" in metadata["metadata"]:
-            metadata["mock_note"] = metadata["metadata"]["mock_note"]
+        now = time.monotonic()
+        cached = _META_CACHE.get(object_uid)
+        if (cached is not None and cached[0] is target_obj and cached[1] == updated_at
+                and now - cached[3] < _META_CACHE_TTL
+                and _permission_stamp(cached[4]["paths"]) == cached[2]):
+            return cached[4]
         
+        # The getters read permission files from disk, so keep them off the event loop
+        metadata = await asyncio.to_thread(_build_object_metadata, target_obj)
+        _META_CACHE[object_uid] = (target_obj, updated_at, _permission_stamp(metadata["paths"]), now, metadata)
         return metadata
     
     except HTTPException:
@@ -1526,12 +1656,7 @@ async def update_object_metadata(
     
     try:
         # Find the object
-        target_obj = None
-        for obj in objects:
-            obj_uid = obj.get_uid() if hasattr(obj, 'get_uid') else str(obj.uid)
-            if obj_uid == object_uid:
-                target_obj = obj
-                break
+        target_obj = _get_by_uid(object_uid)
         
         if not target_obj:
             raise HTTPException(status_code=404, detail="Object not found")
@@ -1539,42 +1664,45 @@ async def update_object_metadata(
         # Update fields based on what's provided
         updated_fields = []
         
+        caps = _caps(target_obj)
+        raw_obj = getattr(target_obj, '_CleanSyftObject__obj', target_obj)
+        
         if "name" in updates:
-            if hasattr(target_obj, 'set_name'):
-                target_obj.set_name(updates["name"])
+            if caps['set_name']:
+                caps['set_name'](target_obj, updates["name"])
             else:
                 target_obj.name = updates["name"]
             updated_fields.append("name")
         
         if "description" in updates:
-            if hasattr(target_obj, 'set_description'):
-                target_obj.set_description(updates["description"])
+            if caps['set_description']:
+                caps['set_description'](target_obj, updates["description"])
             else:
                 target_obj.description = updates["description"]
             updated_fields.append("description")
         
         if "metadata" in updates:
-            if hasattr(target_obj, 'set_metadata'):
+            if caps['set_metadata']:
                 # Get current metadata and merge with updates
-                current_metadata = target_obj.get_metadata() if hasattr(target_obj, 'get_metadata') else {}
+                current_metadata = caps['get_metadata'](target_obj) if caps['get_metadata'] else {}
                 current_metadata.update(updates["metadata"])
-                target_obj.set_metadata(current_metadata)
+                caps['set_metadata'](target_obj, current_metadata)
             else:
                 target_obj.metadata.update(updates["metadata"])
             updated_fields.append("metadata")
         
         if "mock_note" in updates:
-            if hasattr(target_obj, 'mock') and hasattr(target_obj.mock, 'set_note'):
-                target_obj.mock.set_note(updates["mock_note"])
+            mock = getattr(target_obj, 'mock', None)
+            mock_caps = _caps(mock)
+            if mock_caps['set_note']:
+                mock_caps['set_note'](mock, updates["mock_note"])
             else:
-                # Get raw object and update metadata
-                raw_obj = target_obj._CleanSyftObject__obj if hasattr(target_obj, '_CleanSyftObject__obj') else target_obj
+                # Update the raw object's metadata
                 raw_obj.metadata["mock_note"] = updates["mock_note"]
             updated_fields.append("mock_note")
         
         # Update timestamp
         from syft_objects.models import utcnow
-        raw_obj = target_obj._CleanSyftObject__obj if hasattr(target_obj, '_CleanSyftObject__obj') else target_obj
         raw_obj.updated_at = utcnow()
         
         # Explicitly sync to disk - direct attribute updates bypass automatic sync
@@ -1582,8 +1710,9 @@ async def update_object_metadata(
             raw_obj._sync_to_disk()
             logger.info("Metadata synced to disk via _sync_to_disk()")
         
-        # Refresh objects collection
-        objects.refresh()
+        # Re-read just this object rather than reloading the collection
+        _META_CACHE.pop(object_uid, None)
+        objects.invalidate(object_uid)
         
         return {
             "message": "Metadata updated successfully",
@@ -1601,51 +1730,73 @@ async def update_object_metadata(
 # Filesystem Editor endpoints
 filesystem_manager = FileSystemManager()
 
+# SyftBox client used by the filesystem endpoints. Loaded on first use and kept
+# once found, so requests don't re-read the client config each time.
+_SYFTBOX_CLIENT = None
+
+
+def _user_email() -> Optional[str]:
+    """Return the current SyftBox user's email, or None if no client is configured."""
+    global _SYFTBOX_CLIENT
+    if _SYFTBOX_CLIENT is None and get_syftbox_client is not None:
+        try:
+            _SYFTBOX_CLIENT = get_syftbox_client()
+        except Exception:
+            pass
+    return getattr(_SYFTBOX_CLIENT, 'email', None)
+
 @app.get("/editor", response_class=HTMLResponse)
-async def editor_page(path: Optional[str] = Query(None)):
+async def editor_page(request: Request, path: Optional[str] = Query(None)):
     """Serve the filesystem editor HTML page."""
-    initial_path = path if path else str(PathLib.home())
-    return HTMLResponse(content=generate_editor_html(initial_path))
+    initial_path = path if path else _HOME_STR
+    # The page is assembled pre-compressed; GZipMiddleware passes encoded bodies through
+    if 'gzip' in request.headers.get('accept-encoding', ''):
+        return HTMLResponse(
+            content=generate_editor_page_gzip(initial_path),
+            headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'},
+        )
+    return HTMLResponse(content=generate_editor_page(initial_path), headers={'Vary': 'Accept-Encoding'})
 
-@app.get("/api/filesystem/list")
-async def list_directory(path: str = Query(...)):
-    """List directory contents."""
-    return filesystem_manager.list_directory(path)
+# The listing and read endpoints hand back ORJSONResponse themselves: the
+# manager already returns plain JSON types, so FastAPI's jsonable_encoder
+# pass over every item would be wasted work on large directories and files.
+@app.get("/api/filesystem/list", response_class=ORJSONResponse)
+async def list_directory(path: str = Query(...), columns: bool = Query(False)):
+    """List directory contents, optionally as parallel columns."""
+    if columns:
+        return ORJSONResponse(filesystem_manager.list_directory_columns(path))
+    return ORJSONResponse(filesystem_manager.list_directory(path))
+
+@app.post("/api/filesystem/metadata-batch", response_class=ORJSONResponse)
+async def metadata_batch(paths: List[str] = Body(..., embed=True)):
+    """Return listing metadata for several paths in one request."""
+    return ORJSONResponse(filesystem_manager.stat_paths(paths))
+
+@app.get("/api/filesystem/list-stream")
+async def list_directory_stream(path: str = Query(...)):
+    """List directory contents, streaming items as they are read."""
+    return StreamingResponse(filesystem_manager.list_directory_stream(path), media_type="application/json")
 
 @app.get("/api/filesystem/check-permissions")
 async def check_file_permissions(path: str = Query(...)):
     """Check file permissions for the current user."""
     # Get user email from SyftBox client
-    user_email = None
-    try:
-        import sys
-        sys.path.insert(0, '../src')
-        from syft_objects.client import get_syftbox_client
-        syftbox_client = get_syftbox_client()
-        if syftbox_client and hasattr(syftbox_client, 'email'):
-            user_email = syftbox_client.email
-    except:
-        pass
+    user_email = _user_email()
     
     # This endpoint should check permissions from the SOURCE of truth
     # For now, return basic info
-    from pathlib import Path
-    file_path = Path(path).resolve()
+    file_path = PathLib(path).resolve()
     
     # Extract datasite owner from path if it's a SyftBox file
-    syftbox_path = Path.home() / "SyftBox"
-    is_syftbox_file = str(file_path).startswith(str(syftbox_path))
+    is_syftbox_file = str(file_path).startswith(_SYFTBOX_ROOT_STR)
     datasite_owner = None
     
     if is_syftbox_file:
         try:
-            path_parts = str(file_path).split('/')
-            if 'datasites' in path_parts:
-                ds_idx = path_parts.index('datasites')
-                if len(path_parts) > ds_idx + 1:
-                    datasite_owner = path_parts[ds_idx + 1]
-        except:
-            pass
+            rel = file_path.relative_to(_SYFTBOX_DATASITES)
+            datasite_owner = rel.parts[0] if rel.parts else None
+        except ValueError:
+            datasite_owner = None
     
     # For now, assume write access only if user owns the datasite
     # This is a simplified check - in reality we'd need to check the actual permissions
@@ -1666,24 +1817,20 @@ async def check_file_permissions(path: str = Query(...)):
         "current_user": user_email
     }
 
-@app.get("/api/filesystem/read")
-async def read_file(path: str = Query(...)):
-    """Read file contents."""
+@app.get("/api/filesystem/read", response_class=ORJSONResponse)
+async def read_file(path: str = Query(...), content: bool = Query(True)):
+    """Read file contents, or only its metadata when content=false."""
     # Get user email from SyftBox client
-    user_email = None
-    try:
-        import sys
-        sys.path.insert(0, '../src')
-        from syft_objects.client import get_syftbox_client
-        syftbox_client = get_syftbox_client()
-        if syftbox_client and hasattr(syftbox_client, 'email'):
-            user_email = syftbox_client.email
-    except:
-        pass
+    user_email = _user_email()
     
-    return filesystem_manager.read_file(path, user_email=user_email)
+    return ORJSONResponse(filesystem_manager.read_file(path, user_email=user_email, include_content=content))
+
+@app.get("/api/filesystem/raw")
+async def read_file_raw(path: str = Query(...)):
+    """Serve raw file contents for display or download."""
+    return filesystem_manager.read_file_raw(path)
 
-@app.post("/api/filesystem/write")
+@app.post("/api/filesystem/write", response_class=ORJSONResponse)
 async def write_file(
     path: str = Body(...),
     content: str = Body(...),
@@ -1692,29 +1839,69 @@ async def write_file(
 ):
     """Write content to a file."""
     # Get user email from SyftBox client
-    user_email = None
-    try:
-        import sys
-        sys.path.insert(0, '../src')
-        from syft_objects.client import get_syftbox_client
-        syftbox_client = get_syftbox_client()
-        if syftbox_client and hasattr(syftbox_client, 'email'):
-            user_email = syftbox_client.email
-    except:
-        pass
+    user_email = _user_email()
     
     return filesystem_manager.write_file(path, content, create_dirs, user_email=user_email)
 
-@app.post("/api/filesystem/create-directory")
+@app.post("/api/filesystem/patch", response_class=ORJSONResponse)
+async def patch_file(
+    path: str = Body(...),
+    base_hash: str = Body(...),
+    ops: List[Dict[str, Any]] = Body(...),
+):
+    """Apply incremental edits to a file saved from a known base version."""
+    user_email = _user_email()
+    
+    return filesystem_manager.patch_file(path, base_hash, ops, user_email=user_email)
+
+@app.post("/api/filesystem/create-directory", response_class=ORJSONResponse)
 async def create_directory(path: str = Body(...)):
     """Create a new directory."""
     return filesystem_manager.create_directory(path)
 
-@app.delete("/api/filesystem/delete")
+@app.delete("/api/filesystem/delete", response_class=ORJSONResponse)
 async def delete_item(path: str = Query(...), recursive: bool = Query(False)):
     """Delete a file or directory."""
     return filesystem_manager.delete_item(path, recursive)
 
+# Frontend entry points, resolved once at startup. The main page is only checked
+# for at import time; rebuilding the frontend needs a server restart anyway.
+_FRONTEND_DIR = PathLib(__file__).parent.parent / "frontend"
+_MAIN_FILE = _FRONTEND_DIR / "index.html"
+_MAIN_EXISTS = _MAIN_FILE.exists()
+_WIDGET_FILE = _FRONTEND_DIR / "widget" / "index.html"
+
+# Served at / when the frontend has not been built, pre-encoded once
+_FALLBACK_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head><title>Syft Objects UI</title></head>
+        <body>
+            <h1>Syft Objects UI</h1>
+            <p>Frontend not built yet. Please run the build process.</p>
+            <p>API available at <a href="/docs">/docs</a></p>
+        </body>
+        </html>
+        """.encode("utf-8")
+
+# Widget page bytes, split just before </head> so filters can be injected by
+# concatenation. Reloaded only when the file's mtime changes.
+_WIDGET_CACHE = {"mtime": None, "head": b"", "tail": b""}
+
+
+def _widget_html(widget_file: PathLib) -> tuple:
+    """Return the cached (head, tail) bytes of the widget page, reloading on change."""
+    mtime = os.stat(widget_file).st_mtime_ns
+    if mtime != _WIDGET_CACHE["mtime"]:
+        content = widget_file.read_bytes()
+        idx = content.find(b"</head>")
+        if idx == -1:
+            head, tail = content, b""
+        else:
+            head, tail = content[:idx], content[idx:]
+        _WIDGET_CACHE.update(mtime=mtime, head=head, tail=tail)
+    return _WIDGET_CACHE["head"], _WIDGET_CACHE["tail"]
+
 # Widget endpoints to match original server exactly
 @app.get("/widget")
 async def widget_redirect():
@@ -1728,16 +1915,23 @@ async def widget_page(
     end_index: Optional[int] = Query(None, description="End index for filtering (exclusive)")
 ):
     """Serve the simple HTML widget page with optional index range filtering."""
-    widget_file = PathLib(__file__).parent.parent / "frontend" / "widget" / "index.html"
-    if widget_file.exists():
-        # Read the HTML content
-        with open(widget_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Inject index range parameters if provided
-        if start_index is not None or end_index is not None:
-            # Create JavaScript to set the filter parameters
-            filter_script = f"""
+    if start_index is None and end_index is None:
+        # Nothing to inject - stream the file as-is, reusing this stat for the headers
+        try:
+            widget_stat = os.stat(_WIDGET_FILE)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="Widget page not found")
+        return FileResponse(_WIDGET_FILE, media_type="text/html", stat_result=widget_stat)
+    
+    try:
+        head, tail = _widget_html(_WIDGET_FILE)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Widget page not found")
+    
+    # Inject index range parameters
+    if tail:
+        # Create JavaScript to set the filter parameters
+        filter_script = f"""
     <script>
         // Index range filter parameters from URL
         window.INDEX_RANGE_FILTER = {{
@@ -1746,37 +1940,19 @@ async def widget_page(
         }};
     </script>
     """
-            # Insert the script before the closing head tag
-            content = content.replace('</head>', f'{filter_script}</head>')
-        
-        return HTMLResponse(content=content)
-    else:
-        raise HTTPException(status_code=404, detail="Widget page not found")
-
-@app.get("/widget")
-async def widget_page_redirect():
-    """Redirect /widget to /widget/ for convenience."""
-    return RedirectResponse(url="/widget/", status_code=302)
+        # Insert the script before the closing head tag
+        return HTMLResponse(content=head + filter_script.encode('utf-8') + tail)
+    
+    return HTMLResponse(content=head + tail)
 
 # Serve the main page explicitly to match original server
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main Next.js page."""
-    main_file = PathLib(__file__).parent.parent / "frontend" / "index.html"
-    if main_file.exists():
-        return FileResponse(main_file, media_type="text/html")
+    if _MAIN_EXISTS:
+        return FileResponse(_MAIN_FILE, media_type="text/html")
     else:
-        return HTMLResponse(content="""
-        <!DOCTYPE html>
-        <html>
-        <head><title>Syft Objects UI</title></head>
-        <body>
-            <h1>Syft Objects UI</h1>
-            <p>Frontend not built yet. Please run the build process.</p>
-            <p>API available at <a href="/docs">/docs</a></p>
-        </body>
-        </html>
-        """)
+        return HTMLResponse(content=_FALLBACK_HTML)
 
 if __name__ == "__main__":
     import uvicorn
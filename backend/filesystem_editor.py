@@ -5,136 +5,379 @@ Completely decoupled from syft-objects functionality.
 """
 
 import os
+import sys
+import stat
+import struct
+import codecs
+import functools
+import hashlib
 import mimetypes
+import shutil
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
 
 from fastapi import HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, FileResponse
 import json
+import orjson
+
+# Load the MIME tables once at import rather than on the first listing
+mimetypes.init()
+
+# Large listings stat their entries concurrently; stat releases the GIL, so
+# round-trips on network and FUSE mounts (e.g. SyftBox) overlap. On warm local
+# disks the hand-off can cost more than it saves, so the cut-off is tunable.
+STAT_PREFETCH_THRESHOLD = int(os.getenv("SYFT_EDITOR_STAT_PREFETCH_THRESHOLD", 256))
+_STAT_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='fs-stat')
+
+
+def _prefetch_stat(entry: os.DirEntry) -> None:
+    """Warm a DirEntry's stat cache; errors resurface in the listing loop."""
+    try:
+        entry.stat()
+    except OSError:
+        pass
+
+
+# Extensions the editor treats as text; a frozenset because it never changes
+_TEXT_EXTENSIONS = frozenset(sys.intern(ext) for ext in (
+    # Text files
+    '.py', '.js', '.ts', '.jsx', '.tsx', '.html', '.css', '.scss', '.sass',
+    '.json', '.yaml', '.yml', '.xml', '.md', '.txt', '.csv', '.log',
+    '.sql', '.sh', '.bash', '.zsh', '.fish', '.ps1', '.bat', '.cmd',
+    # Config files
+    '.ini', '.cfg', '.conf', '.toml', '.env', '.gitignore', '.dockerignore',
+    # Code files
+    '.c', '.cpp', '.h', '.hpp', '.java', '.php', '.rb', '.go', '.rs', '.swift',
+    '.kt', '.scala', '.clj', '.lisp', '.hs', '.elm', '.dart', '.r', '.m', '.mm',
+    # Web files
+    '.vue', '.svelte', '.astro', '.htmx', '.mustache', '.handlebars',
+    # Data files
+    '.jsonl', '.ndjson', '.tsv', '.properties', '.lock',
+    # Documentation
+    '.rst', '.tex', '.latex', '.adoc', '.org',
+))
+
+
+# Extensions that are never editable text, including common ones the MIME tables
+# don't know (archives, pickles, databases)
+_BINARY_EXTENSIONS = frozenset(sys.intern(ext) for ext in (
+    # Documents
+    '.pdf', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx', '.odt', '.ods', '.odp',
+    # Archives
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.tar', '.7z', '.rar', '.whl', '.jar',
+    # Executables and compiled code
+    '.exe', '.dll', '.so', '.dylib', '.bin', '.o', '.a', '.class', '.pyc', '.wasm',
+    # Data
+    '.db', '.sqlite', '.sqlite3', '.pkl', '.pickle', '.npy', '.npz', '.parquet', '.h5', '.hdf5',
+    '.feather', '.arrow',
+    # Disk images
+    '.iso', '.dmg',
+))
+
+# Columnar listing flag bits for a file's suffix-only editability
+_FLAG_BY_EDITABILITY = {True: 2, False: 0, None: 4}
 
 
 class FileSystemManager:
     """Manages filesystem operations for the code editor."""
     
-    ALLOWED_EXTENSIONS = {
-        # Text files
-        '.py', '.js', '.ts', '.jsx', '.tsx', '.html', '.css', '.scss', '.sass',
-        '.json', '.yaml', '.yml', '.xml', '.md', '.txt', '.csv', '.log',
-        '.sql', '.sh', '.bash', '.zsh', '.fish', '.ps1', '.bat', '.cmd',
-        # Config files
-        '.ini', '.cfg', '.conf', '.toml', '.env', '.gitignore', '.dockerignore',
-        # Code files
-        '.c', '.cpp', '.h', '.hpp', '.java', '.php', '.rb', '.go', '.rs', '.swift',
-        '.kt', '.scala', '.clj', '.lisp', '.hs', '.elm', '.dart', '.r', '.m', '.mm',
-        # Web files
-        '.vue', '.svelte', '.astro', '.htmx', '.mustache', '.handlebars',
-        # Data files
-        '.jsonl', '.ndjson', '.tsv', '.properties', '.lock',
-        # Documentation
-        '.rst', '.tex', '.latex', '.adoc', '.org',
-    }
+    ALLOWED_EXTENSIONS = _TEXT_EXTENSIONS
     
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB limit
+    LIST_CACHE_SIZE = 256  # directories kept in the listing cache
+    LIST_CACHE_TTL = 2.0  # seconds a cached listing stays valid
+    STREAM_BATCH_SIZE = 256  # entries per chunk of a streamed listing
     
-    def __init__(self, base_path: str = None):
+    def __init__(self, base_path: Optional[str] = None) -> None:
         """Initialize with optional base path restriction."""
         self.base_path = Path(base_path).resolve() if base_path else None
+        # Containment is a string test against "<base>/", which can't match /base-other
+        self._base_str = str(self.base_path) if base_path else None
+        self._base_prefix = os.path.join(self._base_str, '') if base_path else None
+        # path -> (cached_at, directory mtime, listing[, columnar listing])
+        self._list_cache: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def _invalidate_listing(self, *paths: Path) -> None:
+        """Drop cached listings for directories whose contents just changed."""
+        for path in paths:
+            self._list_cache.pop(str(path), None)
     
     def _validate_path(self, path: str) -> Path:
         """Validate and resolve a path, ensuring it's within allowed bounds."""
         try:
-            resolved_path = Path(path).resolve()
-            
-            # If we have a base path, ensure the resolved path is within it
-            if self.base_path and not str(resolved_path).startswith(str(self.base_path)):
-                raise HTTPException(status_code=403, detail="Access denied: Path outside allowed directory")
-            
-            return resolved_path
+            # Path.resolve() wraps realpath; calling it directly skips building
+            # the intermediate Path and lets the check below run on the string
+            resolved_str = os.path.realpath(path)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"Invalid path: {str(e)}")
+        
+        # If we have a base path, ensure the resolved path is within it
+        if self._base_str and resolved_str != self._base_str and not resolved_str.startswith(self._base_prefix):
+            raise HTTPException(status_code=403, detail="Access denied: Path outside allowed directory")
+        
+        return Path(resolved_str)
     
-    def _is_text_file(self, file_path: Path) -> bool:
-        """Check if a file is a text file that can be edited."""
-        if file_path.suffix.lower() in self.ALLOWED_EXTENSIONS:
-            return True
+    def _is_text_file(self, file_path: Union[Path, str], suffix: Optional[str] = None,
+                      file_stat: Optional[os.stat_result] = None) -> bool:
+        """Check if a file is a text file that can be edited.
         
-        # Check MIME type
-        mime_type, _ = mimetypes.guess_type(str(file_path))
-        if mime_type and mime_type.startswith('text/'):
+        Callers that already know the lowercased suffix can pass it (with a
+        plain string path) to skip building a Path. Passing the file's stat
+        lets the content sniff be answered from cache while the file is unchanged.
+        """
+        if suffix is None:
+            suffix = file_path.suffix.lower()
+        # A plain frozenset probe is cheaper than the lru_cache call, so known
+        # extensions skip the MIME lookup cache entirely
+        if suffix in self.ALLOWED_EXTENSIONS or _suffix_is_text(suffix):
             return True
         
-        # Try to read a small portion to detect if it's text
-        try:
-            with open(file_path, 'rb') as f:
-                chunk = f.read(1024)
-                return chunk.decode('utf-8', errors='strict') is not None
-        except (UnicodeDecodeError, PermissionError):
-            return False
+        if file_stat is not None:
+            return _cached_sniff_is_text(str(file_path), file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+        return _sniff_is_text(file_path)
     
-    def list_directory(self, path: str) -> Dict[str, Any]:
-        """List directory contents."""
+    def _is_editable_fast(self, suffix: str) -> Optional[bool]:
+        """Judge editability from the suffix alone, without touching the file.
+        
+        True for text suffixes, False for media types that are never text, and
+        None when only the content can tell; read_file sniffs those on open.
+        """
+        if suffix in self.ALLOWED_EXTENSIONS:
+            return True
+        return _suffix_editability(suffix)
+    
+    def _stat_directory(self, path: str) -> Tuple[Path, os.stat_result]:
+        """Validate a directory path and return it with its stat."""
         dir_path = self._validate_path(path)
         
-        if not dir_path.exists():
+        try:
+            dir_stat = os.stat(dir_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(status_code=404, detail="Directory not found")
         
-        if not dir_path.is_dir():
+        if not stat.S_ISDIR(dir_stat.st_mode):
             raise HTTPException(status_code=400, detail="Path is not a directory")
         
+        return dir_path, dir_stat
+    
+    def _entry_info(self, entry: os.DirEntry) -> Dict[str, Any]:
+        """Build the listing item for a directory entry; raises OSError if it can't be stat'd."""
+        # DirEntry caches both answers, so each entry costs one stat at most
+        entry_stat = entry.stat()
+        is_directory = entry.is_dir()
+        extension = None if is_directory else _name_suffix(entry.name)
+        
+        return {
+            'name': entry.name,
+            'path': entry.path,
+            'is_directory': is_directory,
+            'size': entry_stat.st_size if not is_directory else None,
+            'modified': _iso(entry_stat.st_mtime),
+            # Only suffixes known to be text count; unknown ones (Makefile,
+            # LICENSE) are flagged separately in the columnar listing
+            'is_editable': False if is_directory else self._is_editable_fast(extension) is True,
+            'extension': extension
+        }
+    
+    def list_directory(self, path: str) -> Dict[str, Any]:
+        """List directory contents."""
+        dir_path, dir_stat = self._stat_directory(path)
+        
+        # Serve repeat views from the cache while the directory is unchanged
+        cache_key = str(dir_path)
+        now = time.monotonic()
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and cached[1] == dir_stat.st_mtime_ns and now - cached[0] < self.LIST_CACHE_TTL:
+            self._list_cache.move_to_end(cache_key)
+            return cached[2]
+        
         try:
-            items = []
+            decorated = []
+            
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+            if len(entries) >= STAT_PREFETCH_THRESHOLD:
+                # DirEntry caches the result, so the loop below reuses it
+                for _ in _STAT_POOL.map(_prefetch_stat, entries):
+                    pass
             
-            for item_path in sorted(dir_path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower())):
+            for entry in entries:
                 try:
-                    stat = item_path.stat()
-                    is_directory = item_path.is_dir()
-                    
-                    item_info = {
-                        'name': item_path.name,
-                        'path': str(item_path),
-                        'is_directory': is_directory,
-                        'size': stat.st_size if not is_directory else None,
-                        'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        'is_editable': not is_directory and self._is_text_file(item_path),
-                        'extension': item_path.suffix.lower() if not is_directory else None
-                    }
-                    items.append(item_info)
+                    item_info = self._entry_info(entry)
+                    # Directories first, then case-insensitive name; the exact name
+                    # breaks ties so the dicts themselves are never compared
+                    decorated.append((not item_info['is_directory'], entry.name.lower(), entry.name, item_info))
                     
                 except (PermissionError, OSError):
                     # Skip items we can't access
                     continue
             
+            decorated.sort()
+            items = [d[3] for d in decorated]
+            
             # Get parent directory if not at root
             parent_path = None
             if dir_path.parent != dir_path:
                 parent_path = str(dir_path.parent)
             
-            return {
+            listing = {
                 'path': str(dir_path),
                 'parent': parent_path,
                 'items': items,
                 'total_items': len(items)
             }
             
+            self._list_cache[cache_key] = (now, dir_stat.st_mtime_ns, listing)
+            self._list_cache.move_to_end(cache_key)
+            if len(self._list_cache) > self.LIST_CACHE_SIZE:
+                self._list_cache.popitem(last=False)
+            return listing
+            
         except PermissionError:
             raise HTTPException(status_code=403, detail="Permission denied")
     
-    def read_file(self, path: str, user_email: str = None) -> Dict[str, Any]:
-        """Read file contents."""
+    def stat_paths(self, paths: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Return listing metadata for many paths at once, keyed by the path as given.
+        
+        Paths are grouped by parent so each directory is scanned once. Paths that
+        are missing, unreadable or outside the base path are left out.
+        """
+        wanted: Dict[Path, Dict[str, List[str]]] = {}
+        for path in paths:
+            try:
+                resolved = self._validate_path(path)
+            except HTTPException:
+                continue
+            wanted.setdefault(resolved.parent, {}).setdefault(resolved.name, []).append(path)
+        
+        result = {}
+        for parent, names in wanted.items():
+            try:
+                with os.scandir(parent) as it:
+                    for entry in it:
+                        requested = names.get(entry.name)
+                        if requested is None:
+                            continue
+                        try:
+                            item_info = self._entry_info(entry)
+                        except OSError:
+                            continue
+                        for path in requested:
+                            result[path] = item_info
+            except OSError:
+                continue
+        return result
+    
+    def list_directory_columns(self, path: str) -> Dict[str, Any]:
+        """List directory contents as parallel columns instead of one object per item.
+        
+        Saves repeating every key on every row. Item paths are left out (they are
+        the directory path joined with the name) and ``flags`` packs
+        ``is_directory | is_editable << 1`` into one int per row. Where the
+        suffix alone can't tell, bit 2 is set instead of bit 1, so the editor
+        can try the file and fall back to the raw view. The columns
+        are kept with the cached listing, so repeat views skip rebuilding them.
+        """
+        listing = self.list_directory(path)
+        cached = self._list_cache.get(listing['path'])
+        if cached is not None and cached[2] is listing and len(cached) > 3:
+            return cached[3]
+        
+        items = listing['items']
+        columns = {
+            'path': listing['path'],
+            'parent': listing['parent'],
+            'columns': {
+                'name': [item['name'] for item in items],
+                'size': [item['size'] for item in items],
+                'modified': [item['modified'] for item in items],
+                'extension': [item['extension'] for item in items],
+                'flags': [
+                    1 if item['is_directory'] else
+                    _FLAG_BY_EDITABILITY[self._is_editable_fast(item['extension'])]
+                    for item in items
+                ],
+            },
+            'total_items': listing['total_items']
+        }
+        if cached is not None and cached[2] is listing:
+            self._list_cache[listing['path']] = cached[:3] + (columns,)
+        return columns
+    
+    def list_directory_stream(self, path: str) -> Iterator[bytes]:
+        """List directory contents as a JSON document streamed entry by entry.
+        
+        The document has the same shape as list_directory(). Validation and the
+        readdir happen up front so errors surface as HTTP errors; entries are
+        then sorted from their cached d_type and stat'd as they are sent.
+        """
+        dir_path, _ = self._stat_directory(path)
+        
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except PermissionError:
+            raise HTTPException(status_code=403, detail="Permission denied")
+        
+        entries.sort(key=lambda e: (not e.is_dir(), e.name.lower(), e.name))
+        parent_path = str(dir_path.parent) if dir_path.parent != dir_path else None
+        return self._stream_listing(dir_path, parent_path, entries)
+    
+    def _stream_listing(self, dir_path: Path, parent_path: Optional[str],
+                        entries: List[os.DirEntry]) -> Iterator[bytes]:
+        """Yield the JSON listing for already sorted entries."""
+        yield b'{"path":' + orjson.dumps(str(dir_path)) + b',"parent":' + orjson.dumps(parent_path) + b',"items":['
+        # Large directories stat ahead in the pool while earlier entries are sent;
+        # map() yields in order, so waiting on it paces the loop entry by entry
+        prefetched = _STAT_POOL.map(_prefetch_stat, entries) if len(entries) >= STAT_PREFETCH_THRESHOLD else None
+        # Entries go out in batches; a send per entry costs more than the entry
+        total = 0
+        batch = []
+        for entry in entries:
+            if prefetched is not None:
+                next(prefetched)
+            try:
+                item_info = self._entry_info(entry)
+            except (PermissionError, OSError):
+                # Skip items we can't access
+                continue
+            batch.append(orjson.dumps(item_info))
+            if len(batch) >= self.STREAM_BATCH_SIZE:
+                yield (b',' if total else b'') + b','.join(batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            yield (b',' if total else b'') + b','.join(batch)
+            total += len(batch)
+        yield b'],"total_items":' + str(total).encode() + b'}'
+    
+    def read_file(self, path: str, user_email: Optional[str] = None, include_content: bool = True) -> Dict[str, Any]:
+        """Read file contents.
+        
+        With include_content=False only the metadata and permission checks run
+        and 'content' is None; the editor then streams the body from read_file_raw.
+        """
         file_path = self._validate_path(path)
         
-        if not file_path.exists():
+        # One path stat answers existence, type and size for the checks below
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(status_code=404, detail="File not found")
         
-        if file_path.is_dir():
+        if stat.S_ISDIR(file_stat.st_mode):
             raise HTTPException(status_code=400, detail="Path is a directory")
         
-        if file_path.stat().st_size > self.MAX_FILE_SIZE:
+        if file_stat.st_size > self.MAX_FILE_SIZE:
             raise HTTPException(status_code=413, detail="File too large to edit")
         
-        if not self._is_text_file(file_path):
+        if not self._is_text_file(file_path, file_stat=file_stat):
             raise HTTPException(status_code=415, detail="File type not supported for editing")
         
         # Check write permissions
@@ -177,15 +420,22 @@ class FileSystemManager:
                 write_users = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = None
+            if include_content:
+                with open(file_path, 'rb') as f:
+                    # Report the metadata of the inode actually read; saves replace
+                    # files by rename, so the path may point elsewhere by now
+                    file_stat = os.fstat(f.fileno())
+                    # read() sizes its buffer from the open file, so this is one
+                    # allocation and one decode with no chunk list to join
+                    data = f.read()
+                content = data.decode('utf-8')
             
-            stat = file_path.stat()
             return {
                 'path': str(file_path),
                 'content': content,
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'size': file_stat.st_size,
+                'modified': _iso(file_stat.st_mtime),
                 'extension': file_path.suffix.lower(),
                 'encoding': 'utf-8',
                 'can_write': can_write,
@@ -196,7 +446,36 @@ class FileSystemManager:
         except PermissionError:
             raise HTTPException(status_code=403, detail="Permission denied")
     
-    def write_file(self, path: str, content: str, create_dirs: bool = False, user_email: str = None) -> Dict[str, Any]:
+    def read_file_raw(self, path: str) -> FileResponse:
+        """Serve a file's bytes directly for display or download.
+        
+        FileResponse hands the body to the server's sendfile path where
+        available, so the content never passes through Python. The sandbox
+        CSP keeps served HTML/SVG from running scripts on the editor's origin.
+        """
+        file_path = self._validate_path(path)
+        
+        try:
+            file_stat = os.stat(file_path)
+        except (FileNotFoundError, NotADirectoryError):
+            raise HTTPException(status_code=404, detail="File not found")
+        
+        if stat.S_ISDIR(file_stat.st_mode):
+            raise HTTPException(status_code=400, detail="Path is a directory")
+        
+        if self._is_text_file(file_path, file_stat=file_stat):
+            media_type = 'text/plain; charset=utf-8'
+        else:
+            media_type = mimetypes.guess_type(file_path.name)[0] or 'application/octet-stream'
+        
+        return FileResponse(
+            file_path,
+            media_type=media_type,
+            stat_result=file_stat,
+            headers={'Content-Security-Policy': 'sandbox', 'X-Content-Type-Options': 'nosniff'},
+        )
+    
+    def write_file(self, path: str, content: str, create_dirs: bool = False, user_email: Optional[str] = None) -> Dict[str, Any]:
         """Write content to a file."""
         file_path = self._validate_path(path)
         
@@ -208,30 +487,97 @@ class FileSystemManager:
         if create_dirs:
             file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Check if parent directory exists
-        if not file_path.parent.exists():
-            raise HTTPException(status_code=400, detail="Parent directory does not exist")
-        
         # Check if we can write to this file type
         if file_path.suffix.lower() not in self.ALLOWED_EXTENSIONS:
             raise HTTPException(status_code=415, detail="File type not allowed for editing")
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = content.encode('utf-8')
+            file_stat = _atomic_write(file_path, data)
             
-            stat = file_path.stat()
+            self._invalidate_listing(file_path.parent)
             return {
                 'path': str(file_path),
-                'size': stat.st_size,
-                'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
+                'size': file_stat.st_size,
+                'modified': _iso(file_stat.st_mtime),
+                'sha256': hashlib.sha256(data).hexdigest(),
                 'message': 'File saved successfully'
             }
+        except (FileNotFoundError, NotADirectoryError):
+            # Creating the temp file is what finds a missing parent; no separate check
+            raise HTTPException(status_code=400, detail="Parent directory does not exist")
         except PermissionError:
             raise HTTPException(status_code=403, detail="Permission denied")
         except OSError as e:
             raise HTTPException(status_code=500, detail=f"Error writing file: {str(e)}")
     
+    def patch_file(self, path: str, base_hash: str, ops: List[Dict[str, Any]], user_email: Optional[str] = None) -> Dict[str, Any]:
+        """Apply edit operations to a file the client last saw with ``base_hash``.
+        
+        Each op is ``{'offset', 'delete', 'insert'}`` with offsets counted in
+        UTF-16 code units, which is how the browser indexes the buffer. A 409
+        means the file changed underneath the client, which then falls back
+        to a full write.
+        """
+        file_path = self._validate_path(path)
+        
+        if file_path.suffix.lower() not in self.ALLOWED_EXTENSIONS:
+            raise HTTPException(status_code=415, detail="File type not allowed for editing")
+        
+        try:
+            with open(file_path, 'rb') as f:
+                data = f.read(self.MAX_FILE_SIZE + 1)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="File not found")
+        except IsADirectoryError:
+            raise HTTPException(status_code=400, detail="Path is a directory")
+        except PermissionError:
+            raise HTTPException(status_code=403, detail="Permission denied")
+        
+        if len(data) > self.MAX_FILE_SIZE:
+            raise HTTPException(status_code=413, detail="File too large to edit")
+        if hashlib.sha256(data).hexdigest() != base_hash:
+            raise HTTPException(status_code=409, detail="File changed since it was loaded")
+        
+        # Check every op's shape before sorting, so a null or missing offset is a
+        # 422 rather than a comparison error
+        for op in ops:
+            if not (isinstance(op, dict) and _is_int(op.get('offset')) and _is_int(op.get('delete'))
+                    and isinstance(op.get('insert'), str)):
+                raise HTTPException(status_code=422, detail="Invalid patch operation")
+        
+        try:
+            units = data.decode('utf-8').encode('utf-16-le')
+            end = len(units) // 2
+            # Apply from the back so earlier offsets stay valid
+            for op in sorted(ops, key=lambda op: op['offset'], reverse=True):
+                offset, delete, insert = op['offset'], op['delete'], op['insert']
+                if offset < 0 or delete < 0 or offset + delete > end:
+                    raise HTTPException(status_code=422, detail="Patch operation out of range")
+                units = units[:offset * 2] + insert.encode('utf-16-le') + units[(offset + delete) * 2:]
+                end = offset
+            data = units.decode('utf-16-le').encode('utf-8')
+        except (KeyError, TypeError):
+            raise HTTPException(status_code=422, detail="Invalid patch operation")
+        except UnicodeError:
+            raise HTTPException(status_code=422, detail="Patch does not produce valid text")
+        
+        try:
+            file_stat = _atomic_write(file_path, data)
+        except PermissionError:
+            raise HTTPException(status_code=403, detail="Permission denied")
+        except OSError as e:
+            raise HTTPException(status_code=500, detail=f"Error writing file: {str(e)}")
+        
+        self._invalidate_listing(file_path.parent)
+        return {
+            'path': str(file_path),
+            'size': file_stat.st_size,
+            'modified': _iso(file_stat.st_mtime),
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'message': 'File saved successfully'
+        }
+    
     def create_directory(self, path: str) -> Dict[str, Any]:
         """Create a new directory."""
         dir_path = self._validate_path(path)
@@ -241,6 +587,7 @@ class FileSystemManager:
         
         try:
             dir_path.mkdir(parents=True, exist_ok=False)
+            self._invalidate_listing(dir_path.parent)
             return {
                 'path': str(dir_path),
                 'message': 'Directory created successfully'
@@ -254,19 +601,23 @@ class FileSystemManager:
         """Delete a file or directory."""
         item_path = self._validate_path(path)
         
-        if not item_path.exists():
+        try:
+            item_stat = os.lstat(item_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise HTTPException(status_code=404, detail="Item not found")
         
         try:
-            if item_path.is_dir():
+            if stat.S_ISDIR(item_stat.st_mode):
                 if recursive:
-                    import shutil
+                    # rmtree already walks with scandir and fd-relative unlinks
+                    # where the platform supports them
                     shutil.rmtree(item_path)
                 else:
-                    item_path.rmdir()
+                    os.rmdir(item_path)
             else:
-                item_path.unlink()
+                os.unlink(item_path)
             
+            self._invalidate_listing(item_path.parent, item_path)
             return {
                 'path': str(item_path),
                 'message': 'Item deleted successfully'
@@ -277,25 +628,146 @@ class FileSystemManager:
             raise HTTPException(status_code=500, detail=f"Error deleting item: {str(e)}")
 
 
-def generate_editor_html(initial_path: str = None) -> str:
-    """Generate the HTML for the filesystem code editor."""
-    initial_path = initial_path or str(Path.home())
+def _atomic_write(file_path: Path, data: bytes) -> os.stat_result:
+    """Write data to a hidden sibling file and rename it over file_path.
     
-    # Check if initial_path is a file or directory
-    is_initial_file = False
-    initial_file_content = ""
+    Readers (and the SyftBox sync client) never see a half-written file. An
+    existing file keeps its permission bits. Returns the stat of the new file.
+    """
     try:
-        path_obj = Path(initial_path)
-        if path_obj.exists() and path_obj.is_file():
-            is_initial_file = True
-            # For files, we'll pass the parent directory as the current path
-            initial_dir = str(path_obj.parent)
-        else:
-            initial_dir = initial_path
-    except:
-        initial_dir = initial_path
+        mode = stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    
+    tmp_path = file_path.with_name(f".{file_path.name}.{os.urandom(4).hex()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        try:
+            if mode is not None:
+                # Through the descriptor where supported, saving a path lookup
+                os.chmod(fd if os.chmod in os.supports_fd else tmp_path, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            file_stat = os.fstat(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return file_stat
+
+
+def _is_int(value: Any) -> bool:
+    """True for JSON integers; bool subclasses int but isn't one."""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@functools.lru_cache(maxsize=8192)
+def _iso(timestamp: float) -> str:
+    """ISO-format a modification time; unchanged files repeat across listings."""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+_O_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _open_for_sniff(file_path: Union[Path, str]) -> int:
+    """Open read-only, skipping the atime update where the kernel lets us."""
+    if _O_NOATIME:
+        try:
+            return os.open(file_path, os.O_RDONLY | _O_NOATIME)
+        except PermissionError:
+            # O_NOATIME is refused on files we don't own; a plain open may still work
+            pass
+    return os.open(file_path, os.O_RDONLY)
+
+
+def _sniff_is_text(file_path: Union[Path, str]) -> bool:
+    """Decide from the first 1KB whether a file holds UTF-8 text."""
+    try:
+        fd = _open_for_sniff(file_path)
+        try:
+            chunk = os.read(fd, 1024)
+        finally:
+            os.close(fd)
+    except OSError:
+        return False
+    
+    # NUL bytes mark binary data; otherwise the sample must be valid UTF-8,
+    # allowing for a multi-byte character cut off at the end of the read
+    if b'\x00' in chunk:
+        return False
+    # Pure ASCII is valid UTF-8; isascii() scans word-at-a-time and builds no str
+    if chunk.isascii():
+        return True
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(chunk)
+        return True
+    except UnicodeDecodeError:
+        return False
+
+
+@functools.lru_cache(maxsize=16384)
+def _cached_sniff_is_text(path: str, ino: int, mtime_ns: int, size: int) -> bool:
+    """_sniff_is_text memoized per file version; a changed stat is a cache miss."""
+    return _sniff_is_text(path)
+
+
+def _name_suffix(name: str) -> str:
+    """Lowercased suffix of a file name, matching PurePath.suffix without parsing a path."""
+    dot = name.rfind('.')
+    return name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+
+
+# What a MIME major type says about editing a file; missing means unknown
+_MIME_EDITABILITY = {'text': True, 'image': False, 'audio': False, 'video': False, 'font': False}
+
+# application/* is mixed, so only these subtypes (and prefixes) are known binary
+_BINARY_APPLICATION_TYPES = frozenset((
+    'application/pdf', 'application/zip', 'application/octet-stream', 'application/gzip',
+    'application/x-tar', 'application/x-7z-compressed', 'application/vnd.rar',
+    'application/java-archive', 'application/java-vm', 'application/wasm', 'application/vnd.sqlite3',
+    'application/msword', 'application/vnd.ms-excel', 'application/vnd.ms-powerpoint',
+    'application/x-msdos-program', 'application/x-executable', 'application/x-iso9660-image',
+    'application/x-apple-diskimage',
+))
+_BINARY_APPLICATION_PREFIXES = ('application/vnd.openxmlformats-', 'application/vnd.oasis.opendocument.')
+
+
+@functools.lru_cache(maxsize=4096)
+def _suffix_editability(suffix: str) -> Optional[bool]:
+    """Suffix-only editability: True for text, False for media and known binary types, None when the content must decide."""
+    if suffix in FileSystemManager.ALLOWED_EXTENSIONS:
+        return True
+    if suffix in _BINARY_EXTENSIONS:
+        return False
     
-    html_content = f"""
+    # Check MIME type; guess_type only looks at the extension
+    mime_type, _ = mimetypes.guess_type('file' + suffix)
+    if not mime_type:
+        return None
+    if mime_type in _BINARY_APPLICATION_TYPES or mime_type.startswith(_BINARY_APPLICATION_PREFIXES):
+        return False
+    return _MIME_EDITABILITY.get(mime_type.partition('/')[0])
+
+
+def _suffix_is_text(suffix: str) -> Optional[bool]:
+    """Return True for suffixes known to be editable text, None when the content must decide."""
+    return _suffix_editability(suffix) or None
+
+
+def _js_literal(value: str) -> str:
+    """Encode a string as a JavaScript literal that is safe inside <script>."""
+    return json.dumps(value).replace('<', '\\u003c')
+
+
+# Static editor page, split once at import around the per-request state
+_EDITOR_HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -306,7 +778,7 @@ def generate_editor_html(initial_path: str = None) -> str:
     <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/components/prism-core.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/prism/1.29.0/plugins/autoloader/prism-autoloader.min.js"></script>
     <style>
-        :root {{
+        :root {
             --background: 0 0% 100%;
             --foreground: 222.2 84% 4.9%;
             --card: 0 0% 100%;
@@ -327,9 +799,9 @@ def generate_editor_html(initial_path: str = None) -> str:
             --input: 214.3 31.8% 91.4%;
             --ring: 222.2 84% 4.9%;
             --radius: 0.5rem;
-        }}
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             margin: 0;
             padding: 0;
@@ -339,26 +811,26 @@ def generate_editor_html(initial_path: str = None) -> str:
             line-height: 1.5;
             height: 100vh;
             overflow: hidden;
-        }}
+        }
 
-        .container {{
+        .container {
             width: 100%;
             height: 100vh;
             margin: 0;
             padding: 0;
             display: flex;
             flex-direction: column;
-        }}
+        }
 
-        .main-content {{
+        .main-content {
             display: grid;
             grid-template-columns: 1fr 2fr;
             gap: 24px;
             flex: 1;
             overflow: hidden;
-        }}
+        }
 
-        .panel {{
+        .panel {
             background: white;
             border: none;
             border-radius: 0;
@@ -367,24 +839,24 @@ def generate_editor_html(initial_path: str = None) -> str:
             display: flex;
             flex-direction: column;
             min-height: 0;
-        }}
+        }
 
-        .panel-header {{
+        .panel-header {
             background: #f8f9fa;
             padding: 8px 12px;
             border-bottom: 1px solid #e5e7eb;
             font-weight: 600;
             color: #374151;
             font-size: 12px;
-        }}
+        }
 
-        .panel-content {{
+        .panel-content {
             flex: 1;
             overflow: auto;
             background: white;
-        }}
+        }
 
-        .breadcrumb {{
+        .breadcrumb {
             display: flex;
             flex-wrap: wrap;
             align-items: center;
@@ -395,16 +867,16 @@ def generate_editor_html(initial_path: str = None) -> str:
             font-size: 11px;
             max-height: 150px;
             overflow-y: auto;
-        }}
+        }
 
-        .breadcrumb-item {{
+        .breadcrumb-item {
             display: flex;
             align-items: center;
             gap: 8px;
             max-width: 200px;
-        }}
+        }
 
-        .breadcrumb-link {{
+        .breadcrumb-link {
             color: hsl(var(--muted-foreground));
             text-decoration: none;
             padding: 4px 8px;
@@ -415,15 +887,15 @@ def generate_editor_html(initial_path: str = None) -> str:
             text-overflow: ellipsis;
             max-width: 150px;
             font-weight: 500;
-        }}
+        }
 
-        .breadcrumb-link:hover {{
+        .breadcrumb-link:hover {
             background: hsl(var(--accent));
             color: hsl(var(--accent-foreground));
             max-width: none;
-        }}
+        }
 
-        .breadcrumb-current {{
+        .breadcrumb-current {
             color: hsl(var(--foreground));
             font-weight: 500;
             background: hsl(var(--muted));
@@ -433,18 +905,18 @@ def generate_editor_html(initial_path: str = None) -> str:
             white-space: nowrap;
             overflow: hidden;
             text-overflow: ellipsis;
-        }}
+        }
 
-        .breadcrumb-separator {{
+        .breadcrumb-separator {
             color: hsl(var(--muted-foreground));
             font-size: 0.8rem;
-        }}
+        }
 
-        .file-list {{
+        .file-list {
             padding: 8px 0;
-        }}
+        }
 
-        .file-item {{
+        .file-item {
             display: flex;
             align-items: center;
             gap: 12px;
@@ -454,18 +926,18 @@ def generate_editor_html(initial_path: str = None) -> str:
             transition: all 0.2s;
             border: 1px solid transparent;
             background: transparent;
-        }}
+        }
 
-        .file-item:hover {{
+        .file-item:hover {
             background: hsl(var(--accent));
-        }}
+        }
 
-        .file-item.selected {{
+        .file-item.selected {
             background: hsl(var(--accent));
             border-color: hsl(var(--border));
-        }}
+        }
 
-        .file-icon {{
+        .file-icon {
             width: 16px;
             height: 16px;
             font-size: 14px;
@@ -473,36 +945,36 @@ def generate_editor_html(initial_path: str = None) -> str:
             align-items: center;
             justify-content: center;
             color: #6b7280;
-        }}
+        }
 
-        .file-details {{
+        .file-details {
             flex: 1;
             min-width: 0;
-        }}
+        }
 
-        .file-name {{
+        .file-name {
             font-weight: 500;
             color: #111827;
             white-space: nowrap;
             overflow: hidden;
             text-overflow: ellipsis;
             font-size: 12px;
-        }}
+        }
 
-        .file-meta {{
+        .file-meta {
             font-size: 10px;
             color: #6b7280;
             margin-top: 1px;
-        }}
+        }
 
-        .editor-container {{
+        .editor-container {
             flex: 1;
             display: flex;
             flex-direction: column;
             min-height: 0;
-        }}
+        }
 
-        .editor-header {{
+        .editor-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
@@ -511,9 +983,9 @@ def generate_editor_html(initial_path: str = None) -> str:
             background: white;
             border-bottom: none;
             flex-shrink: 0;
-        }}
+        }
 
-        .editor-title {{
+        .editor-title {
             font-weight: 500;
             color: hsl(var(--foreground));
             white-space: nowrap;
@@ -522,16 +994,16 @@ def generate_editor_html(initial_path: str = None) -> str:
             flex: 1;
             font-size: 0.95rem;
             text-align: left;
-        }}
+        }
 
-        .editor-actions {{
+        .editor-actions {
             display: flex;
             gap: 6px;
             flex-shrink: 0;
             margin-left: auto;
-        }}
+        }
 
-        .btn {{
+        .btn {
             padding: 5px 12px;
             border: none;
             border-radius: 4px;
@@ -543,71 +1015,71 @@ def generate_editor_html(initial_path: str = None) -> str:
             align-items: center;
             gap: 4px;
             line-height: 1.4;
-        }}
+        }
 
-        .btn-primary {{
+        .btn-primary {
             background: rgba(147, 197, 253, 0.25);  /* Very light pastel blue */
             color: #3b82f6;
             border: 1px solid rgba(147, 197, 253, 0.4);
             backdrop-filter: blur(4px);
-        }}
+        }
 
-        .btn-primary:hover {{
+        .btn-primary:hover {
             background: rgba(147, 197, 253, 0.35);  /* Slightly more opaque on hover */
             border-color: rgba(147, 197, 253, 0.5);
             transform: translateY(-1px);
             box-shadow: 0 2px 8px rgba(147, 197, 253, 0.2);
-        }}
+        }
         
-        .btn-primary.saving {{
+        .btn-primary.saving {
             animation: buttonRainbow 1s ease-in-out;
-        }}
-        
-        @keyframes buttonRainbow {{
-            0% {{ background: rgba(255, 204, 204, 0.5); border-color: rgba(255, 179, 179, 0.7); }}
-            14% {{ background: rgba(255, 217, 179, 0.5); border-color: rgba(255, 194, 153, 0.7); }}
-            28% {{ background: rgba(255, 255, 204, 0.5); border-color: rgba(255, 255, 179, 0.7); }}
-            42% {{ background: rgba(204, 255, 204, 0.5); border-color: rgba(179, 255, 179, 0.7); }}
-            57% {{ background: rgba(204, 255, 255, 0.5); border-color: rgba(179, 255, 255, 0.7); }}
-            71% {{ background: rgba(204, 204, 255, 0.5); border-color: rgba(179, 179, 255, 0.7); }}
-            85% {{ background: rgba(255, 204, 255, 0.5); border-color: rgba(255, 179, 255, 0.7); }}
-            100% {{ background: rgba(147, 197, 253, 0.25); border-color: rgba(147, 197, 253, 0.4); }}
-        }}
-
-        .btn-secondary {{
+        }
+        
+        @keyframes buttonRainbow {
+            0% { background: rgba(255, 204, 204, 0.5); border-color: rgba(255, 179, 179, 0.7); }
+            14% { background: rgba(255, 217, 179, 0.5); border-color: rgba(255, 194, 153, 0.7); }
+            28% { background: rgba(255, 255, 204, 0.5); border-color: rgba(255, 255, 179, 0.7); }
+            42% { background: rgba(204, 255, 204, 0.5); border-color: rgba(179, 255, 179, 0.7); }
+            57% { background: rgba(204, 255, 255, 0.5); border-color: rgba(179, 255, 255, 0.7); }
+            71% { background: rgba(204, 204, 255, 0.5); border-color: rgba(179, 179, 255, 0.7); }
+            85% { background: rgba(255, 204, 255, 0.5); border-color: rgba(255, 179, 255, 0.7); }
+            100% { background: rgba(147, 197, 253, 0.25); border-color: rgba(147, 197, 253, 0.4); }
+        }
+
+        .btn-secondary {
             background: #f3f4f6;
             color: #374151;
-        }}
+        }
 
-        .btn-secondary:hover {{
+        .btn-secondary:hover {
             background: #e5e7eb;
-        }}
+        }
         
         /* Additional button colors with better harmony */
-        .btn-mint {{
+        .btn-mint {
             background: #f3f4f6;
             color: #374151;
-        }}
+        }
         
-        .btn-mint:hover {{
+        .btn-mint:hover {
             background: #e5e7eb;
-        }}
+        }
         
-        .btn-lavender {{
+        .btn-lavender {
             background: #f3f4f6;
             color: #374151;
-        }}
+        }
         
-        .btn-lavender:hover {{
+        .btn-lavender:hover {
             background: #e5e7eb;
-        }}
+        }
 
-        .btn:disabled {{
+        .btn:disabled {
             opacity: 0.5;
             cursor: not-allowed;
-        }}
+        }
 
-        .editor-textarea {{
+        .editor-textarea {
             flex: 1;
             resize: none;
             border: none;
@@ -621,13 +1093,20 @@ def generate_editor_html(initial_path: str = None) -> str:
             tab-size: 4;
             width: 100%;
             height: 100%;
-        }}
+        }
 
-        .editor-textarea:focus {{
+        .editor-textarea:focus {
             box-shadow: none;
-        }}
+        }
+        
+        /* Large files skip soft wrapping so edits don't re-break every line */
+        .editor-textarea.large-file {
+            white-space: pre;
+            overflow-wrap: normal;
+            overflow-x: auto;
+        }
 
-        .status-bar {{
+        .status-bar {
             display: flex;
             align-items: center;
             justify-content: space-between;
@@ -637,36 +1116,36 @@ def generate_editor_html(initial_path: str = None) -> str:
             font-size: 0.85rem;
             color: hsl(var(--muted-foreground));
             flex-shrink: 0;
-        }}
+        }
 
-        .status-left {{
+        .status-left {
             display: flex;
             align-items: center;
             gap: 16px;
-        }}
+        }
 
-        .status-right {{
+        .status-right {
             display: flex;
             align-items: center;
             gap: 16px;
-        }}
+        }
 
-        .loading {{
+        .loading {
             text-align: center;
             padding: 40px;
             color: hsl(var(--muted-foreground));
-        }}
+        }
 
-        .error {{
+        .error {
             background: hsl(var(--destructive) / 0.1);
             color: hsl(var(--destructive));
             padding: 12px;
             border-radius: 0;
             margin: 12px;
             border: none;
-        }}
+        }
 
-        .success {{
+        .success {
             color: #065f46;
             padding: 12px 20px;
             border-radius: 8px;
@@ -679,152 +1158,181 @@ def generate_editor_html(initial_path: str = None) -> str:
             font-weight: 500;
             box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
             animation: slideIn 0.3s ease-out, rainbowPastel 3s ease-in-out;
-        }}
+        }
         
-        @keyframes slideIn {{
-            from {{
+        /* Notifications stack in one fixed container instead of each being positioned */
+        .toast-host {
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            z-index: 1000;
+            display: flex;
+            flex-direction: column;
+            align-items: flex-end;
+            gap: 8px;
+            pointer-events: none;
+        }
+        
+        .toast-host .success,
+        .toast-host .error {
+            position: static;
+            margin: 0;
+            max-width: 400px;
+        }
+        
+        .toast-host .error {
+            border-radius: 8px;
+            font-weight: 500;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);
+            background: hsl(var(--background));
+            border: 1px solid hsl(var(--destructive) / 0.3);
+            animation: slideIn 0.3s ease-out;
+        }
+        
+        @keyframes slideIn {
+            from {
                 transform: translateX(400px);
                 opacity: 0;
-            }}
-            to {{
+            }
+            to {
                 transform: translateX(0);
                 opacity: 1;
-            }}
-        }}
+            }
+        }
         
-        @keyframes slideOut {{
-            to {{
+        @keyframes slideOut {
+            to {
                 transform: translateX(400px);
                 opacity: 0;
-            }}
-        }}
-        
-        @keyframes rainbowPastel {{
-            0% {{ background: #ffcccc; border-color: #ffb3b3; }} /* Pastel Pink */
-            14% {{ background: #ffd9b3; border-color: #ffc299; }} /* Pastel Orange */
-            28% {{ background: #ffffcc; border-color: #ffffb3; }} /* Pastel Yellow */
-            42% {{ background: #ccffcc; border-color: #b3ffb3; }} /* Pastel Green */
-            57% {{ background: #ccffff; border-color: #b3ffff; }} /* Pastel Cyan */
-            71% {{ background: #ccccff; border-color: #b3b3ff; }} /* Pastel Blue */
-            85% {{ background: #ffccff; border-color: #ffb3ff; }} /* Pastel Purple */
-            100% {{ background: #dcfce7; border-color: #bbf7d0; }} /* Final teal */
-        }}
-
-        .empty-state {{
+            }
+        }
+        
+        @keyframes rainbowPastel {
+            0% { background: #ffcccc; border-color: #ffb3b3; } /* Pastel Pink */
+            14% { background: #ffd9b3; border-color: #ffc299; } /* Pastel Orange */
+            28% { background: #ffffcc; border-color: #ffffb3; } /* Pastel Yellow */
+            42% { background: #ccffcc; border-color: #b3ffb3; } /* Pastel Green */
+            57% { background: #ccffff; border-color: #b3ffff; } /* Pastel Cyan */
+            71% { background: #ccccff; border-color: #b3b3ff; } /* Pastel Blue */
+            85% { background: #ffccff; border-color: #ffb3ff; } /* Pastel Purple */
+            100% { background: #dcfce7; border-color: #bbf7d0; } /* Final teal */
+        }
+
+        .empty-state {
             text-align: center;
             padding: 60px 20px;
             color: hsl(var(--muted-foreground));
-        }}
+        }
 
-        .empty-state h3 {{
+        .empty-state h3 {
             font-size: 1.1rem;
             margin-bottom: 8px;
             color: hsl(var(--foreground));
             font-weight: 500;
-        }}
+        }
 
-        .empty-state p {{
+        .empty-state p {
             color: hsl(var(--muted-foreground));
             font-size: 0.9rem;
-        }}
+        }
 
-        .logo {{
+        .logo {
             width: 48px;
             height: 48px;
             margin: 0 auto 16px;
-        }}
+        }
 
-        @media (max-width: 900px) {{
-            .main-content {{
+        @media (max-width: 900px) {
+            .main-content {
                 grid-template-columns: 1fr;
                 gap: 16px;
-            }}
+            }
 
-            .editor-header {{
+            .editor-header {
                 flex-direction: column;
                 gap: 8px;
-            }}
+            }
 
-            .editor-actions {{
+            .editor-actions {
                 width: 100%;
                 justify-content: flex-start;
-            }}
+            }
 
-            .breadcrumb {{
+            .breadcrumb {
                 padding: 8px 12px;
-            }}
+            }
 
-            .breadcrumb-item {{
+            .breadcrumb-item {
                 max-width: 120px;
-            }}
+            }
 
             .breadcrumb-link,
-            .breadcrumb-current {{
+            .breadcrumb-current {
                 max-width: 100px;
                 font-size: 0.85rem;
-            }}
-        }}
+            }
+        }
 
         /* Embedded mode detection */
-        .embedded-mode {{
+        .embedded-mode {
             height: 100vh !important;
-        }}
+        }
         
-        .embedded-mode .container {{
+        .embedded-mode .container {
             height: 100% !important;
-        }}
+        }
         
-        .embedded-mode .main-content {{
+        .embedded-mode .main-content {
             height: 100% !important;
-        }}
+        }
         
-        .embedded-mode .panel {{
+        .embedded-mode .panel {
             height: 100% !important;
-        }}
+        }
         
-        .embedded-mode .editor-container {{
+        .embedded-mode .editor-container {
             height: 100% !important;
-        }}
+        }
         
-        @media (max-width: 600px) {{
-            .container {{
+        @media (max-width: 600px) {
+            .container {
                 padding: 8px;
-            }}
+            }
 
-            .panel-header {{
+            .panel-header {
                 padding: 10px 12px;
-            }}
+            }
 
-            .breadcrumb {{
+            .breadcrumb {
                 padding: 8px;
-            }}
+            }
 
-            .file-item {{
+            .file-item {
                 padding: 8px 10px;
-            }}
+            }
 
-            .editor-textarea {{
+            .editor-textarea {
                 padding: 10px;
                 font-size: 13px;
-            }}
-        }}
+            }
+        }
         
         /* File-only mode styles */
-        .file-only-mode .panel:first-child {{
+        .file-only-mode .panel:first-child {
             display: none;
-        }}
+        }
         
-        .file-only-mode .main-content {{
+        .file-only-mode .main-content {
             grid-template-columns: 1fr;
-        }}
+        }
         
-        .file-only-mode .editor-panel {{
+        .file-only-mode .editor-panel {
             border-radius: 0;
-        }}
+        }
         
-        .toggle-explorer-btn {{
+        .toggle-explorer-btn {
             margin-right: 8px;
-        }}
+        }
     </style>
 </head>
 <body>
@@ -841,6 +1349,15 @@ def generate_editor_html(initial_path: str = None) -> str:
                     <div class="file-list" id="fileList">
                         <div class="loading">Loading files...</div>
                     </div>
+                    <template id="fileItemTemplate">
+                        <div class="file-item">
+                            <div class="file-icon"></div>
+                            <div class="file-details">
+                                <div class="file-name"></div>
+                                <div class="file-meta"></div>
+                            </div>
+                        </div>
+                    </template>
                 </div>
             </div>
             
@@ -917,7 +1434,7 @@ def generate_editor_html(initial_path: str = None) -> str:
                             <h3>Welcome to SyftBox Editor</h3>
                             <p>Select a file from the explorer to start editing</p>
                         </div>
-                        <textarea class="editor-textarea" id="editor" style="display: none;" placeholder="Start typing..."></textarea>
+                        <textarea class="editor-textarea" id="editor" style="display: none;" placeholder="Start typing..." spellcheck="false" autocomplete="off" autocorrect="off" autocapitalize="off"></textarea>
                     </div>
                     <div class="status-bar">
                         <div class="status-left">
@@ -936,41 +1453,91 @@ def generate_editor_html(initial_path: str = None) -> str:
 
     <script>
         // Detect if we're in an iframe and add embedded-mode class
-        if (window.self !== window.top) {{
+        if (window.self !== window.top) {
             document.body.classList.add('embedded-mode');
-        }}
+        }
         
         // Also check for URL parameter
         const urlParams = new URLSearchParams(window.location.search);
-        if (urlParams.get('embedded') === 'true') {{
+        if (urlParams.get('embedded') === 'true') {
             document.body.classList.add('embedded-mode');
-        }}
-        
-        class FileSystemEditor {{
-            constructor() {{
-                this.currentPath = '{initial_dir}';
-                this.initialFilePath = {'`' + initial_path + '`' if is_initial_file else 'null'};
-                this.isInitialFile = {str(is_initial_file).lower()};
-                this.currentFile = null;
+        }
+        
+        class FileSystemEditor {
+            constructor() {
+@@EDITOR_STATE@@                this.currentFile = null;
                 this.isModified = false;
+                // Recently listed directories (LRU): path -> {data, fetchedAt}
+                this.dirCache = new Map();
+                this.dirCacheTtlMs = 30000;
+                this.dirCacheSize = 64;
+                // Listings younger than this are shown without revalidating
+                this.dirRevalidateMs = 2000;
+                // Hovering a directory this long fetches its listing ahead of the click
+                this.prefetchDwellMs = 120;
+                this.dirPrefetches = new Map();
+                this.hoverRow = null;
+                this.hoverTimer = null;
+                this.breadcrumbPath = null;
+                // Listings at least this long are rendered as a scrolling window
+                this.virtualListThreshold = 200;
+                this.fileWindow = null;
+                this.inflightDir = null;
+                // Endpoint URLs parsed once; each request only swaps the path param
+                this.listUrl = new URL('/api/filesystem/list', location.origin);
+                this.listUrl.searchParams.set('columns', 'true');
+                this.rawUrl = new URL('/api/filesystem/raw', location.origin);
+                this.metaUrl = new URL('/api/filesystem/read', location.origin);
+                this.metaUrl.searchParams.set('content', 'false');
+                // One resolved formatter for every row; same fields as toLocaleString()
+                this.dateFormat = new Intl.DateTimeFormat(undefined, {
+                    year: 'numeric', month: 'numeric', day: 'numeric',
+                    hour: 'numeric', minute: 'numeric', second: 'numeric'
+                });
+                // Last saved text and its SHA-256, the base that autosave diffs against
+                this.savedContent = null;
+                this.baseHash = null;
+                this.autosaveDelayMs = 1500;
+                // Files above this size are edited without soft wrapping
+                this.largeFileThreshold = 256 * 1024;
+                this.autosaveTimer = null;
+                this.saveQueue = Promise.resolve();
+                this.saveInFlight = 0;
+                // Notifications share one container and recycle their nodes
+                this.toastHost = document.createElement('div');
+                this.toastHost.className = 'toast-host';
+                document.body.appendChild(this.toastHost);
+                this.toastPool = [];
+                // Visible toasts and their expiry, swept by one shared timer
+                this.toastQueue = [];
+                this.toastTimer = null;
                 this.fileOnlyMode = this.isInitialFile;
                 this.initializeElements();
                 this.setupEventListeners();
                 
-                if (this.isInitialFile) {{
+                if (this.isInitialFile) {
                     // If initial path is a file, load it directly
                     this.loadFile(this.initialFilePath);
                     this.toggleFileOnlyMode(true);
                     // Hide toggle button when viewing a single file
                     this.toggleExplorerBtn.style.display = 'none';
-                }} else {{
+                } else {
                     // Otherwise load the directory
                     this.loadDirectory(this.currentPath);
-                }}
-            }}
+                }
+            }
             
-            initializeElements() {{
+            initializeElements() {
                 this.fileList = document.getElementById('fileList');
+                this.fileItemTemplate = document.getElementById('fileItemTemplate').content.firstElementChild;
+                
+                const icons = document.createElement('template');
+                icons.innerHTML = '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 3h6l2 3h10a2 2 0 012 2v10a2 2 0 01-2 2H3a2 2 0 01-2-2V5a2 2 0 012-2z"/></svg>'
+                    + '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M13 2H6a2 2 0 00-2 2v16a2 2 0 002 2h12a2 2 0 002-2V9z"/><polyline points="13 2 13 9 20 9"/></svg>';
+                [this.directoryIcon, this.fileIcon] = icons.content.children;
+                const crumbs = document.createElement('template');
+                crumbs.innerHTML = '<div class="breadcrumb-item"><a href="#" class="breadcrumb-link"></a><span class="breadcrumb-separator">›</span></div><div class="breadcrumb-current"></div>';
+                [this.breadcrumbItem, this.breadcrumbCurrent] = crumbs.content.children;
                 this.editor = document.getElementById('editor');
                 this.saveBtn = document.getElementById('saveBtn');
                 this.newFileBtn = document.getElementById('newFileBtn');
@@ -983,41 +1550,185 @@ def generate_editor_html(initial_path: str = None) -> str:
                 this.fileSize = document.getElementById('fileSize');
                 this.toggleExplorerBtn = document.getElementById('toggleExplorerBtn');
                 this.readOnlyIndicator = document.getElementById('readOnlyIndicator');
-            }}
+            }
             
-            setupEventListeners() {{
+            setupEventListeners() {
                 this.saveBtn.addEventListener('click', () => this.saveFile());
                 this.newFileBtn.addEventListener('click', () => this.createNewFile());
                 this.newFolderBtn.addEventListener('click', () => this.createNewFolder());
                 this.toggleExplorerBtn.addEventListener('click', () => this.toggleFileOnlyMode());
                 
-                this.editor.addEventListener('input', () => {{
-                    this.isModified = true;
-                    this.updateUI();
-                }});
+                // One delegated pair of listeners serves every row the list ever renders
+                this.fileList.addEventListener('click', (e) => {
+                    const row = e.target.closest('.file-item');
+                    if (!row) return;
+                    
+                    const path = row.dataset.path;
+                    if (row.dataset.isDirectory === 'true') {
+                        this.loadDirectory(path);
+                    } else if (row.dataset.isEditable !== 'false') {
+                        // Unknown types ('null') are sniffed by the server when opened
+                        this.loadFile(path);
+                    } else {
+                        window.open(this.withPath(this.rawUrl, path), '_blank');
+                    }
+                });
+                
+                this.fileList.addEventListener('mouseover', (e) => {
+                    const row = e.target.closest('.file-item');
+                    if (row === this.hoverRow) return;
+                    this.hoverRow = row;
+                    clearTimeout(this.hoverTimer);
+                    if (row && row.dataset.isDirectory === 'true') {
+                        const path = row.dataset.path;
+                        this.hoverTimer = setTimeout(() => this.prefetchDirectory(path), this.prefetchDwellMs);
+                    }
+                });
+                this.fileList.addEventListener('mouseleave', () => {
+                    this.hoverRow = null;
+                    clearTimeout(this.hoverTimer);
+                });
+                
+                this.breadcrumb.addEventListener('click', (e) => {
+                    const link = e.target.closest('.breadcrumb-link');
+                    if (!link) return;
+                    e.preventDefault();
+                    this.loadDirectory(link.dataset.path);
+                });
+                
+                this.fileList.parentElement.addEventListener('scroll', () => this.scheduleFileWindow(), { passive: true });
+                window.addEventListener('resize', () => this.scheduleFileWindow());
+                
+                this.fileList.addEventListener('contextmenu', (e) => {
+                    const row = e.target.closest('.file-item');
+                    if (!row) return;
+                    // A right-click on a folder usually precedes opening it
+                    if (row.dataset.isDirectory === 'true') this.prefetchDirectory(row.dataset.path);
+                    // No custom menu is defined yet, so the browser's menu shows
+                    if (!this.showContextMenu) return;
+                    
+                    e.preventDefault();
+                    this.showContextMenu(e, row.dataset.path, row.dataset.isDirectory === 'true');
+                });
+                
+                this.editor.addEventListener('beforeinput', (e) => {
+                    this.pendingEdit = this.lineStarts ? this.lineSafeEdit(e) : null;
+                });
+                
+                this.editor.addEventListener('input', () => {
+                    this.updateLineIndex();
+                    // The title and save button only change on the first edit
+                    if (!this.isModified) {
+                        this.isModified = true;
+                        this.updateUI();
+                    }
+                    this.scheduleAutosave();
+                });
+                // A pending autosave would die with the page; hand it to the browser
+                window.addEventListener('pagehide', () => this.flushAutosave());
                 
-                this.editor.addEventListener('keyup', () => this.updateCursorPosition());
-                this.editor.addEventListener('click', () => this.updateCursorPosition());
+                this.editor.addEventListener('keyup', () => this.scheduleCursorPosition());
+                this.editor.addEventListener('click', () => this.scheduleCursorPosition());
                 
                 // Auto-save on Ctrl+S
-                document.addEventListener('keydown', (e) => {{
-                    if (e.ctrlKey && e.key === 's') {{
+                document.addEventListener('keydown', (e) => {
+                    if (e.ctrlKey && e.key === 's') {
                         e.preventDefault();
-                        if (this.currentFile) {{
+                        if (this.currentFile) {
                             this.saveFile();
-                        }}
-                    }}
-                }});
-            }}
+                        }
+                    }
+                });
+            }
             
-            async loadDirectory(path) {{
-                try {{
-                    const response = await fetch(`/api/filesystem/list?path=${{encodeURIComponent(path)}}`);
-                    const data = await response.json();
+            showDirectory(data) {
+                this.currentListing = data;
+                this.currentPath = data.path;
+                this.renderFileList(data.items);
+                this.renderBreadcrumb(data.path, data.parent);
+            }
+            
+            cacheDirectory(path, data) {
+                const entry = { data, fetchedAt: Date.now() };
+                for (const key of new Set([path, data.path])) {
+                    this.dirCache.delete(key);
+                    this.dirCache.set(key, entry);
+                }
+                while (this.dirCache.size > this.dirCacheSize) {
+                    this.dirCache.delete(this.dirCache.keys().next().value);
+                }
+            }
+            
+            invalidateDirectory(dirPath) {
+                for (const [key, entry] of this.dirCache) {
+                    if (key === dirPath || entry.data.path === dirPath) {
+                        this.dirCache.delete(key);
+                    }
+                }
+            }
+            
+            parentPath(path) {
+                return path.substring(0, path.lastIndexOf('/')) || '/';
+            }
+            
+            loadDirectory(path) {
+                // Repeat clicks on the same directory share one request; navigating
+                // elsewhere cancels the request that is no longer wanted
+                if (this.inflightDir && this.inflightDir.path === path) {
+                    return this.inflightDir.promise;
+                }
+                if (this.inflightDir) this.inflightDir.controller.abort();
+                
+                const request = { path, controller: new AbortController() };
+                this.inflightDir = request;
+                request.promise = this.fetchDirectory(request).finally(() => {
+                    if (this.inflightDir === request) this.inflightDir = null;
+                });
+                return request.promise;
+            }
+            
+            prefetchDirectory(path) {
+                // Fill the listing cache without rendering; the click then hits the cache
+                const cached = this.dirCache.get(path);
+                if (cached && Date.now() - cached.fetchedAt < this.dirCacheTtlMs) return;
+                if (this.dirPrefetches.has(path) || (this.inflightDir && this.inflightDir.path === path)) return;
+                
+                const prefetch = fetch(this.withPath(this.listUrl, path))
+                    .then(response => response.ok ? response.json() : null)
+                    .then(data => {
+                        if (data) this.cacheDirectory(path, this.listingFromColumns(data));
+                    })
+                    .catch(() => {})
+                    .finally(() => this.dirPrefetches.delete(path));
+                this.dirPrefetches.set(path, prefetch);
+            }
+            
+            async fetchDirectory(request) {
+                const path = request.path;
+                
+                // A hover prefetch already on the wire answers this click
+                const prefetch = this.dirPrefetches.get(path);
+                if (prefetch) {
+                    await prefetch;
+                    if (request.controller.signal.aborted) return;
+                }
+                
+                // Show a recent listing immediately, then revalidate in the background
+                const cached = this.dirCache.get(path);
+                const fresh = cached && Date.now() - cached.fetchedAt < this.dirCacheTtlMs;
+                if (fresh) {
+                    this.showDirectory(cached.data);
+                    if (Date.now() - cached.fetchedAt < this.dirRevalidateMs) return;
+                }
+                
+                try {
+                    const response = await fetch(this.withPath(this.listUrl, path), { signal: request.controller.signal });
+                    let data = await response.json();
                     
-                    if (!response.ok) {{
+                    if (!response.ok) {
+                        this.invalidateDirectory(path);
                         // Handle permission denied or directory not found gracefully
-                        if (response.status === 403 || response.status === 404) {{
+                        if (response.status === 403 || response.status === 404) {
                             // Show permission denied message instead of error alert
                             const title = response.status === 403 ? 'Permission Denied' : 'Directory Not Found';
                             const message = response.status === 403 ? 
@@ -1030,134 +1741,260 @@ def generate_editor_html(initial_path: str = None) -> str:
                                         <path d="M12 9v2m0 4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"/>
                                     </svg>
                                     <h3 style="color: #374151; font-size: 18px; margin: 0 0 8px 0; font-weight: 600;">
-                                        ${{title}}
+                                        ${title}
                                     </h3>
                                     <p style="color: #6b7280; font-size: 14px; margin: 0; max-width: 400px;">
-                                        ${{message}}
+                                        ${message}
                                     </p>
                                 </div>
                             `;
                             
                             // Clear breadcrumb navigation for permission denied directories
-                            this.breadcrumb.innerHTML = `<div class="breadcrumb-current">${{title}}</div>`;
+                            this.breadcrumb.innerHTML = `<div class="breadcrumb-current">${title}</div>`;
+                            this.breadcrumbPath = null;
                             return;
-                        }}
+                        }
                         throw new Error(data.detail || 'Failed to load directory');
-                    }}
+                    }
                     
-                    this.currentPath = data.path;
-                    this.renderFileList(data.items);
-                    this.renderBreadcrumb(data.path, data.parent);
+                    data = this.listingFromColumns(data);
+                    this.cacheDirectory(path, data);
+                    if (!fresh || JSON.stringify(data.items) !== JSON.stringify(cached.data.items)) {
+                        this.showDirectory(data);
+                    }
                     
-                }} catch (error) {{
+                } catch (error) {
+                    if (error.name === 'AbortError') return;
                     this.showError('Failed to load directory: ' + error.message);
-                }}
-            }}
+                }
+            }
             
-            renderFileList(items) {{
-                if (items.length === 0) {{
+            listingFromColumns(data) {
+                // Zip the columnar /list payload back into item objects in one pass
+                const { name, size, modified, extension, flags } = data.columns;
+                const base = data.path.endsWith('/') ? data.path : data.path + '/';
+                const items = new Array(name.length);
+                for (let i = 0; i < name.length; i++) {
+                    items[i] = {
+                        name: name[i],
+                        path: base + name[i],
+                        is_directory: (flags[i] & 1) !== 0,
+                        size: size[i],
+                        modified: modified[i],
+                        is_editable: (flags[i] & 4) ? null : (flags[i] & 2) !== 0,
+                        extension: extension[i]
+                    };
+                }
+                return { path: data.path, parent: data.parent, items, total_items: data.total_items };
+            }
+            
+            renderFileList(items) {
+                this.fileItems = items;
+                this.fileWindow = null;
+                
+                if (items.length === 0) {
                     this.fileList.innerHTML = '<div class="empty-state"><h3>Empty Directory</h3><p>No files or folders found</p></div>';
                     return;
-                }}
+                }
                 
-                this.fileList.innerHTML = items.map(item => {{
-                    const icon = item.is_directory 
-                        ? '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 3h6l2 3h10a2 2 0 012 2v10a2 2 0 01-2 2H3a2 2 0 01-2-2V5a2 2 0 012-2z"/></svg>'
-                        : '<svg width="14" height="14" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M13 2H6a2 2 0 00-2 2v16a2 2 0 002 2h12a2 2 0 002-2V9z"/><polyline points="13 2 13 9 20 9"/></svg>';
-                    const sizeText = item.is_directory ? 'Directory' : this.formatFileSize(item.size);
-                    const modifiedText = new Date(item.modified).toLocaleString();
-                    
-                    return `
-                        <div class="file-item" data-path="${{item.path}}" data-is-directory="${{item.is_directory}}" data-is-editable="${{item.is_editable}}">
-                            <div class="file-icon ${{item.is_directory ? 'directory' : (item.is_editable ? 'editable' : '')}}">${{icon}}</div>
-                            <div class="file-details">
-                                <div class="file-name">${{item.name}}</div>
-                                <div class="file-meta">${{sizeText}} • ${{modifiedText}}</div>
-                            </div>
-                        </div>
-                    `;
-                }}).join('');
+                if (items.length < this.virtualListThreshold) {
+                    const fragment = document.createDocumentFragment();
+                    for (const item of items) {
+                        fragment.appendChild(this.buildFileRow(item));
+                    }
+                    this.fileList.replaceChildren(fragment);
+                    return;
+                }
                 
-                // Add click handlers
-                this.fileList.querySelectorAll('.file-item').forEach(item => {{
-                    item.addEventListener('click', () => {{
-                        const path = item.dataset.path;
-                        const isDirectory = item.dataset.isDirectory === 'true';
-                        const isEditable = item.dataset.isEditable === 'true';
-                        
-                        if (isDirectory) {{
-                            this.loadDirectory(path);
-                        }} else if (isEditable) {{
-                            this.loadFile(path);
-                        }}
-                    }});
-                    
-                    item.addEventListener('contextmenu', (e) => {{
-                        e.preventDefault();
-                        this.showContextMenu(e, item.dataset.path, item.dataset.isDirectory === 'true');
-                    }});
-                }});
-            }}
+                // Large directories only keep the rows near the viewport in the DOM.
+                // A spacer holds the full scroll height; the window slides inside it.
+                const spacer = document.createElement('div');
+                spacer.style.position = 'relative';
+                this.fileWindow = document.createElement('div');
+                spacer.appendChild(this.fileWindow);
+                this.fileList.replaceChildren(spacer);
+                
+                this.fileWindow.appendChild(this.buildFileRow(items[0]));
+                this.rowHeight = this.fileWindow.firstElementChild.offsetHeight || 40;
+                spacer.style.height = `${items.length * this.rowHeight}px`;
+                this.windowStart = this.windowEnd = -1;
+                this.renderFileWindow();
+            }
             
-            renderBreadcrumb(currentPath, parentPath) {{
-                const pathParts = currentPath.split('/').filter(part => part !== '');
-                const isRoot = pathParts.length === 0;
+            buildFileRow(item) {
+                // Clone the template row; textContent keeps file names from being
+                // parsed as HTML. Clicks are handled by the delegated listeners on
+                // fileList (see setupEventListeners).
+                const row = this.fileItemTemplate.cloneNode(true);
+                row.dataset.path = item.path;
+                row.dataset.isDirectory = item.is_directory;
+                row.dataset.isEditable = item.is_editable;
                 
-                let breadcrumbHtml = '';
+                const icon = row.querySelector('.file-icon');
+                icon.appendChild((item.is_directory ? this.directoryIcon : this.fileIcon).cloneNode(true));
+                if (item.is_directory) {
+                    icon.classList.add('directory');
+                } else if (item.is_editable) {
+                    icon.classList.add('editable');
+                }
+                row.querySelector('.file-name').textContent = item.name;
+                row.querySelector('.file-meta').textContent = this.formatItemMeta(item);
+                return row;
+            }
+            
+            scheduleFileWindow() {
+                if (!this.fileWindow || this.fileWindowFrame) return;
+                this.fileWindowFrame = requestAnimationFrame(() => {
+                    this.fileWindowFrame = null;
+                    this.renderFileWindow();
+                });
+            }
+            
+            renderFileWindow() {
+                if (!this.fileWindow) return;
                 
-                if (isRoot) {{
-                    breadcrumbHtml = '<div class="breadcrumb-current">Root</div>';
-                }} else {{
-                    // Build path parts
-                    let currentBuildPath = '';
-                    pathParts.forEach((part, index) => {{
-                        currentBuildPath += '/' + part;
-                        const isLast = index === pathParts.length - 1;
-                        
-                        if (isLast) {{
-                            breadcrumbHtml += `<div class="breadcrumb-current">${{part}}</div>`;
-                        }} else {{
-                            breadcrumbHtml += `
-                                <div class="breadcrumb-item">
-                                    <a href="#" class="breadcrumb-link" data-path="${{currentBuildPath}}">${{part}}</a>
-                                    <span class="breadcrumb-separator">›</span>
-                                </div>
-                            `;
-                        }}
-                    }});
+                const scroller = this.fileList.parentElement;
+                const spacer = this.fileWindow.parentElement;
+                const scrolled = scroller.getBoundingClientRect().top - spacer.getBoundingClientRect().top;
+                const overscan = 10;
+                const start = Math.max(0, Math.floor(scrolled / this.rowHeight) - overscan);
+                const end = Math.min(this.fileItems.length, Math.ceil((scrolled + scroller.clientHeight) / this.rowHeight) + overscan);
+                if (start === this.windowStart && end === this.windowEnd) return;
+                this.windowStart = start;
+                this.windowEnd = end;
+                
+                const fragment = document.createDocumentFragment();
+                for (let i = start; i < end; i++) {
+                    fragment.appendChild(this.buildFileRow(this.fileItems[i]));
+                }
+                this.fileWindow.style.transform = `translateY(${start * this.rowHeight}px)`;
+                this.fileWindow.replaceChildren(fragment);
+            }
+            
+            formatItemMeta(item) {
+                const sizeText = item.is_directory ? 'Directory' : this.formatFileSize(item.size);
+                return `${sizeText} • ${this.dateFormat.format(new Date(item.modified))}`;
+            }
+            
+            async refreshMetadata(paths) {
+                // Refresh size/modified for rows already on screen with one request
+                const rows = paths
+                    .map(path => this.fileList.querySelector(`.file-item[data-path="${CSS.escape(path)}"]`))
+                    .filter(row => row);
+                if (rows.length === 0) return;
+                
+                try {
+                    const response = await fetch('/api/filesystem/metadata-batch', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify({ paths: rows.map(row => row.dataset.path) })
+                    });
+                    if (!response.ok) return;
+                    const metadata = await response.json();
                     
-                    // Add home link at beginning
-                    breadcrumbHtml = `
-                        <div class="breadcrumb-item">
-                            <a href="#" class="breadcrumb-link" data-path="/">Home</a>
-                            <span class="breadcrumb-separator">›</span>
-                        </div>
-                    ` + breadcrumbHtml;
-                }}
+                    // Windowed lists rebuild rows from fileItems as they scroll
+                    this.fileItems = this.fileItems.map(item => metadata[item.path] || item);
+                    rows.forEach(row => {
+                        const item = metadata[row.dataset.path];
+                        if (item) {
+                            row.querySelector('.file-meta').textContent = this.formatItemMeta(item);
+                        }
+                    });
+                } catch (error) {
+                    // Stale metadata is harmless; the next listing corrects it
+                }
+            }
+            
+            renderBreadcrumb(currentPath, parentPath) {
+                // Re-renders of the same directory keep the existing trail
+                if (currentPath === this.breadcrumbPath) return;
+                this.breadcrumbPath = currentPath;
                 
-                this.breadcrumb.innerHTML = breadcrumbHtml;
+                // Names go in through textContent so they are never parsed as HTML
+                const fragment = document.createDocumentFragment();
+                const addLink = (label, path) => {
+                    const item = this.breadcrumbItem.cloneNode(true);
+                    item.firstElementChild.textContent = label;
+                    item.firstElementChild.dataset.path = path;
+                    fragment.appendChild(item);
+                };
+                const addCurrent = (label) => {
+                    const current = this.breadcrumbCurrent.cloneNode(false);
+                    current.textContent = label;
+                    fragment.appendChild(current);
+                };
                 
-                // Add click handlers for breadcrumb navigation
-                this.breadcrumb.querySelectorAll('.breadcrumb-link').forEach(link => {{
-                    link.addEventListener('click', (e) => {{
-                        e.preventDefault();
-                        const path = link.dataset.path;
-                        this.loadDirectory(path);
-                    }});
-                }});
-            }}
+                const pathParts = currentPath.split('/').filter(part => part !== '');
+                if (pathParts.length === 0) {
+                    addCurrent('Root');
+                } else {
+                    addLink('Home', '/');
+                    let buildPath = '';
+                    const last = pathParts.length - 1;
+                    for (let i = 0; i < last; i++) {
+                        buildPath += '/' + pathParts[i];
+                        addLink(pathParts[i], buildPath);
+                    }
+                    addCurrent(pathParts[last]);
+                }
+                this.breadcrumb.replaceChildren(fragment);
+            }
+            
+            withPath(url, path) {
+                // fetch() and window.open() copy the URL, so the shared object can be reused
+                url.searchParams.set('path', path);
+                return url.href;
+            }
             
-            async loadFile(path) {{
-                try {{
-                    const response = await fetch(`/api/filesystem/read?path=${{encodeURIComponent(path)}}`);
+            loadFile(path) {
+                // A second click on the file being loaded reuses the running load;
+                // any other file supersedes it
+                if (this.activeLoad && this.activeLoad.path === path) {
+                    return this.activeLoad.promise;
+                }
+                if (this.activeLoad) this.activeLoad.controller.abort();
+                
+                const load = { path, controller: new AbortController() };
+                this.activeLoad = load;
+                this.contentLoading = false;
+                clearTimeout(this.autosaveTimer);
+                this.autosaveTimer = null;
+                this.savedContent = null;
+                this.baseHash = null;
+                load.promise = this.fetchFile(load).finally(() => {
+                    if (this.activeLoad === load) this.activeLoad = null;
+                });
+                return load.promise;
+            }
+            
+            async fetchFile(load) {
+                const path = load.path;
+                
+                // Fetch the body as a raw text stream alongside the metadata so the
+                // editor can fill progressively
+                const bodyRequest = fetch(this.withPath(this.rawUrl, path), { signal: load.controller.signal });
+                bodyRequest.catch(() => {});
+                
+                try {
+                    const response = await fetch(this.withPath(this.metaUrl, path), { signal: load.controller.signal });
                     const data = await response.json();
+                    if (this.activeLoad !== load) return;
                     
-                    if (!response.ok) {{
+                    if (!response.ok) {
+                        load.controller.abort();
+                        // The listing couldn't tell and the content turned out not to be text
+                        if (response.status === 415) {
+                            window.open(this.withPath(this.rawUrl, path), '_blank');
+                            return;
+                        }
                         // Handle permission denied or file not found
-                        if (response.status === 403 || response.status === 404) {{
+                        if (response.status === 403 || response.status === 404) {
                             // Show permission denied message instead of editor
                             this.currentFile = null;
                             this.editor.value = '';
+                            this.lineStarts = null;
                             this.isModified = false;
                             this.updateUI();
                             
@@ -1175,50 +2012,54 @@ def generate_editor_html(initial_path: str = None) -> str:
                                         <path d="M12 9v2m0 4h.01M21 12a9 9 0 11-18 0 9 9 0 0118 0z"/>
                                     </svg>
                                     <h3 style="color: #374151; font-size: 18px; margin: 0 0 8px 0; font-weight: 600;">
-                                        ${{title}}
+                                        ${title}
                                     </h3>
                                     <p style="color: #6b7280; font-size: 14px; margin: 0; max-width: 400px;">
-                                        ${{message}}
+                                        ${message}
                                     </p>
                                 </div>
                             `;
                             return;
-                        }}
+                        }
                         throw new Error(data.detail || 'Failed to load file');
-                    }}
+                    }
                     
                     this.currentFile = data;
-                    this.editor.value = data.content;
+                    this.editor.value = '';
+                    this.lineStarts = null;
                     this.isModified = false;
+                    const largeFile = data.size > this.largeFileThreshold;
+                    this.editor.classList.toggle('large-file', largeFile);
+                    this.editor.wrap = largeFile ? 'off' : 'soft';
                     this.isReadOnly = !data.can_write;
                     this.isUncertainPermissions = false;
                     
                     // Check if this is a file in someone else datasite (uncertain permissions)
                     const pathStr = data.path || path;
-                    if (pathStr.includes('/SyftBox/datasites/') && data.write_users && data.write_users.length > 0) {{
+                    if (pathStr.includes('/SyftBox/datasites/') && data.write_users && data.write_users.length > 0) {
                         // If we marked it as read-only but it is not our datasite, we are uncertain
                         const pathParts = pathStr.split('/');
                         const dsIdx = pathParts.indexOf('datasites');
-                        if (dsIdx >= 0 && pathParts.length > dsIdx + 1) {{
+                        if (dsIdx >= 0 && pathParts.length > dsIdx + 1) {
                             const datasite = pathParts[dsIdx + 1];
                             // Get current user email from somewhere (might need to add this to API)
                             // For now, if it is marked read-only and has write_users, it is uncertain
-                            if (this.isReadOnly && !data.write_users.includes('*')) {{
+                            if (this.isReadOnly && !data.write_users.includes('*')) {
                                 this.isUncertainPermissions = true;
                                 this.isReadOnly = false; // Allow editing, but with warning
-                            }}
-                        }}
-                    }}
+                            }
+                        }
+                    }
                     
                     // Set editor state based on permissions
                     this.editor.readOnly = this.isReadOnly;
-                    if (this.isReadOnly) {{
+                    if (this.isReadOnly) {
                         this.editor.style.backgroundColor = '#f9fafb';
-                    }} else if (this.isUncertainPermissions) {{
+                    } else if (this.isUncertainPermissions) {
                         this.editor.style.backgroundColor = '#fffbeb'; // Light yellow warning color
-                    }} else {{
+                    } else {
                         this.editor.style.backgroundColor = '#ffffff';
-                    }}
+                    }
                     
                     this.updateUI();
                     
@@ -1227,13 +2068,13 @@ def generate_editor_html(initial_path: str = None) -> str:
                     this.editor.style.display = 'block';
                     
                     // Update file info with appropriate indicator
-                    let badge = '';
-                    if (this.isReadOnly) {{
-                        badge = ' <span style="color: #dc2626; font-weight: 600;">[READ-ONLY]</span>';
-                    }} else if (this.isUncertainPermissions) {{
-                        badge = ' <span style="color: #f59e0b; font-weight: 600;">[UNCERTAIN PERMISSIONS]</span>';
-                    }}
-                    this.fileInfo.innerHTML = `${{path.split('/').pop()}} (${{data.extension}})${{badge}}`;
+                    this.fileInfo.textContent = `${path.split('/').pop()} (${data.extension})`;
+                    if (this.isReadOnly || this.isUncertainPermissions) {
+                        const badge = document.createElement('span');
+                        badge.style.cssText = `color: ${this.isReadOnly ? '#dc2626' : '#f59e0b'}; font-weight: 600;`;
+                        badge.textContent = this.isReadOnly ? '[READ-ONLY]' : '[UNCERTAIN PERMISSIONS]';
+                        this.fileInfo.append(' ', badge);
+                    }
                     this.fileSize.textContent = this.formatFileSize(data.size);
                     
                     // Remove any existing permission warnings
@@ -1241,7 +2082,7 @@ def generate_editor_html(initial_path: str = None) -> str:
                     existingWarnings.forEach(w => w.remove());
                     
                     // Show permission info
-                    if (this.isReadOnly && data.write_users && data.write_users.length > 0) {{
+                    if (this.isReadOnly && data.write_users && data.write_users.length > 0) {
                         const permissionInfo = document.createElement('div');
                         permissionInfo.className = 'permission-warning';
                         permissionInfo.style.cssText = `
@@ -1255,10 +2096,11 @@ def generate_editor_html(initial_path: str = None) -> str:
                         `;
                         permissionInfo.innerHTML = `
                             <strong>⚠️ Read-Only:</strong> You don't have write permission for this file. 
-                            Only <strong>${{data.write_users.join(', ')}}</strong> can edit this file.
+                            Only <strong class="write-users"></strong> can edit this file.
                         `;
+                        permissionInfo.querySelector('.write-users').textContent = data.write_users.join(', ');
                         this.editor.parentElement.insertBefore(permissionInfo, this.editor);
-                    }} else if (this.isUncertainPermissions) {{
+                    } else if (this.isUncertainPermissions) {
                         const permissionInfo = document.createElement('div');
                         permissionInfo.className = 'permission-warning';
                         permissionInfo.id = 'uncertain-permissions-warning';
@@ -1277,46 +2119,100 @@ def generate_editor_html(initial_path: str = None) -> str:
                             If you don't have permission, a conflict file will be created.
                         `;
                         this.editor.parentElement.insertBefore(permissionInfo, this.editor);
-                    }}
+                    }
                     
                     // Update read-only indicator in footer
-                    if (this.readOnlyIndicator) {{
-                        if (this.isReadOnly) {{
+                    if (this.readOnlyIndicator) {
+                        if (this.isReadOnly) {
                             this.readOnlyIndicator.textContent = 'READ-ONLY';
                             this.readOnlyIndicator.style.color = '#dc2626';
                             this.readOnlyIndicator.style.display = 'inline';
-                        }} else if (this.isUncertainPermissions) {{
+                        } else if (this.isUncertainPermissions) {
                             this.readOnlyIndicator.textContent = 'UNCERTAIN PERMISSIONS';
                             this.readOnlyIndicator.style.color = '#f59e0b';
                             this.readOnlyIndicator.style.display = 'inline';
-                        }} else {{
+                        } else {
                             this.readOnlyIndicator.style.display = 'none';
-                        }}
-                    }}
+                        }
+                    }
+                    
+                    const exact = await this.streamFileContent(load, await bodyRequest);
+                    if (this.activeLoad !== load) return;
+                    this.buildLineIndex();
+                    this.setSavedContent(this.editor.value, exact);
                     
                     // Focus editor
                     this.editor.focus();
                     
-                }} catch (error) {{
+                } catch (error) {
+                    if (error.name === 'AbortError' || this.activeLoad !== load) return;
                     this.showError('Failed to load file: ' + error.message);
-                }}
-            }}
+                }
+            }
+            
+            async streamFileContent(load, response) {
+                // Resolves true when the editor holds the file's exact text, false
+                // when decoding dropped a BOM or the textarea normalized CRLFs
+                if (!response.ok) {
+                    throw new Error(response.statusText || 'Failed to load file');
+                }
+                
+                // Keep the buffer read-only until the whole file is in
+                const readOnly = this.editor.readOnly;
+                this.editor.readOnly = true;
+                this.contentLoading = true;
+                try {
+                    const reader = response.body.getReader();
+                    const decoder = new TextDecoder('utf-8', { fatal: true, ignoreBOM: true });
+                    const parts = [];
+                    let lastPaint = 0;
+                    while (true) {
+                        const { done, value } = await reader.read();
+                        if (this.activeLoad !== load) {
+                            reader.cancel();
+                            return;
+                        }
+                        if (done) break;
+                        parts.push(decoder.decode(value, { stream: true }));
+                        
+                        // Paint the first chunk right away, then at most a few times a second
+                        const now = performance.now();
+                        if (lastPaint === 0 || now - lastPaint > 250) {
+                            this.editor.value = parts.join('');
+                            this.lineStarts = null;
+                            lastPaint = now;
+                        }
+                    }
+                    parts.push(decoder.decode());
+                    let text = parts.join('');
+                    const hadBom = text.charCodeAt(0) === 0xFEFF;
+                    if (hadBom) text = text.slice(1);
+                    this.editor.value = text;
+                    this.lineStarts = null;
+                    return !hadBom && this.editor.value === text;
+                } finally {
+                    if (this.activeLoad === load) {
+                        this.editor.readOnly = readOnly;
+                        this.contentLoading = false;
+                    }
+                }
+            }
             
-            async saveFile() {{
-                if (!this.currentFile) return;
+            async saveFile() {
+                if (!this.currentFile || this.contentLoading) return;
                 
                 // Check if file is read-only
-                if (this.isReadOnly) {{
+                if (this.isReadOnly) {
                     this.showError('Cannot save: This file is read-only. You don\\'t have write permission.');
                     return;
-                }}
+                }
                 
                 // Check if we have uncertain permissions
-                if (this.isUncertainPermissions) {{
+                if (this.isUncertainPermissions) {
                     // Show modal to confirm save attempt
                     const userConfirmed = await this.showPermissionModal();
                     if (!userConfirmed) return; // User cancelled
-                }}
+                }
                 
                 // Animate the save button with rainbow effect
                 this.saveBtn.classList.add('saving');
@@ -1342,88 +2238,219 @@ def generate_editor_html(initial_path: str = None) -> str:
                 document.body.appendChild(notification);
                 
                 // Add the animation style if not already present
-                if (!document.getElementById('save-animation-style')) {{
+                if (!document.getElementById('save-animation-style')) {
                     const style = document.createElement('style');
                     style.id = 'save-animation-style';
                     style.textContent = `
-                        @keyframes saveNotification {{
-                            0% {{
+                        @keyframes saveNotification {
+                            0% {
                                 background: #ffcccc;
                                 border: 2px solid #ffb3b3;
                                 opacity: 0;
                                 transform: translate(-50%, -50%) scale(0.8);
-                            }}
-                            10% {{
+                            }
+                            10% {
                                 opacity: 1;
                                 transform: translate(-50%, -50%) scale(1);
-                            }}
-                            20% {{ background: #ffd9b3; border-color: #ffc299; }}
-                            30% {{ background: #ffffcc; border-color: #ffffb3; }}
-                            40% {{ background: #ccffcc; border-color: #b3ffb3; }}
-                            50% {{ background: #ccffff; border-color: #b3ffff; }}
-                            60% {{ background: #ccccff; border-color: #b3b3ff; }}
-                            70% {{ background: #ffccff; border-color: #ffb3ff; }}
-                            80% {{ background: #dcfce7; border-color: #bbf7d0; }}
-                            90% {{
+                            }
+                            20% { background: #ffd9b3; border-color: #ffc299; }
+                            30% { background: #ffffcc; border-color: #ffffb3; }
+                            40% { background: #ccffcc; border-color: #b3ffb3; }
+                            50% { background: #ccffff; border-color: #b3ffff; }
+                            60% { background: #ccccff; border-color: #b3b3ff; }
+                            70% { background: #ffccff; border-color: #ffb3ff; }
+                            80% { background: #dcfce7; border-color: #bbf7d0; }
+                            90% {
                                 opacity: 1;
                                 transform: translate(-50%, -50%) scale(1);
-                            }}
-                            100% {{
+                            }
+                            100% {
                                 background: #dcfce7;
                                 border-color: #bbf7d0;
                                 opacity: 0;
                                 transform: translate(-50%, -50%) scale(1.1);
-                            }}
-                        }}
+                            }
+                        }
                     `;
                     document.head.appendChild(style);
-                }}
+                }
                 
-                setTimeout(() => {{
+                setTimeout(() => {
                     this.saveBtn.style.transform = '';
                     this.saveBtn.classList.remove('saving');
-                }}, 1000);
+                }, 1000);
                 
-                try {{
-                    const response = await fetch('/api/filesystem/write', {{
-                        method: 'POST',
-                        headers: {{
-                            'Content-Type': 'application/json',
-                        }},
-                        body: JSON.stringify({{
-                            path: this.currentFile.path,
-                            content: this.editor.value
-                        }})
-                    }});
-                    
-                    const data = await response.json();
-                    
-                    if (!response.ok) {{
-                        throw new Error(data.detail || 'Failed to save file');
-                    }}
+                try {
+                    const content = this.editor.value;
+                    const data = await this.persist(this.currentFile.path, content, true);
                     
-                    this.isModified = false;
+                    this.isModified = this.editor.value !== content;
                     this.updateUI();
                     // Update notification to show success
                     const notification = document.querySelector('div[style*="saveNotification"]');
-                    if (notification) {{
+                    if (notification) {
                         notification.textContent = '✅ Saved!';
                         setTimeout(() => notification.remove(), 500);
-                    }}
+                    }
                     
                     this.showSuccess('File saved successfully');
                     
                     // Update file info
                     this.fileSize.textContent = this.formatFileSize(data.size);
+                    this.invalidateDirectory(this.parentPath(data.path));
+                    this.refreshMetadata([data.path]);
                     
-                }} catch (error) {{
+                } catch (error) {
                     this.showError('Failed to save file: ' + error.message);
-                }}
-            }}
+                }
+            }
             
-            updateUI() {{
+            scheduleAutosave() {
+                clearTimeout(this.autosaveTimer);
+                this.autosaveTimer = null;
+                // Only files with a known base autosave; the rest wait for an explicit save
+                if (!this.currentFile || this.isReadOnly || this.isUncertainPermissions || !this.baseHash) return;
+                this.autosaveTimer = setTimeout(() => this.autosave(), this.autosaveDelayMs);
+            }
+            
+            flushAutosave() {
+                // sendBeacon survives the unload; it caps the body at ~64KB and
+                // returns false past that, leaving the edit unsaved as before.
+                // It goes out as a patch so a stale base is still refused with a
+                // 409, and never alongside a save that may move the base.
+                if (!this.autosaveTimer) return;
+                clearTimeout(this.autosaveTimer);
+                this.autosaveTimer = null;
+                if (!this.currentFile || !this.isModified || this.contentLoading || this.saveInFlight) return;
+                if (this.savedContent === null || !this.baseHash) return;
+                const op = this.diffText(this.savedContent, this.editor.value);
+                if (!op) return;
+                const body = JSON.stringify({ path: this.currentFile.path, base_hash: this.baseHash, ops: [op] });
+                navigator.sendBeacon('/api/filesystem/patch', new Blob([body], { type: 'application/json' }));
+            }
+            
+            async autosave() {
+                this.autosaveTimer = null;
+                if (!this.currentFile || !this.isModified || this.contentLoading || !this.baseHash) return;
+                const file = this.currentFile;
+                const content = this.editor.value;
+                try {
+                    const data = await this.persist(file.path, content, false);
+                    if (this.currentFile !== file) return;
+                    this.isModified = this.editor.value !== content;
+                    this.updateUI();
+                    this.fileSize.textContent = this.formatFileSize(data.size);
+                    this.invalidateDirectory(this.parentPath(data.path));
+                    this.refreshMetadata([data.path]);
+                } catch (error) {
+                    // Leave the buffer dirty; an explicit save reports the error
+                    if (error.conflict && this.currentFile === file) {
+                        // Drop the base so autosave stops until Save overwrites on purpose
+                        this.baseHash = null;
+                        this.showError('This file changed on disk since it was opened. Autosave is paused; save to overwrite it.');
+                        return;
+                    }
+                    console.warn('Autosave failed:', error);
+                }
+            }
+            
+            persist(path, content, overwrite) {
+                // Saves run one at a time so each patch applies to the previous result
+                this.saveInFlight++;
+                const run = this.saveQueue.then(() => this.sendSave(path, content, overwrite));
+                this.saveQueue = run.catch(() => {}).then(() => { this.saveInFlight--; });
+                return run;
+            }
+            
+            async sendSave(path, content, overwrite) {
+                // Only an explicit save (overwrite) may replace a file that changed
+                // on disk; autosave stops at the 409
+                let data = null;
+                const base = this.currentFile && this.currentFile.path === path ? this.savedContent : null;
+                const canPatch = base !== null && !!this.baseHash;
+                if (!canPatch && !overwrite) {
+                    const error = new Error('No saved version to patch against');
+                    error.conflict = true;
+                    throw error;
+                }
+                if (canPatch) {
+                    const op = this.diffText(base, content);
+                    const response = await fetch('/api/filesystem/patch', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({ path, base_hash: this.baseHash, ops: op ? [op] : [] })
+                    });
+                    if (response.ok) {
+                        data = await response.json();
+                    } else if (response.status === 409 && !overwrite) {
+                        const error = new Error('File changed on disk');
+                        error.conflict = true;
+                        throw error;
+                    } else if (response.status !== 409 && response.status !== 422) {
+                        const error = await response.json();
+                        throw new Error(error.detail || 'Failed to save file');
+                    }
+                }
+                
+                // No usable base, the ops didn't apply, or an explicit save over a
+                // newer file: send the whole buffer
+                if (!data) {
+                    const response = await fetch('/api/filesystem/write', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({ path, content })
+                    });
+                    data = await response.json();
+                    if (!response.ok) {
+                        throw new Error(data.detail || 'Failed to save file');
+                    }
+                }
+                
+                if (this.currentFile && this.currentFile.path === path) {
+                    this.savedContent = content;
+                    this.baseHash = data.sha256 || null;
+                }
+                return data;
+            }
+            
+            diffText(base, text) {
+                // A single replace covering everything between the common prefix and
+                // suffix, in UTF-16 code units, never splitting a surrogate pair
+                const limit = Math.min(base.length, text.length);
+                let start = 0;
+                while (start < limit && base.charCodeAt(start) === text.charCodeAt(start)) start++;
+                if (start === base.length && start === text.length) return null;
+                if (start > 0 && (base.charCodeAt(start - 1) & 0xFC00) === 0xD800) start--;
+                
+                let baseEnd = base.length;
+                let textEnd = text.length;
+                while (baseEnd > start && textEnd > start && base.charCodeAt(baseEnd - 1) === text.charCodeAt(textEnd - 1)) {
+                    baseEnd--;
+                    textEnd--;
+                }
+                if (baseEnd < base.length && (base.charCodeAt(baseEnd) & 0xFC00) === 0xDC00) {
+                    baseEnd++;
+                    textEnd++;
+                }
+                return { offset: start, delete: baseEnd - start, insert: text.slice(start, textEnd) };
+            }
+            
+            async setSavedContent(content, exact = true) {
+                // Hash what the editor holds. When that isn't the bytes on disk (a
+                // BOM, CRLF line endings) there is no base: autosave stays off and
+                // Save writes the whole file, after which the server's hash is used
+                this.savedContent = content;
+                this.baseHash = null;
+                if (!exact || !(window.crypto && crypto.subtle)) return;
+                const file = this.currentFile;
+                const digest = await crypto.subtle.digest('SHA-256', new TextEncoder().encode(content));
+                if (this.currentFile !== file || this.savedContent !== content) return;
+                this.baseHash = Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join('');
+            }
+            
+            updateUI() {
                 const title = this.currentFile ? 
-                    `${{this.currentFile.path.split('/').pop()}}${{this.isModified ? ' •' : ''}}${{this.isReadOnly ? ' [READ-ONLY]' : ''}}` : 
+                    `${this.currentFile.path.split('/').pop()}${this.isModified ? ' •' : ''}${this.isReadOnly ? ' [READ-ONLY]' : ''}` : 
                     'No file selected';
                 
                 this.editorTitle.textContent = title;
@@ -1432,146 +2459,276 @@ def generate_editor_html(initial_path: str = None) -> str:
                 this.saveBtn.disabled = !this.currentFile || !this.isModified || this.isReadOnly;
                 
                 // Update save button appearance for read-only
-                if (this.isReadOnly) {{
+                if (this.isReadOnly) {
                     this.saveBtn.style.opacity = '0.5';
                     this.saveBtn.style.cursor = 'not-allowed';
                     this.saveBtn.title = 'File is read-only';
-                }} else {{
+                } else {
                     this.saveBtn.style.opacity = '';
                     this.saveBtn.style.cursor = '';
                     this.saveBtn.title = 'Save file (Ctrl+S)';
-                }}
-            }}
+                }
+            }
+            
+            scheduleCursorPosition() {
+                // Held keys fire many keyups per frame; update the status bar once
+                if (this.cursorFrame) return;
+                this.cursorFrame = requestAnimationFrame(() => {
+                    this.cursorFrame = null;
+                    this.updateCursorPosition();
+                });
+            }
             
-            updateCursorPosition() {{
-                const textarea = this.editor;
-                const text = textarea.value;
-                const cursorPos = textarea.selectionStart;
+            buildLineIndex() {
+                // Offsets at which each line starts, so cursor moves can binary search
+                const text = this.editor.value;
+                const starts = [0];
+                for (let i = text.indexOf('\\n'); i !== -1; i = text.indexOf('\\n', i + 1)) {
+                    starts.push(i + 1);
+                }
+                this.lineStarts = Uint32Array.from(starts);
+            }
+            
+            lineSafeEdit(e) {
+                // Typing and single-character deletes that neither add nor remove a
+                // newline only move the line starts after the edit. Anything else
+                // (paste, undo, IME, word deletes) drops the index for a rebuild.
+                const { selectionStart: start, selectionEnd: end } = this.editor;
+                let from = start;
+                let to = end;
+                if (e.inputType === 'insertText') {
+                    if (e.data === null || e.data.includes('\\n')) return null;
+                } else if (start === end && e.inputType === 'deleteContentBackward') {
+                    // Two code units covers a surrogate pair
+                    from = Math.max(0, start - 2);
+                } else if (start === end && e.inputType === 'deleteContentForward') {
+                    to = start + 2;
+                } else if (start === end || !e.inputType.startsWith('delete')) {
+                    return null;
+                }
+                if (this.editor.value.slice(from, to).includes('\\n')) return null;
+                return { from, length: this.editor.textLength };
+            }
+            
+            updateLineIndex() {
+                const edit = this.pendingEdit;
+                this.pendingEdit = null;
+                if (!edit || !this.lineStarts) {
+                    this.lineStarts = null;
+                    return;
+                }
+                // No line starts inside the edited range, so every start past it
+                // shifts by the change in length
+                const delta = this.editor.textLength - edit.length;
+                const starts = this.lineStarts;
+                for (let i = starts.length - 1; i > 0 && starts[i] > edit.from; i--) {
+                    starts[i] += delta;
+                }
+            }
+            
+            scheduleLineIndex() {
+                // Rebuild after edits once the user pauses rather than on every keystroke
+                if (this.lineIndexPending) return;
+                this.lineIndexPending = true;
+                const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+                whenIdle(() => {
+                    this.lineIndexPending = false;
+                    this.buildLineIndex();
+                });
+            }
+            
+            updateCursorPosition() {
+                const cursorPos = this.editor.selectionStart;
                 
-                // Calculate line and column
-                const lines = text.substring(0, cursorPos).split('\\n');
-                const line = lines.length;
-                const col = lines[lines.length - 1].length + 1;
+                if (this.lineStarts) {
+                    // Last line start at or before the cursor
+                    const starts = this.lineStarts;
+                    let lo = 0;
+                    let hi = starts.length - 1;
+                    while (lo < hi) {
+                        const mid = (lo + hi + 1) >> 1;
+                        if (starts[mid] <= cursorPos) {
+                            lo = mid;
+                        } else {
+                            hi = mid - 1;
+                        }
+                    }
+                    this.cursorPosition.textContent = `Ln ${lo + 1}, Col ${cursorPos - starts[lo] + 1}`;
+                    return;
+                }
                 
-                this.cursorPosition.textContent = `Ln ${{line}}, Col ${{col}}`;
-            }}
-            
-            formatFileSize(bytes) {{
-                if (bytes === 0) return '0 bytes';
+                // The index is stale after an edit: scan this time and rebuild when idle
+                this.scheduleLineIndex();
+                const text = this.editor.value;
                 
-                const k = 1024;
+                // Count newlines before the cursor without copying or splitting the text
+                let line = 1;
+                let lastNewline = -1;
+                for (let i = text.indexOf('\\n'); i !== -1 && i < cursorPos; i = text.indexOf('\\n', i + 1)) {
+                    line++;
+                    lastNewline = i;
+                }
+                const col = cursorPos - lastNewline;
+                
+                this.cursorPosition.textContent = `Ln ${line}, Col ${col}`;
+            }
+            
+            formatFileSize(bytes) {
                 const sizes = ['bytes', 'KB', 'MB', 'GB'];
-                const i = Math.floor(Math.log(bytes) / Math.log(k));
+                let i = 0;
+                while (bytes >= 1024 && i < sizes.length - 1) {
+                    bytes /= 1024;
+                    i++;
+                }
                 
-                return parseFloat((bytes / Math.pow(k, i)).toFixed(2)) + ' ' + sizes[i];
-            }}
+                return (i ? parseFloat(bytes.toFixed(2)) : bytes) + ' ' + sizes[i];
+            }
             
-            showError(message) {{
-                const errorDiv = document.createElement('div');
-                errorDiv.className = 'error';
-                errorDiv.textContent = message;
-                document.body.appendChild(errorDiv);
+            showToast(className, message, duration) {
+                const toast = this.toastPool.pop() || document.createElement('div');
+                toast.className = className;
+                toast.style.animation = '';
+                toast.textContent = message;
+                this.toastHost.appendChild(toast);
                 
-                setTimeout(() => {{
-                    errorDiv.remove();
-                }}, 5000);
-            }}
+                this.toastQueue.push({ node: toast, expiresAt: performance.now() + duration, leaving: false });
+                if (!this.toastTimer) {
+                    this.toastTimer = setInterval(() => this.sweepToasts(), 250);
+                }
+            }
+            
+            sweepToasts() {
+                // Expired toasts slide out first and are recycled on a later tick
+                const now = performance.now();
+                this.toastQueue = this.toastQueue.filter(entry => {
+                    if (entry.expiresAt > now) return true;
+                    if (!entry.leaving) {
+                        entry.node.style.animation = 'slideOut 0.3s ease-in forwards';
+                        entry.expiresAt = now + 300;
+                        entry.leaving = true;
+                        return true;
+                    }
+                    entry.node.remove();
+                    if (this.toastPool.length < 8) this.toastPool.push(entry.node);
+                    return false;
+                });
+                if (!this.toastQueue.length) {
+                    clearInterval(this.toastTimer);
+                    this.toastTimer = null;
+                }
+            }
+            
+            showError(message) {
+                this.showToast('error', message, 5000);
+            }
+            
+            showSuccess(message) {
+                this.showToast('success', message, 3500);  // Show for 3.5 seconds to see full animation
+            }
+            
+            compareFileItems(a, b) {
+                // Same order as the server: directories first, then case-insensitive name
+                if (a.is_directory !== b.is_directory) return a.is_directory ? -1 : 1;
+                const aName = a.name.toLowerCase();
+                const bName = b.name.toLowerCase();
+                if (aName !== bName) return aName < bName ? -1 : 1;
+                return a.name < b.name ? -1 : (a.name > b.name ? 1 : 0);
+            }
+            
+            setListingItems(items) {
+                this.renderFileList(items);
+                if (this.currentListing) {
+                    this.currentListing = { ...this.currentListing, items, total_items: items.length };
+                    this.cacheDirectory(this.currentListing.path, this.currentListing);
+                }
+            }
             
-            showSuccess(message) {{
-                const successDiv = document.createElement('div');
-                successDiv.className = 'success';
-                successDiv.textContent = message;
-                document.body.appendChild(successDiv);
+            async createItem(name, isDirectory) {
+                const dirPath = this.currentPath;
+                const path = `${dirPath.replace(/\\/$/, '')}/${name}`;
+                const items = this.fileItems || [];
+                if (items.some(item => item.path === path)) {
+                    this.showError(`"${name}" already exists`);
+                    return;
+                }
                 
-                setTimeout(() => {{
-                    successDiv.style.animation = 'slideOut 0.3s ease-in forwards';
-                    setTimeout(() => successDiv.remove(), 300);
-                }}, 3500);  // Show for 3.5 seconds to see full animation
-            }}
+                // Show the new row right away and reconcile with the server's answer
+                const dot = name.lastIndexOf('.');
+                const item = {
+                    name,
+                    path,
+                    is_directory: isDirectory,
+                    is_editable: !isDirectory,
+                    size: isDirectory ? null : 0,
+                    modified: new Date().toISOString(),
+                    extension: isDirectory ? null : (dot > 0 ? name.slice(dot).toLowerCase() : '')
+                };
+                const index = items.findIndex(other => this.compareFileItems(other, item) > 0);
+                const optimistic = items.slice();
+                optimistic.splice(index === -1 ? items.length : index, 0, item);
+                this.setListingItems(optimistic);
+                
+                const stillHere = () => this.currentPath === dirPath;
+                try {
+                    const response = await fetch(isDirectory ? '/api/filesystem/create-directory' : '/api/filesystem/write', {
+                        method: 'POST',
+                        headers: {
+                            'Content-Type': 'application/json',
+                        },
+                        body: JSON.stringify(isDirectory ? { path } : { path, content: '', create_dirs: true })
+                    });
+                    const data = await response.json();
+                    if (!response.ok) {
+                        throw new Error(data.detail || response.statusText);
+                    }
+                    
+                    this.showSuccess(data.message);
+                    if (!stillHere()) {
+                        this.invalidateDirectory(dirPath);
+                    } else if (!isDirectory) {
+                        const saved = { ...item, size: data.size, modified: data.modified };
+                        this.setListingItems(this.fileItems.map(other => other.path === path ? saved : other));
+                    }
+                } catch (error) {
+                    if (stillHere()) {
+                        this.setListingItems(this.fileItems.filter(other => other.path !== path));
+                    } else {
+                        this.invalidateDirectory(dirPath);
+                    }
+                    this.showError(`Failed to create ${isDirectory ? 'folder' : 'file'}: ${error.message}`);
+                }
+            }
             
-            createNewFile() {{
+            createNewFile() {
                 const filename = prompt('Enter filename:', 'untitled.txt');
                 if (!filename) return;
-                
-                const newPath = this.currentPath + '/' + filename;
-                
-                // Create empty file
-                fetch('/api/filesystem/write', {{
-                    method: 'POST',
-                    headers: {{
-                        'Content-Type': 'application/json',
-                    }},
-                    body: JSON.stringify({{
-                        path: newPath,
-                        content: '',
-                        create_dirs: true
-                    }})
-                }})
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.message) {{
-                        this.showSuccess(data.message);
-                        this.loadDirectory(this.currentPath);
-                    }}
-                }})
-                .catch(error => {{
-                    this.showError('Failed to create file: ' + error.message);
-                }});
-            }}
+                this.createItem(filename, false);
+            }
             
-            createNewFolder() {{
+            createNewFolder() {
                 const foldername = prompt('Enter folder name:', 'New Folder');
                 if (!foldername) return;
-                
-                const newPath = this.currentPath + '/' + foldername;
-                
-                fetch('/api/filesystem/create-directory', {{
-                    method: 'POST',
-                    headers: {{
-                        'Content-Type': 'application/json',
-                    }},
-                    body: JSON.stringify({{
-                        path: newPath
-                    }})
-                }})
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.message) {{
-                        this.showSuccess(data.message);
-                        this.loadDirectory(this.currentPath);
-                    }}
-                }})
-                .catch(error => {{
-                    this.showError('Failed to create folder: ' + error.message);
-                }});
-            }}
+                this.createItem(foldername, true);
+            }
             
-            toggleFileOnlyMode(forceState = null) {{
-                if (forceState !== null) {{
+            toggleFileOnlyMode(forceState = null) {
+                if (forceState !== null) {
                     this.fileOnlyMode = forceState;
-                }} else {{
+                } else {
                     this.fileOnlyMode = !this.fileOnlyMode;
-                }}
+                }
                 
-                if (this.fileOnlyMode) {{
+                if (this.fileOnlyMode) {
                     document.body.classList.add('file-only-mode');
                     this.toggleExplorerBtn.innerHTML = '<svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 3h6l2 3h10a2 2 0 012 2v10a2 2 0 01-2 2H3a2 2 0 01-2-2V5a2 2 0 012-2z"/></svg> Show';
-                }} else {{
+                } else {
                     document.body.classList.remove('file-only-mode');
                     this.toggleExplorerBtn.innerHTML = '<svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2"><path d="M3 3h6l2 3h10a2 2 0 012 2v10a2 2 0 01-2 2H3a2 2 0 01-2-2V5a2 2 0 012-2z"/></svg>';
-                }}
-            }}
-            
-            showError(message) {{
-                alert('Error: ' + message);
-            }}
-            
-            showSuccess(message) {{
-                console.log('Success: ' + message);
-            }}
+                }
+            }
             
-            async showPermissionModal() {{
-                return new Promise((resolve) => {{
+            async showPermissionModal() {
+                return new Promise((resolve) => {
                     // Create modal overlay
                     const overlay = document.createElement('div');
                     overlay.style.cssText = `
@@ -1617,7 +2774,7 @@ def generate_editor_html(initial_path: str = None) -> str:
                             </p>
                             <p style="margin: 0;">
                                 <strong>If you don't have permission:</strong> A conflict file 
-                                (<code style="background: #f3f4f6; padding: 2px 4px; border-radius: 3px;">${{fileName}}.syftconflict${{fileExt}}</code>) 
+                                (<code class="conflict-name" style="background: #f3f4f6; padding: 2px 4px; border-radius: 3px;"></code>) 
                                 will be created with your changes.
                             </p>
                         </div>
@@ -1650,66 +2807,137 @@ def generate_editor_html(initial_path: str = None) -> str:
                             </button>
                         </div>
                     `;
+                    modal.querySelector('.conflict-name').textContent = `${fileName}.syftconflict${fileExt}`;
                     
                     overlay.appendChild(modal);
                     document.body.appendChild(overlay);
                     
                     // Add animation styles if not present
-                    if (!document.getElementById('modal-animations')) {{
+                    if (!document.getElementById('modal-animations')) {
                         const style = document.createElement('style');
                         style.id = 'modal-animations';
                         style.textContent = `
-                            @keyframes fadeIn {{
-                                from {{ opacity: 0; }}
-                                to {{ opacity: 1; }}
-                            }}
-                            @keyframes slideIn {{
-                                from {{ transform: translateY(-20px); opacity: 0; }}
-                                to {{ transform: translateY(0); opacity: 1; }}
-                            }}
+                            @keyframes fadeIn {
+                                from { opacity: 0; }
+                                to { opacity: 1; }
+                            }
+                            @keyframes slideIn {
+                                from { transform: translateY(-20px); opacity: 0; }
+                                to { transform: translateY(0); opacity: 1; }
+                            }
                         `;
                         document.head.appendChild(style);
-                    }}
+                    }
                     
                     // Handle button clicks
                     const cancelBtn = modal.querySelector('#cancelSave');
                     const confirmBtn = modal.querySelector('#confirmSave');
                     
-                    const cleanup = () => {{
+                    const cleanup = () => {
                         overlay.style.animation = 'fadeIn 0.2s ease-out reverse';
                         modal.style.animation = 'slideIn 0.2s ease-out reverse';
                         setTimeout(() => overlay.remove(), 200);
-                    }};
+                    };
                     
-                    cancelBtn.addEventListener('click', () => {{
+                    cancelBtn.addEventListener('click', () => {
                         cleanup();
                         resolve(false);
-                    }});
+                    });
                     
-                    confirmBtn.addEventListener('click', () => {{
+                    confirmBtn.addEventListener('click', () => {
                         cleanup();
                         resolve(true);
-                    }});
+                    });
                     
                     // Close on escape key
-                    const escHandler = (e) => {{
-                        if (e.key === 'Escape') {{
+                    const escHandler = (e) => {
+                        if (e.key === 'Escape') {
                             cleanup();
                             resolve(false);
                             document.removeEventListener('keydown', escHandler);
-                        }}
-                    }};
+                        }
+                    };
                     document.addEventListener('keydown', escHandler);
-                }});
-            }}
-        }}
+                });
+            }
+        }
         
         // Initialize the editor when DOM is loaded
-        document.addEventListener('DOMContentLoaded', () => {{
+        document.addEventListener('DOMContentLoaded', () => {
             new FileSystemEditor();
-        }});
+        });
     </script>
 </body>
 </html>"""
+_EDITOR_HTML_PREFIX, _EDITOR_HTML_SUFFIX = _EDITOR_HTML_TEMPLATE.split('@@EDITOR_STATE@@')
+_EDITOR_PAGE_PREFIX = _EDITOR_HTML_PREFIX.encode('utf-8')
+_EDITOR_PAGE_SUFFIX = _EDITOR_HTML_SUFFIX.encode('utf-8')
+
+
+def _deflate(data: bytes, flush_mode: int, level: int = 9) -> bytes:
+    """Raw deflate data with a fresh compressor, ending with flush_mode."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(flush_mode)
+
+
+# A deflate stream is a run of blocks, so independently compressed pieces can be
+# joined as long as all but the last end byte-aligned (a sync flush) and only
+# the last is final. The static halves are compressed once here; a page load
+# only deflates its state lines and extends the CRC.
+_GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+_EDITOR_GZIP_PREFIX = _GZIP_HEADER + _deflate(_EDITOR_PAGE_PREFIX, zlib.Z_SYNC_FLUSH)
+_EDITOR_GZIP_SUFFIX = _deflate(_EDITOR_PAGE_SUFFIX, zlib.Z_FINISH)
+_EDITOR_PREFIX_CRC = zlib.crc32(_EDITOR_PAGE_PREFIX)
+
+
+def _editor_state(initial_path: Optional[str]) -> str:
+    """Script lines carrying the editor's initial state for one page load."""
+    initial_path = initial_path or str(Path.home())
+    
+    # Check if initial_path is a file or directory
+    is_initial_file = False
+    try:
+        path_obj = Path(initial_path)
+        if path_obj.is_file():
+            is_initial_file = True
+            # For files, we'll pass the parent directory as the current path
+            initial_dir = str(path_obj.parent)
+        else:
+            initial_dir = initial_path
+    except:
+        initial_dir = initial_path
+    
+    # Only the editor's initial state varies per request; JSON-encode it so
+    # paths cannot break out of the script block
+    return (
+        f"                this.currentPath = {_js_literal(initial_dir)};\n"
+        f"                this.initialFilePath = {_js_literal(initial_path) if is_initial_file else 'null'};\n"
+        f"                this.isInitialFile = {'true' if is_initial_file else 'false'};\n"
+    )
+
+
+def generate_editor_html(initial_path: Optional[str] = None) -> str:
+    """Generate the HTML for the filesystem code editor."""
+    return _EDITOR_HTML_PREFIX + _editor_state(initial_path) + _EDITOR_HTML_SUFFIX
+
+
+def generate_editor_page(initial_path: Optional[str] = None) -> bytes:
+    """The editor page as UTF-8 bytes, ready to send.
     
-    return html_content 
\ No newline at end of file
+    The static halves are encoded once at import, so a page load only
+    encodes the few state lines instead of the whole ~90 KB document.
+    """
+    return _EDITOR_PAGE_PREFIX + _editor_state(initial_path).encode('utf-8') + _EDITOR_PAGE_SUFFIX
+
+
+def generate_editor_page_gzip(initial_path: Optional[str] = None) -> bytes:
+    """The editor page as a gzip body, assembled from pre-compressed halves."""
+    state = _editor_state(initial_path).encode('utf-8')
+    crc = zlib.crc32(_EDITOR_PAGE_SUFFIX, zlib.crc32(state, _EDITOR_PREFIX_CRC))
+    size = len(_EDITOR_PAGE_PREFIX) + len(state) + len(_EDITOR_PAGE_SUFFIX)
+    return (
+        _EDITOR_GZIP_PREFIX
+        + _deflate(state, zlib.Z_SYNC_FLUSH, level=1)
+        + _EDITOR_GZIP_SUFFIX
+        + struct.pack('<II', crc, size & 0xFFFFFFFF)
+    )
@@ -8,6 +8,17 @@ from .data_accessor import DataAccessor
 import syft_perm as sp
 
 
+def _kept_admin(current: dict, read: List[str] = None) -> List[str]:
+    """Admin users to keep when set_permissions leaves admin unchanged.
+    
+    Matches the single-level setters: set_read_permissions seeds a missing
+    admin list from the write users, set_write_permissions does not.
+    """
+    if read is not None:
+        return current.get('admin', current.get('write', []))
+    return current.get('admin', [])
+
+
 class MockAccessor(DataAccessor):
     """Accessor for mock data with permission management methods."""
     
@@ -108,6 +119,27 @@ class MockAccessor(DataAccessor):
             # Fallback to metadata
             self._syft_object.metadata["admin_permissions"] = admin
     
+    def set_permissions(self, read: List[str] = None, write: List[str] = None, admin: List[str] = None) -> None:
+        """Set read, write and admin permissions for mock data with a single write (None keeps current)"""
+        try:
+            path = self.get_path()
+            if path:
+                current = sp.get_file_permissions(path)
+                sp.set_file_permissions(
+                    path,
+                    read_users=read if read is not None else current.get('read', []),
+                    write_users=write if write is not None else current.get('write', []),
+                    admin_users=admin if admin is not None else _kept_admin(current, read)
+                )
+        except Exception as e:
+            # Fallback to old attribute-based permissions
+            if read is not None and hasattr(self._syft_object, 'mock_permissions'):
+                self._syft_object.mock_permissions = read
+            if write is not None and hasattr(self._syft_object, 'mock_write_permissions'):
+                self._syft_object.mock_write_permissions = write
+            if admin is not None:
+                self._syft_object.metadata["admin_permissions"] = admin
+    
     def is_folder(self) -> bool:
         """Check if the mock is a folder"""
         mock_path = self.get_path()
@@ -224,6 +256,27 @@ class PrivateAccessor(DataAccessor):
             # Fallback to metadata
             self._syft_object.metadata["admin_permissions"] = admin
     
+    def set_permissions(self, read: List[str] = None, write: List[str] = None, admin: List[str] = None) -> None:
+        """Set read, write and admin permissions for private data with a single write (None keeps current)"""
+        try:
+            path = self.get_path()
+            if path:
+                current = sp.get_file_permissions(path)
+                sp.set_file_permissions(
+                    path,
+                    read_users=read if read is not None else current.get('read', []),
+                    write_users=write if write is not None else current.get('write', []),
+                    admin_users=admin if admin is not None else _kept_admin(current, read)
+                )
+        except Exception as e:
+            # Fallback to old attribute-based permissions
+            if read is not None and hasattr(self._syft_object, 'private_permissions'):
+                self._syft_object.private_permissions = read
+            if write is not None and hasattr(self._syft_object, 'private_write_permissions'):
+                self._syft_object.private_write_permissions = write
+            if admin is not None:
+                self._syft_object.metadata["admin_permissions"] = admin
+    
     def is_folder(self) -> bool:
         """Check if the private is a folder"""
         private_path = self.get_path()
@@ -381,6 +381,30 @@ class CleanSyftObject:
         from .models import utcnow
         self._CleanSyftObject__obj.updated_at = utcnow()
     
+    def apply_permissions(self, permissions: dict) -> list[str]:
+        """Apply several permission changes at once, writing each file's permissions only once
+        
+        Accepts discovery_read, mock_read, mock_write, mock_admin, private_read,
+        private_write and private_admin keys. Returns the keys that were applied.
+        """
+        updated_fields = []
+        
+        if 'discovery_read' in permissions:
+            self.set_discovery_permissions(permissions['discovery_read'])
+            updated_fields.append('discovery_read')
+        
+        for target in ('mock', 'private'):
+            changes = {
+                level: permissions[f"{target}_{level}"]
+                for level in ('read', 'write', 'admin')
+                if f"{target}_{level}" in permissions
+            }
+            if changes:
+                getattr(self, target).set_permissions(**changes)
+                updated_fields.extend(f"{target}_{level}" for level in changes)
+        
+        return updated_fields
+    
     @property
     def type(self) -> str:
         """Get the object type"""
@@ -409,7 +433,7 @@ class CleanSyftObject:
             'get_path', 'get_discovery_permissions', 'get_urls', 'get_owner',
             # Setters
             'set_name', 'set_description', 'set_metadata',
-            'set_discovery_permissions',
+            'set_discovery_permissions', 'apply_permissions',
             # Accessors
             'mock', 'private', 'syftobject_config',
             # Actions
@@ -10,6 +10,40 @@ if TYPE_CHECKING:
 from .client import get_syftbox_client, SYFTBOX_AVAILABLE, get_syft_objects_url
 
 
+def _scan_syftobject_files(directory) -> List[str]:
+    """List the *.syftobject.yaml files directly inside a directory, or [] if it is missing"""
+    try:
+        with os.scandir(directory) as it:
+            # DirEntry.is_file() answers from the directory read, no extra stat per file
+            return [entry.path for entry in it
+                    if entry.name.endswith(".syftobject.yaml") and entry.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def _walk_syftobject_files(directory):
+    """Collect syftobject yaml files under a directory in a single recursive walk
+
+    Returns (job_files, object_files): files named exactly "syftobject.yaml" and
+    "*.syftobject.yaml" files other than "syftobject.syftobject.yaml".
+    """
+    job_files, object_files = [], []
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "syftobject.yaml":
+                        job_files.append(entry.path)
+                    elif entry.name.endswith(".syftobject.yaml") and entry.name != "syftobject.syftobject.yaml":
+                        object_files.append(entry.path)
+        except OSError:
+            continue
+    return job_files, object_files
+
+
 class ObjectsCollection:
     """Collection of syft objects that can be indexed and displayed as a table"""
 
@@ -108,7 +142,8 @@ class ObjectsCollection:
                 return
 
             try:
-                datasites = list(map(lambda x: x.name, syftbox_client.datasites.iterdir()))
+                with os.scandir(syftbox_client.datasites) as it:
+                    datasites = [entry.name for entry in it if entry.is_dir()]
                 if "DEBUG_SYFT_OBJECTS" in os.environ:
                     print(f"Debug: Found {len(datasites)} datasites")
             except Exception as e:
@@ -117,29 +152,19 @@ class ObjectsCollection:
                 self._load_error = f"Failed to fetch objects: {str(e)}"
                 return
 
+            from .models import SyftObject
+            from .clean_api import CleanSyftObject
+
             for email in datasites:
                 if "DEBUG_SYFT_OBJECTS" in os.environ:
                     print(f"Debug: Processing datasite {email}")
                 try:
+                    datasite_dir = os.path.join(syftbox_client.datasites, email)
+
                     # Original locations: public/objects and private/objects
-                    public_objects_dir = syftbox_client.datasites / email / "public" / "objects"
-                    if public_objects_dir.exists():
-                        for syftobj_file in public_objects_dir.glob("*.syftobject.yaml"):
+                    for objects_dir in ("public", "private"):
+                        for syftobj_file in _scan_syftobject_files(os.path.join(datasite_dir, objects_dir, "objects")):
                             try:
-                                from .models import SyftObject
-                                from .clean_api import CleanSyftObject
-                                syft_obj = SyftObject.from_yaml(syftobj_file)
-                                clean_obj = CleanSyftObject(syft_obj)
-                                self._objects.append(clean_obj)
-                            except Exception:
-                                continue
-                    
-                    private_objects_dir = syftbox_client.datasites / email / "private" / "objects"
-                    if private_objects_dir.exists():
-                        for syftobj_file in private_objects_dir.glob("*.syftobject.yaml"):
-                            try:
-                                from .models import SyftObject
-                                from .clean_api import CleanSyftObject
                                 syft_obj = SyftObject.from_yaml(syftobj_file)
                                 clean_obj = CleanSyftObject(syft_obj)
                                 self._objects.append(clean_obj)
@@ -148,46 +173,24 @@ class ObjectsCollection:
                     
                     # NEW: Also scan app_data directory for syftobject.yaml files
                     # This is where syft-queue jobs and other apps may store their objects
-                    app_data_dir = syftbox_client.datasites / email / "app_data"
-                    if app_data_dir.exists():
+                    app_data_dir = os.path.join(datasite_dir, "app_data")
+                    if "DEBUG_SYFT_OBJECTS" in os.environ and os.path.isdir(app_data_dir):
+                        print(f"Debug: Scanning app_data for {email}")
+                    # One recursive walk finds both naming conventions:
+                    # - "syftobject.yaml" (used by syft-queue jobs)
+                    # - "*.syftobject.yaml" (standard syft-objects pattern)
+                    job_files, object_files = _walk_syftobject_files(app_data_dir)
+                    for syftobj_file in job_files + object_files:
                         if "DEBUG_SYFT_OBJECTS" in os.environ:
-                            print(f"Debug: Scanning app_data for {email}")
-                        # Use rglob to recursively find syftobject yaml files
-                        # Look for both patterns to handle different naming conventions:
-                        # - "syftobject.yaml" (used by syft-queue jobs)
-                        # - "*.syftobject.yaml" (standard syft-objects pattern)
-                        
-                        # First, find all syftobject.yaml files
-                        for syftobj_file in app_data_dir.rglob("syftobject.yaml"):
+                            print(f"Debug: Found {os.path.relpath(syftobj_file, app_data_dir)}")
+                        try:
+                            syft_obj = SyftObject.from_yaml(syftobj_file)
+                            clean_obj = CleanSyftObject(syft_obj)
+                            self._objects.append(clean_obj)
+                        except Exception as e:
                             if "DEBUG_SYFT_OBJECTS" in os.environ:
-                                print(f"Debug: Found {syftobj_file.relative_to(app_data_dir)}")
-                            try:
-                                from .models import SyftObject
-                                from .clean_api import CleanSyftObject
-                                syft_obj = SyftObject.from_yaml(syftobj_file)
-                                clean_obj = CleanSyftObject(syft_obj)
-                                self._objects.append(clean_obj)
-                            except Exception as e:
-                                if "DEBUG_SYFT_OBJECTS" in os.environ:
-                                    print(f"Debug: Error loading {syftobj_file}: {e}")
-                                continue
-                        
-                        # Also find *.syftobject.yaml files (but not syftobject.syftobject.yaml)
-                        for syftobj_file in app_data_dir.rglob("*.syftobject.yaml"):
-                            # Skip if this is syftobject.syftobject.yaml (which we want to avoid)
-                            if syftobj_file.name == "syftobject.syftobject.yaml":
-                                continue
-                            try:
-                                from .models import SyftObject
-                                from .clean_api import CleanSyftObject
-                                syft_obj = SyftObject.from_yaml(syftobj_file)
-                                clean_obj = CleanSyftObject(syft_obj)
-                                self._objects.append(clean_obj)
-                            except Exception as e:
-                                # Debug: print errors during development
-                                if "DEBUG_SYFT_OBJECTS" in os.environ:
-                                    print(f"Debug: Error loading {syftobj_file}: {e}")
-                                continue
+                                print(f"Debug: Error loading {syftobj_file}: {e}")
+                            continue
                                 
                 except Exception:
                     continue
@@ -206,6 +209,30 @@ class ObjectsCollection:
         self._load_objects()
         return self
 
+    def invalidate(self, uid):
+        """Re-read a single object from disk instead of reloading the whole collection
+        
+        The object is replaced by a fresh copy loaded from its .syftobject.yaml, or
+        dropped if that file can no longer be read. Use refresh() for a full reload.
+        """
+        uid = str(uid)
+        objects = list(self._objects)
+        for i, syft_obj in enumerate(objects):
+            raw_obj = getattr(syft_obj, '_CleanSyftObject__obj', syft_obj)
+            if str(raw_obj.uid) != uid:
+                continue
+            try:
+                from .models import SyftObject
+                from .clean_api import CleanSyftObject
+                objects[i] = CleanSyftObject(SyftObject.from_yaml(raw_obj.syftobject_path))
+            except Exception:
+                # Deleted or unreadable - a full reload would skip it too
+                del objects[i]
+            break
+        # Swap in a new list so anything indexing the old one sees the change
+        self._objects = objects
+        return self
+
     def _ensure_loaded(self):
         """Ensure objects are loaded and trigger auto-install if needed"""
         # Trigger non-blocking auto-install attempt if syft-objects app not present
@@ -187,6 +187,28 @@ class TestObjectsCollection:
         # Should handle error gracefully
         assert collection._objects == []
     
+    def test_syftobject_file_scanning(self, temp_dir):
+        """Test the scandir helpers find both syftobject naming conventions"""
+        from syft_objects.collections import _scan_syftobject_files, _walk_syftobject_files
+
+        objects_dir = temp_dir / "objects"
+        objects_dir.mkdir()
+        (objects_dir / "a.syftobject.yaml").write_text("")
+        (objects_dir / "other.yaml").write_text("")
+        (objects_dir / "nested.syftobject.yaml").mkdir()
+        assert _scan_syftobject_files(objects_dir) == [str(objects_dir / "a.syftobject.yaml")]
+        assert _scan_syftobject_files(temp_dir / "missing") == []
+
+        job_dir = temp_dir / "app_data" / "queue" / "jobs" / "inbox" / "job_1"
+        job_dir.mkdir(parents=True)
+        (job_dir / "syftobject.yaml").write_text("")
+        (job_dir / "syftobject.syftobject.yaml").write_text("")
+        (job_dir.parent / "results.syftobject.yaml").write_text("")
+        job_files, object_files = _walk_syftobject_files(temp_dir / "app_data")
+        assert job_files == [str(job_dir / "syftobject.yaml")]
+        assert object_files == [str(job_dir.parent / "results.syftobject.yaml")]
+        assert _walk_syftobject_files(temp_dir / "missing") == ([], [])
+
     def test_refresh(self):
         """Test refresh method"""
         collection = ObjectsCollection()
@@ -196,7 +218,32 @@ class TestObjectsCollection:
             
             mock_load.assert_called_once()
             assert result == collection
-    
+
+    def test_invalidate(self):
+        """Test invalidate re-reads one object and drops unreadable ones"""
+        kept = Mock(spec=["uid", "syftobject_path"], uid="keep", syftobject_path="/keep.syftobject.yaml")
+        changed = Mock(spec=["uid", "syftobject_path"], uid="change", syftobject_path="/change.syftobject.yaml")
+        gone = Mock(spec=["uid", "syftobject_path"], uid="gone", syftobject_path="/gone.syftobject.yaml")
+        collection = ObjectsCollection(objects=[kept, changed, gone])
+        original_list = collection._objects
+
+        reloaded = Mock()
+        with patch.object(SyftObject, 'from_yaml', return_value=reloaded) as mock_from_yaml, \
+             patch.object(collection, '_load_objects') as mock_load:
+            result = collection.invalidate("change")
+
+            mock_from_yaml.assert_called_once_with("/change.syftobject.yaml")
+            mock_load.assert_not_called()
+            assert result is collection
+            assert collection._objects is not original_list
+            assert collection._objects[0] is kept
+            assert collection._objects[1]._CleanSyftObject__obj is reloaded
+
+        with patch.object(SyftObject, 'from_yaml', side_effect=FileNotFoundError()):
+            collection.invalidate("gone")
+        assert len(collection._objects) == 2
+        assert collection._objects[0] is kept
+
     def test_ensure_loaded(self):
         """Test _ensure_loaded method"""
         collection = ObjectsCollection()
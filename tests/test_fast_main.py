@@ -472,13 +472,15 @@ class TestFastAPIEndpoints:
         assert not private_file.exists()
         assert not mock_file.exists()
         assert not syftobj_file.exists()
-        mock_objects.refresh.assert_called_once()
+        mock_objects.invalidate.assert_called_once_with(uid)
     
     def test_widget_redirect(self, client):
         """Test /widget redirect"""
         response = client.get("/widget", follow_redirects=False)
         assert response.status_code == 307
         assert response.headers["location"] == "/widget/"
+        widget_routes = [r for r in app.routes if getattr(r, "path", None) == "/widget"]
+        assert len(widget_routes) == 1
     
     def test_widget_page(self, client):
         """Test /widget/ page"""
@@ -488,14 +490,9 @@ class TestFastAPIEndpoints:
         assert response.status_code == 200
         assert "html" in response.text.lower()
     
-    @patch('backend.fast_main.PathLib')
-    def test_root_page(self, mock_pathlib, client):
+    @patch('backend.fast_main._MAIN_EXISTS', False)
+    def test_root_page(self, client):
         """Test / root page"""
-        mock_index_file = Mock()
-        mock_index_file.exists.return_value = False
-        
-        mock_pathlib.return_value.parent.parent.__truediv__.return_value.__truediv__.return_value = mock_index_file
-        
         response = client.get("/")
         assert response.status_code == 200
         assert "Syft Objects UI" in response.text
@@ -204,6 +204,81 @@ class TestFastAPIAdditionalEndpoints:
         response = client.get("/api/file?syft_url=syft://test@example.com/private/binary.bin")
         assert response.status_code == 200
     
+    @patch('backend.fast_main.objects')
+    def test_get_file_content_uses_url_index(self, mock_objects, client, temp_dir):
+        """Test GET /api/file reuses the URL index instead of rescanning"""
+        test_file = temp_dir / "indexed.txt"
+        test_file.write_text("Indexed content")
+
+        mock_obj = Mock()
+        mock_obj.get_urls.return_value = {
+            "private": "syft://test@example.com/private/indexed.txt",
+            "mock": "syft://test@example.com/public/indexed.txt",
+        }
+        mock_obj.private.get_path.return_value = str(test_file)
+
+        mock_objects.__iter__ = Mock(return_value=iter([mock_obj]))
+
+        for _ in range(2):
+            response = client.get("/api/file?syft_url=syft://test@example.com/private/indexed.txt")
+            assert response.status_code == 200
+            assert response.text == "Indexed content"
+        assert mock_objects.__iter__.call_count == 1
+
+    @patch('backend.fast_main._last_miss_reload', float('-inf'))
+    @patch('backend.fast_main.objects')
+    def test_get_object_by_uid_uses_index(self, mock_objects):
+        """Test UID lookups reuse the index, reload once on a miss, and rebuild after a reload"""
+        from backend.fast_main import _get_by_uid
+
+        first, second = Mock(), Mock()
+        # Mock types have no get_uid method, so the index falls back to .uid
+        first.uid = "uid-1"
+        second.uid = "uid-2"
+        mock_objects._cached = False
+        mock_objects.__iter__ = Mock(side_effect=lambda: iter([first, second]))
+
+        assert _get_by_uid("uid-2") is second
+        assert _get_by_uid("uid-1") is first
+        assert mock_objects.__iter__.call_count == 1
+
+        # A miss reloads once; further misses inside the interval don't
+        assert _get_by_uid("missing") is None
+        assert mock_objects.__iter__.call_count == 2
+        assert _get_by_uid("missing") is None
+        assert mock_objects.__iter__.call_count == 2
+        mock_objects.refresh.assert_not_called()
+
+        # A reload swaps in a new object list, which marks the index stale
+        mock_objects._objects = []
+        assert _get_by_uid("uid-1") is first
+        assert mock_objects.__iter__.call_count == 3
+
+    @patch('backend.fast_main._last_miss_reload', float('-inf'))
+    @patch('backend.fast_main.objects')
+    def test_get_object_by_uid_finds_objects_created_after_indexing(self, mock_objects):
+        """Test an object created after the index was built is found by UID and URL"""
+        from backend.fast_main import _get_by_uid, _lookup_url
+
+        existing, created = Mock(), Mock()
+        existing.uid = "uid-old"
+        created.uid = "uid-new"
+        created.get_urls.return_value = {"private": "syft://a@b.c/private/new.txt", "mock": ""}
+        on_disk = [existing]
+        # A cached collection only sees new files after refresh()
+        loaded = []
+        mock_objects._cached = True
+        mock_objects.refresh = Mock(side_effect=lambda: loaded.__setitem__(slice(None), on_disk))
+        mock_objects.__iter__ = Mock(side_effect=lambda: iter(list(loaded)))
+
+        loaded[:] = on_disk
+        assert _get_by_uid("uid-old") is existing
+
+        on_disk.append(created)
+        assert _get_by_uid("uid-new") is created
+        assert mock_objects.refresh.call_count == 1
+        assert _lookup_url("syft://a@b.c/private/new.txt") == (created, 'private')
+
     @patch('backend.fast_main.objects')
     def test_get_file_content_exception(self, mock_objects, client):
         """Test GET /api/file with exception"""
@@ -247,6 +322,37 @@ class TestFastAPIAdditionalEndpoints:
             response = client.put(f"/api/objects/{uid}/file/private", content="data")
             assert response.status_code == 500
     
+    @patch('backend.fast_main.objects')
+    def test_save_file_content_validation_warning(self, mock_objects, client, temp_dir):
+        """Test PUT /api/objects/{uid}/file/{type} reports mock/real validation warnings"""
+        from syft_objects._validation import MockRealValidationError
+
+        uid = str(uuid4())
+        private_file = temp_dir / "private.csv"
+        mock_file = temp_dir / "mock.csv"
+        private_file.write_text("a,b\n1,2\n")
+        mock_file.write_text("a,b\n3,4\n")
+
+        mock_obj = Mock()
+        mock_obj.uid = uid
+        mock_obj._CleanSyftObject__obj = mock_obj
+        mock_obj.private.get_path.return_value = str(private_file)
+        mock_obj.mock.get_path.return_value = str(mock_file)
+        mock_obj.private_write_permissions = ["test@example.com"]
+        mock_objects.__iter__ = Mock(return_value=iter([mock_obj]))
+
+        syftbox_client = Mock()
+        syftbox_client.email = "test@example.com"
+        with patch('syft_objects.client.get_syftbox_client', return_value=syftbox_client), \
+             patch('backend.fast_main.validate_mock_real_compatibility',
+                   side_effect=MockRealValidationError("Column mismatch")) as mock_validate:
+            response = client.put(f"/api/objects/{uid}/file/private", content="a,c\n1,2\n")
+
+        assert response.status_code == 200
+        assert "Column mismatch" in response.json()["warning"]
+        assert private_file.read_text() == "a,c\n1,2\n"
+        mock_validate.assert_called_once_with(str(mock_file), str(private_file), skip_validation=False)
+
     @patch('backend.fast_main.objects')
     def test_update_permissions_no_save_yaml(self, mock_objects, client):
         """Test PUT /api/objects/{uid}/permissions without save_yaml"""
@@ -333,21 +439,374 @@ class TestFastAPIAdditionalEndpoints:
         response = client.delete(f"/api/objects/{uid}")
         # Should still succeed even if some files fail to delete
         assert response.status_code == 200
-    
+
+    @patch('backend.fast_main.objects')
+    def test_delete_folder_object(self, mock_objects, client, temp_dir):
+        """Test DELETE /api/objects/{uid} removes the whole folder of a folder object"""
+        uid = str(uuid4())
+        folder = temp_dir / "folder_object"
+        (folder / "data").mkdir(parents=True)
+        (folder / "data" / "file.txt").write_text("data")
+        syftobj_file = folder / "obj.syftobject.yaml"
+        syftobj_file.write_text("metadata")
+
+        raw_obj = Mock(spec=["_is_folder", "syftobject_path", "private_path", "metadata", "uid"])
+        raw_obj._is_folder = True
+        raw_obj.syftobject_path = str(syftobj_file)
+        raw_obj.private_path = str(folder / "data")
+        raw_obj.metadata = {}
+        raw_obj.uid = uid
+        mock_obj = Mock(spec=["uid", "get_owner", "get_metadata", "private_url", "mock_url", "_CleanSyftObject__obj"])
+        mock_obj.uid = uid
+        mock_obj.get_owner.return_value = "owner@example.com"
+        mock_obj.get_metadata.return_value = {}
+        mock_obj.private_url = None
+        mock_obj.mock_url = None
+        mock_obj._CleanSyftObject__obj = raw_obj
+
+        mock_objects.__iter__ = Mock(return_value=iter([mock_obj]))
+
+        response = client.delete(f"/api/objects/{uid}?user_email=Owner@example.com")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["deleted_files"] == ["folder_directory"]
+        assert data["object_type"] == "folder"
+        assert not folder.exists()
+
     @patch('backend.fast_main.objects')
     def test_delete_object_exception(self, mock_objects, client):
         """Test DELETE /api/objects/{uid} with exception"""
         mock_objects.__iter__.side_effect = Exception("Error")
-        
+
         response = client.delete(f"/api/objects/{uuid4()}")
         assert response.status_code == 500
-    
+
+    def test_paths_resolution(self):
+        """Test resolving file paths for clean and raw objects"""
+        from backend.fast_main import _paths
+
+        clean_obj = Mock()
+        clean_obj.private.get_path.return_value = "/private/file.txt"
+        clean_obj.mock.get_path.return_value = "/mock/file.txt"
+        assert _paths(clean_obj) == ("/private/file.txt", "/mock/file.txt")
+
+        raw_obj = Mock(spec=["private_path", "mock_path"])
+        raw_obj.private_path = "/raw/private.txt"
+        raw_obj.mock_path = "/raw/mock.txt"
+        paths = _paths(raw_obj)
+        assert paths.private_path == "/raw/private.txt"
+        assert paths.mock_path == "/raw/mock.txt"
+
+    @patch('backend.fast_main.objects')
+    def test_get_object_metadata_with_clean_object(self, mock_objects, client):
+        """Test GET /api/object/{uid}/metadata resolves getters through the capability cache"""
+        from syft_objects import create_object
+        from syft_objects.clean_api import CleanSyftObject
+        from backend.fast_main import _CAPS
+
+        obj = create_object(
+            name="Metadata Object",
+            metadata={"description": "Cached getters", "mock_note": "Synthetic"},
+            private_contents="Private data",
+            mock_contents="Mock data"
+        )
+        mock_objects.__iter__ = Mock(side_effect=lambda: iter([obj]))
+
+        response = client.get(f"/api/object/{obj.get_uid()}/metadata")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["uid"] == obj.get_uid()
+        assert data["name"] == "Metadata Object"
+        assert data["description"] == "Cached getters"
+        assert data["mock_note"] == "Synthetic"
+        assert data["created_at"] == obj.get_created_at().isoformat()
+        assert _CAPS[CleanSyftObject]["get_name"] is CleanSyftObject.get_name
+
+    @patch('backend.fast_main.objects')
+    def test_get_object_metadata_snapshot_cache(self, mock_objects, client):
+        """Test metadata snapshots are reused until the object is updated"""
+        from syft_objects import create_object
+        import backend.fast_main as fast_main
+
+        obj = create_object(
+            name="Cached Object",
+            private_contents="Private data",
+            mock_contents="Mock data"
+        )
+        mock_objects.__iter__ = Mock(side_effect=lambda: iter([obj]))
+        uid = obj.get_uid()
+
+        with patch('backend.fast_main._build_object_metadata', wraps=fast_main._build_object_metadata) as mock_build:
+            assert client.get(f"/api/object/{uid}/metadata").json()["name"] == "Cached Object"
+            assert client.get(f"/api/object/{uid}/metadata").json()["name"] == "Cached Object"
+            assert mock_build.call_count == 1
+
+            response = client.put(f"/api/object/{uid}/metadata", json={"name": "Renamed Object"})
+            assert response.status_code == 200
+            assert uid not in fast_main._META_CACHE
+
+            assert client.get(f"/api/object/{uid}/metadata").json()["name"] == "Renamed Object"
+            assert mock_build.call_count == 2
+
+            # Permission edits don't touch updated_at, so snapshots also expire
+            with patch('backend.fast_main._META_CACHE_TTL', 0):
+                client.get(f"/api/object/{uid}/metadata")
+            assert mock_build.call_count == 3
+
+    def test_permission_stamp_tracks_permission_files(self, tmp_path):
+        """Test the metadata cache key changes when a syft.pub.yaml beside the files changes"""
+        from backend.fast_main import _permission_stamp
+
+        (tmp_path / "mock").mkdir()
+        (tmp_path / "private").mkdir()
+        paths = {
+            "mock": str(tmp_path / "mock" / "data.txt"),
+            "private": tmp_path / "private" / "data.txt",
+            "syftobject": str(tmp_path / "mock" / "data.syftobject.yaml"),
+        }
+        assert _permission_stamp(paths) == (None, None)
+        assert _permission_stamp({"mock": None}) == ()
+
+        perm_file = tmp_path / "mock" / "syft.pub.yaml"
+        perm_file.write_text("rules: []\n")
+        os.utime(perm_file, ns=(1_000_000_000, 1_000_000_000))
+        first = _permission_stamp(paths)
+        assert first == (1_000_000_000, None)
+
+        os.utime(perm_file, ns=(2_000_000_000, 2_000_000_000))
+        assert _permission_stamp(paths) != first
+
+    @patch('backend.fast_main._SYFTBOX_CLIENT', None)
+    @patch('backend.fast_main.get_syftbox_client')
+    def test_user_email_caches_client(self, mock_get_client):
+        """Test the SyftBox client is loaded once found and retried while missing"""
+        from backend.fast_main import _user_email
+
+        mock_get_client.return_value = None
+        assert _user_email() is None
+        assert _user_email() is None
+        assert mock_get_client.call_count == 2
+
+        mock_get_client.return_value = Mock(email="user@example.com")
+        assert _user_email() == "user@example.com"
+        assert _user_email() == "user@example.com"
+        assert mock_get_client.call_count == 3
+
+    @patch('backend.fast_main._user_email', return_value="owner@example.com")
+    def test_check_file_permissions_datasite_owner(self, mock_user_email, client, temp_dir):
+        """Test /api/filesystem/check-permissions reads the datasite owner from the path"""
+        syftbox_root = temp_dir / "SyftBox"
+        with patch('backend.fast_main._SYFTBOX_ROOT_STR', str(syftbox_root)), \
+             patch('backend.fast_main._SYFTBOX_DATASITES', syftbox_root / "datasites"):
+            owned = temp_dir / "SyftBox" / "datasites" / "owner@example.com" / "public" / "data.txt"
+            response = client.get("/api/filesystem/check-permissions", params={"path": str(owned)})
+            data = response.json()
+            assert data["is_syftbox_file"] is True
+            assert data["datasite_owner"] == "owner@example.com"
+            assert data["can_write"] is True
+
+            other = temp_dir / "SyftBox" / "apps" / "app.py"
+            data = client.get("/api/filesystem/check-permissions", params={"path": str(other)}).json()
+            assert data["is_syftbox_file"] is True
+            assert data["datasite_owner"] is None
+            assert data["can_write"] is False
+
+    @patch('backend.fast_main._user_email', return_value=None)
+    def test_read_file_metadata_only(self, mock_user_email, client, temp_dir):
+        """Test /api/filesystem/read?content=false skips the file body"""
+        file_path = temp_dir / "notes.txt"
+        file_path.write_text("hello")
+        data = client.get("/api/filesystem/read", params={"path": str(file_path), "content": "false"}).json()
+        assert data["content"] is None
+        assert data["size"] == 5
+        assert data["can_write"] is True
+
+        data = client.get("/api/filesystem/read", params={"path": str(file_path)}).json()
+        assert data["content"] == "hello"
+
+    def test_metadata_batch(self, client, temp_dir):
+        """Test /api/filesystem/metadata-batch stats several paths in one request"""
+        (temp_dir / "a.txt").write_text("abc")
+        paths = [str(temp_dir / "a.txt"), str(temp_dir / "missing.txt")]
+        response = client.post("/api/filesystem/metadata-batch", json={"paths": paths})
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data) == [paths[0]]
+        assert data[paths[0]]["size"] == 3
+
+    def test_list_directory_stream(self, client, temp_dir):
+        """Test /api/filesystem/list-stream returns the listing document"""
+        (temp_dir / "a.txt").write_text("a")
+        response = client.get("/api/filesystem/list-stream", params={"path": str(temp_dir)})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["path"] == str(temp_dir.resolve())
+        assert "a.txt" in [item["name"] for item in data["items"]]
+        assert data["total_items"] == len(data["items"])
+
+    def test_list_directory_columns(self, client, temp_dir):
+        """Test /api/filesystem/list?columns=true returns parallel columns"""
+        (temp_dir / "a.txt").write_text("a")
+        response = client.get("/api/filesystem/list", params={"path": str(temp_dir), "columns": True})
+        assert response.status_code == 200
+        data = response.json()
+        assert "items" not in data
+        index = data["columns"]["name"].index("a.txt")
+        assert data["columns"]["flags"][index] == 2
+        assert data["columns"]["size"][index] == 1
+
+    def test_read_file_raw(self, client, temp_dir):
+        """Test /api/filesystem/raw serves file bytes with a sandboxed content type"""
+        text_file = temp_dir / "notes.md"
+        text_file.write_text("# notes")
+        response = client.get("/api/filesystem/raw", params={"path": str(text_file)})
+        assert response.status_code == 200
+        assert response.text == "# notes"
+        assert response.headers["content-type"] == "text/plain; charset=utf-8"
+        assert response.headers["content-security-policy"] == "sandbox"
+
+        image = temp_dir / "pixel.png"
+        image.write_bytes(b"\x89PNG\r\n\x1a\n\x00")
+        response = client.get("/api/filesystem/raw", params={"path": str(image)})
+        assert response.headers["content-type"] == "image/png"
+        assert response.content == b"\x89PNG\r\n\x1a\n\x00"
+
+        response = client.get("/api/filesystem/raw", params={"path": str(temp_dir / "missing.md")})
+        assert response.status_code == 404
+
+    def test_patch_file(self, client, temp_dir):
+        """Test /api/filesystem/patch applies edits on top of the saved version"""
+        text_file = temp_dir / "notes.md"
+        response = client.post("/api/filesystem/write", json={"path": str(text_file), "content": "hello world"})
+        base_hash = response.json()["sha256"]
+
+        ops = [{"offset": 6, "delete": 5, "insert": "there"}]
+        response = client.post("/api/filesystem/patch", json={"path": str(text_file), "base_hash": base_hash, "ops": ops})
+        assert response.status_code == 200
+        assert text_file.read_text() == "hello there"
+        assert response.json()["size"] == 11
+
+        response = client.post("/api/filesystem/patch", json={"path": str(text_file), "base_hash": base_hash, "ops": ops})
+        assert response.status_code == 409
+
+    def test_editor_page_is_served_precompressed(self, client):
+        """Test /editor sends the pre-gzipped page once, not compressed twice"""
+        response = client.get("/editor", headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text.lstrip().startswith("<!DOCTYPE html>")
+
+        response = client.get("/editor", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in response.headers
+        assert response.text.lstrip().startswith("<!DOCTYPE html>")
+
+    def test_file_responses_are_compressed(self, client, temp_dir):
+        """Test large file bodies are gzip-encoded when the client accepts it"""
+        text_file = temp_dir / "big.txt"
+        text_file.write_text("line of text\n" * 500)
+        headers = {"Accept-Encoding": "gzip"}
+
+        response = client.get("/api/filesystem/raw", params={"path": str(text_file)}, headers=headers)
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.text == "line of text\n" * 500
+
+        response = client.get("/api/filesystem/read", params={"path": str(text_file)}, headers=headers)
+        assert response.headers["content-encoding"] == "gzip"
+
+        response = client.get("/api/filesystem/read", params={"path": str(text_file), "content": "false"}, headers=headers)
+        assert "content-encoding" not in response.headers
+
+    def test_normalize_email(self):
+        """Test emails are normalized to shared interned strings"""
+        from backend.fast_main import _normalize_email
+
+        first = _normalize_email("  Owner@Example.com ")
+        second = _normalize_email("owner@example.COM".strip())
+        assert first == "owner@example.com"
+        assert first is second
+        assert _normalize_email("unknown") is None
+        assert _normalize_email("   ") is None
+        assert _normalize_email(None) is None
+
+    def test_remove_path(self, temp_dir):
+        """Test removing files, directories and missing paths without pre-checks"""
+        from backend.fast_main import _remove_path
+
+        test_file = temp_dir / "file.txt"
+        test_file.write_text("data")
+        test_dir = temp_dir / "folder"
+        (test_dir / "nested").mkdir(parents=True)
+        (test_dir / "nested" / "inner.txt").write_text("data")
+
+        assert _remove_path(str(test_file)) == "file"
+        assert _remove_path(str(test_dir)) == "directory"
+        assert _remove_path(str(temp_dir / "missing.txt")) is None
+        assert not test_file.exists()
+        assert not test_dir.exists()
+
+    def test_scan_queue_jobs(self, temp_dir):
+        """Test finding a syft-queue job directory by UID"""
+        from backend.fast_main import _scan_queue_jobs
+
+        job_uid = str(uuid4())
+        job_dir = temp_dir / "test_queue" / "jobs" / "running" / f"J:job_{job_uid}"
+        job_dir.mkdir(parents=True)
+        (temp_dir / "test_queue" / "jobs" / "inbox").mkdir()
+        # A file whose name contains the UID is not a job directory
+        (temp_dir / "test_queue" / "jobs" / "inbox" / f"{job_uid}.log").write_text("log")
+
+        assert _scan_queue_jobs(temp_dir, "running", job_uid) == job_dir
+        assert _scan_queue_jobs(temp_dir, "inbox", job_uid) is None
+        assert _scan_queue_jobs(temp_dir, "failed", job_uid) is None
+        assert _scan_queue_jobs(temp_dir / "missing", "running", job_uid) is None
+
     def test_widget_page_not_found(self, client):
         """Test /widget/ when file doesn't exist"""
         # This test checks the actual behavior - the widget page returns content
         response = client.get("/widget/")
         assert response.status_code == 200
-    
+
+    def test_widget_page_index_filter(self, client):
+        """Test /widget/ injects the index range filter before </head>"""
+        response = client.get("/widget/?start_index=2&end_index=5")
+        assert response.status_code == 200
+        head = response.text.split("</head>", 1)[0]
+        assert "window.INDEX_RANGE_FILTER" in head
+        assert "startIndex: 2" in head
+        assert "endIndex: 5" in head
+
+    def test_widget_page_without_filter_streams_file(self, client, temp_dir):
+        """Test /widget/ without filters serves the file unchanged, or 404 when missing"""
+        widget_file = temp_dir / "index.html"
+        widget_file.write_text("<html><head></head><body>widget</body></html>")
+
+        with patch('backend.fast_main._WIDGET_FILE', widget_file):
+            response = client.get("/widget/")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/html")
+            assert response.text == "<html><head></head><body>widget</body></html>"
+
+        with patch('backend.fast_main._WIDGET_FILE', temp_dir / "missing.html"):
+            assert client.get("/widget/").status_code == 404
+
+    def test_widget_html_cache(self, temp_dir):
+        """Test the widget page is read once and reloaded when its mtime changes"""
+        from backend.fast_main import _widget_html
+
+        widget_file = temp_dir / "index.html"
+        widget_file.write_text("<html><head></head><body>v1</body></html>")
+        head, tail = _widget_html(widget_file)
+        assert head == b"<html><head>"
+        assert tail == b"</head><body>v1</body></html>"
+
+        with patch.object(Path, "read_bytes") as mock_read:
+            assert _widget_html(widget_file) == (head, tail)
+            mock_read.assert_not_called()
+
+        widget_file.write_text("<html><head></head><body>v2</body></html>")
+        os.utime(widget_file, ns=(0, os.stat(widget_file).st_mtime_ns + 1_000_000))
+        assert _widget_html(widget_file)[1] == b"</head><body>v2</body></html>"
+
     def test_root_page_with_file(self, client):
         """Test / when index.html exists"""
         # This test checks the actual behavior since the root path depends on file existence
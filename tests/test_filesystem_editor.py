@@ -1,9 +1,11 @@
 """Tests for filesystem editor functionality"""
 
+import hashlib
+import os
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
-from backend.filesystem_editor import generate_editor_html, FileSystemManager
+from backend.filesystem_editor import generate_editor_html, generate_editor_page, generate_editor_page_gzip, FileSystemManager, _suffix_is_text, _suffix_editability, _name_suffix, _prefetch_stat
 from fastapi import HTTPException
 
 
@@ -19,7 +21,7 @@ class TestFileSystemEditor:
             
             # Check that it's not in file-only mode
             assert 'this.isInitialFile = false' in html
-            assert "this.currentPath = '/some/directory'" in html
+            assert 'this.currentPath = "/some/directory"' in html
             assert 'this.initialFilePath = null' in html
     
     def test_generate_editor_html_with_file_path(self):
@@ -32,8 +34,8 @@ class TestFileSystemEditor:
             
             # Check that it's in file-only mode
             assert 'this.isInitialFile = true' in html
-            assert "this.currentPath = '/some'" in html
-            assert 'this.initialFilePath = `/some/file.py`' in html
+            assert 'this.currentPath = "/some"' in html
+            assert 'this.initialFilePath = "/some/file.py"' in html
             assert 'this.fileOnlyMode = this.isInitialFile' in html
     
     def test_generate_editor_html_with_nonexistent_path(self):
@@ -43,7 +45,32 @@ class TestFileSystemEditor:
             
             # Should default to directory mode
             assert 'this.isInitialFile = false' in html
-            assert "this.currentPath = '/nonexistent/path'" in html
+            assert 'this.currentPath = "/nonexistent/path"' in html
+    
+    def test_generate_editor_html_escapes_initial_path(self):
+        """Test that the initial path is injected as an escaped JS string"""
+        with patch('pathlib.Path.exists', return_value=False):
+            html = generate_editor_html("/tmp/'</script><b>")
+        
+        assert 'this.currentPath = "/tmp/\'\\u003c/script>\\u003cb>";' in html
+        assert html.count('</script>') == generate_editor_html('/x').count('</script>')
+    
+    def test_generate_editor_page_matches_html(self):
+        """Test the pre-encoded page is the UTF-8 encoding of the HTML"""
+        with patch('pathlib.Path.exists', return_value=False):
+            assert generate_editor_page('/some/dir') == generate_editor_html('/some/dir').encode('utf-8')
+    
+    def test_generate_editor_page_gzip_decompresses_to_page(self):
+        """Test the pre-compressed page is one valid gzip member holding the page"""
+        import zlib
+        with patch('pathlib.Path.exists', return_value=False):
+            body = generate_editor_page_gzip('/some/dir')
+            page = generate_editor_page('/some/dir')
+        
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        assert decompressor.decompress(body) == page
+        assert decompressor.eof and decompressor.unused_data == b''
+        assert len(body) < len(page) // 3
     
     def test_generate_editor_html_includes_toggle_button(self):
         """Test that the toggle explorer button is included"""
@@ -92,4 +119,393 @@ class TestFileSystemEditor:
             mock_resolve.return_value = Path('/not/allowed/path')
             with pytest.raises(HTTPException) as exc_info:
                 manager_restricted._validate_path('/not/allowed/path')
-            assert exc_info.value.status_code == 403
\ No newline at end of file
+            assert exc_info.value.status_code == 403
+    
+    def test_list_directory_sorts_directories_first(self, tmp_path):
+        """Test list_directory lists directories before files, case-insensitively"""
+        (tmp_path / 'b.py').write_text('print(1)')
+        (tmp_path / 'A.txt').write_text('hello')
+        (tmp_path / 'zdir').mkdir()
+        
+        result = FileSystemManager().list_directory(str(tmp_path))
+        
+        assert [item['name'] for item in result['items']] == ['zdir', 'A.txt', 'b.py']
+        assert result['total_items'] == 3
+        zdir, a_txt, _ = result['items']
+        (tmp_path / 'a.txt').write_text('lower')
+        names = [item['name'] for item in FileSystemManager().list_directory(str(tmp_path))['items']]
+        assert names == ['zdir', 'A.txt', 'a.txt', 'b.py']
+        assert zdir['is_directory'] is True
+        assert zdir['size'] is None
+        assert zdir['extension'] is None
+        assert a_txt['path'] == str(tmp_path / 'A.txt')
+        assert a_txt['size'] == 5
+        assert a_txt['extension'] == '.txt'
+        assert a_txt['is_editable'] is True
+    
+    def test_read_file_reports_stat_metadata(self, tmp_path):
+        """Test read_file returns content with size and rejects missing or directory paths"""
+        file_path = tmp_path / 'notes.md'
+        file_path.write_text('# hi\n')
+        manager = FileSystemManager()
+        
+        result = manager.read_file(str(file_path))
+        assert result['content'] == '# hi\n'
+        assert result['size'] == 5
+        assert result['extension'] == '.md'
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.read_file(str(tmp_path / 'missing.md'))
+        assert exc_info.value.status_code == 404
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.read_file(str(tmp_path))
+        assert exc_info.value.status_code == 400
+    
+    def test_suffix_is_text_classification(self):
+        """Test suffix classification covers allowed extensions and text MIME types"""
+        assert _suffix_is_text('.py') is True
+        assert _suffix_is_text('.htm') is True  # text/html via mimetypes only
+        assert _suffix_is_text('.jpg') is None
+        assert _suffix_is_text('') is None
+    
+    def test_suffix_editability_is_cached(self):
+        """Test listing editability is decided once per suffix"""
+        _suffix_editability.cache_clear()
+        assert _suffix_editability('.md') is True
+        assert _suffix_editability('.jpg') is False
+        assert _suffix_editability('.bin') is False
+        assert _suffix_editability('.unknownext') is None
+        with patch('backend.filesystem_editor.mimetypes.guess_type') as mock_guess:
+            assert _suffix_editability('.jpg') is False
+            mock_guess.assert_not_called()
+    
+    def test_list_directory_cache(self, tmp_path):
+        """Test repeat listings are cached and invalidated by editor writes"""
+        (tmp_path / 'a.txt').write_text('a')
+        manager = FileSystemManager()
+        
+        first = manager.list_directory(str(tmp_path))
+        with patch('backend.filesystem_editor.os.scandir') as mock_scandir:
+            assert manager.list_directory(str(tmp_path)) is first
+            mock_scandir.assert_not_called()
+        
+        manager.write_file(str(tmp_path / 'b.txt'), 'b')
+        assert [item['name'] for item in manager.list_directory(str(tmp_path))['items']] == ['a.txt', 'b.txt']
+        
+        manager.delete_item(str(tmp_path / 'a.txt'))
+        assert [item['name'] for item in manager.list_directory(str(tmp_path))['items']] == ['b.txt']
+        
+        with patch.object(FileSystemManager, 'LIST_CACHE_TTL', 0):
+            current = manager.list_directory(str(tmp_path))
+            assert manager.list_directory(str(tmp_path)) is not current
+    
+    def test_read_file_decodes_across_chunks(self, tmp_path):
+        """Test read_file decodes multi-byte characters split across read chunks"""
+        file_path = tmp_path / 'big.txt'
+        text = 'é' * 70000
+        file_path.write_text(text, encoding='utf-8')
+        manager = FileSystemManager()
+        
+        assert manager.read_file(str(file_path))['content'] == text
+        
+        file_path.write_bytes(b'ok\xff')
+        with pytest.raises(HTTPException) as exc_info:
+            manager.read_file(str(file_path))
+        assert exc_info.value.status_code == 415
+    
+    def test_write_file_replaces_atomically(self, tmp_path):
+        """Test write_file keeps file mode and leaves no temp file behind"""
+        file_path = tmp_path / 'script.sh'
+        file_path.write_text('old')
+        file_path.chmod(0o755)
+        manager = FileSystemManager()
+        
+        result = manager.write_file(str(file_path), 'echo é\n')
+        
+        assert file_path.read_text(encoding='utf-8') == 'echo é\n'
+        assert result['size'] == len('echo é\n'.encode('utf-8'))
+        assert file_path.stat().st_mode & 0o777 == 0o755
+        assert [p.name for p in tmp_path.iterdir()] == ['script.sh']
+        
+        with patch('backend.filesystem_editor.os.replace', side_effect=OSError('disk full')):
+            with pytest.raises(HTTPException) as exc_info:
+                manager.write_file(str(file_path), 'new')
+        assert exc_info.value.status_code == 500
+        assert file_path.read_text(encoding='utf-8') == 'echo é\n'
+        assert [p.name for p in tmp_path.iterdir()] == ['script.sh']
+    
+    def test_write_file_missing_parent(self, tmp_path):
+        """Test writes into a missing directory fail cleanly unless create_dirs is set"""
+        manager = FileSystemManager()
+        target = tmp_path / 'missing' / 'notes.txt'
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.write_file(str(target), 'hi')
+        assert exc_info.value.status_code == 400
+        assert list(tmp_path.iterdir()) == []
+        
+        manager.write_file(str(target), 'hi', create_dirs=True)
+        assert target.read_text() == 'hi'
+    
+    def test_patch_file_applies_ops_against_base_hash(self, tmp_path):
+        """Test patch_file edits in UTF-16 offsets and rejects a stale base"""
+        file_path = tmp_path / 'notes.txt'
+        file_path.write_text('a😀b\nend', encoding='utf-8')
+        base = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        manager = FileSystemManager()
+        
+        # The emoji is two UTF-16 code units, so 'b' sits at offset 3
+        result = manager.patch_file(str(file_path), base, [
+            {'offset': 3, 'delete': 1, 'insert': 'B'},
+            {'offset': 5, 'delete': 3, 'insert': 'fin'},
+        ])
+        
+        assert file_path.read_text(encoding='utf-8') == 'a😀B\nfin'
+        assert result['sha256'] == hashlib.sha256(file_path.read_bytes()).hexdigest()
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.patch_file(str(file_path), base, [{'offset': 0, 'delete': 0, 'insert': 'x'}])
+        assert exc_info.value.status_code == 409
+        
+        current = result['sha256']
+        for ops in ([{'offset': 99, 'delete': 0, 'insert': ''}],
+                    [{'offset': 2, 'delete': 0, 'insert': 'x'}],
+                    [{'offset': 0}]):
+            with pytest.raises(HTTPException) as exc_info:
+                manager.patch_file(str(file_path), current, ops)
+            assert exc_info.value.status_code == 422
+        assert file_path.read_text(encoding='utf-8') == 'a😀B\nfin'
+    
+    def test_patch_file_rejects_malformed_ops(self, tmp_path):
+        """Test patch_file answers malformed ops with a 422 instead of crashing while sorting"""
+        file_path = tmp_path / 'notes.txt'
+        file_path.write_text('hello', encoding='utf-8')
+        base = hashlib.sha256(file_path.read_bytes()).hexdigest()
+        manager = FileSystemManager()
+        
+        valid = {'offset': 1, 'delete': 0, 'insert': 'x'}
+        for ops in ([{'offset': None, 'delete': 0, 'insert': 'y'}, valid],
+                    [{'delete': 0, 'insert': 'y'}, valid],
+                    [{'offset': True, 'delete': 0, 'insert': 'y'}],
+                    [{'offset': 0, 'delete': 1.5, 'insert': 'y'}],
+                    [{'offset': 0, 'delete': 0, 'insert': 7}],
+                    ['not an op', valid]):
+            with pytest.raises(HTTPException) as exc_info:
+                manager.patch_file(str(file_path), base, ops)
+            assert exc_info.value.status_code == 422
+        assert file_path.read_text(encoding='utf-8') == 'hello'
+    
+    def test_name_suffix_matches_pathlib(self):
+        """Test the string suffix helper agrees with PurePath.suffix"""
+        for name in ['a.py', 'README.MD', '.bashrc', 'archive.tar.gz', 'Makefile', 'trailing.']:
+            assert _name_suffix(name) == Path(name).suffix.lower()
+    
+    def test_validate_path_rejects_sibling_prefix(self, tmp_path):
+        """Test a sibling directory sharing the base path's prefix is rejected"""
+        base = tmp_path / 'base'
+        base.mkdir()
+        manager = FileSystemManager(base_path=str(base))
+        
+        assert manager._validate_path(str(base)) == base
+        assert manager._validate_path(str(base / 'sub')) == base / 'sub'
+        assert FileSystemManager(base_path='/')._validate_path(str(base)) == base
+        with pytest.raises(HTTPException) as exc_info:
+            manager._validate_path(str(tmp_path / 'base-other'))
+        assert exc_info.value.status_code == 403
+    
+    def test_list_directory_prefetches_stats_for_large_directories(self, tmp_path):
+        """Test large listings warm entry stats through the prefetch pool"""
+        for i in range(5):
+            (tmp_path / f'f{i}.txt').write_text('x' * i)
+        
+        with patch('backend.filesystem_editor.STAT_PREFETCH_THRESHOLD', 3), \
+             patch('backend.filesystem_editor._prefetch_stat', wraps=_prefetch_stat) as mock_prefetch:
+            result = FileSystemManager().list_directory(str(tmp_path))
+        
+        assert mock_prefetch.call_count == 5
+        assert [item['size'] for item in result['items']] == [0, 1, 2, 3, 4]
+    
+    def test_list_directory_stream_prefetches_stats_for_large_directories(self, tmp_path):
+        """Test streamed listings overlap entry stats through the prefetch pool"""
+        import json
+        for i in range(5):
+            (tmp_path / f'f{i}.txt').write_text('x' * i)
+        manager = FileSystemManager()
+        
+        with patch('backend.filesystem_editor.STAT_PREFETCH_THRESHOLD', 3), \
+             patch('backend.filesystem_editor._prefetch_stat', wraps=_prefetch_stat) as mock_prefetch:
+            streamed = json.loads(b''.join(manager.list_directory_stream(str(tmp_path))))
+        
+        assert mock_prefetch.call_count == 5
+        assert [item['size'] for item in streamed['items']] == [0, 1, 2, 3, 4]
+    
+    def test_is_text_file_sniffs_unknown_suffixes(self, tmp_path):
+        """Test content sniffing for files without a known text suffix"""
+        manager = FileSystemManager()
+        text = tmp_path / 'notes.dat'
+        text.write_text('a' * 1023 + 'é' + 'b' * 10, encoding='utf-8')  # é straddles the 1KB sample
+        binary = tmp_path / 'blob.dat'
+        binary.write_bytes(b'abc\x00def')
+        ascii_text = tmp_path / 'plain.dat'
+        ascii_text.write_bytes(b'just ascii\n')
+        latin1 = tmp_path / 'latin1.dat'
+        latin1.write_bytes('café au lait'.encode('latin-1'))
+        
+        assert manager._is_text_file(text) is True
+        assert manager._is_text_file(binary) is False
+        assert manager._is_text_file(ascii_text) is True
+        assert manager._is_text_file(latin1) is False
+        assert manager._is_text_file(tmp_path / 'missing.dat') is False
+        
+        # Files we don't own refuse O_NOATIME; the sniff retries with a plain open
+        real_open = os.open
+        def refuse_noatime(path, flags, *args):
+            if flags & getattr(os, 'O_NOATIME', 0):
+                raise PermissionError('O_NOATIME not permitted')
+            return real_open(path, flags, *args)
+        with patch('backend.filesystem_editor.os.open', side_effect=refuse_noatime):
+            assert manager._is_text_file(ascii_text) is True
+    
+    def test_list_directory_stream_matches_listing(self, tmp_path):
+        """Test the streamed listing is the same JSON document as list_directory"""
+        import json
+        (tmp_path / 'b.py').write_text('print(1)')
+        (tmp_path / 'A.txt').write_text('hello')
+        (tmp_path / 'sub').mkdir()
+        manager = FileSystemManager()
+        
+        streamed = json.loads(b''.join(manager.list_directory_stream(str(tmp_path))))
+        assert streamed == manager.list_directory(str(tmp_path))
+        
+        manager.STREAM_BATCH_SIZE = 2
+        chunks = list(manager.list_directory_stream(str(tmp_path)))
+        assert len(chunks) == 4  # header, two batches, trailer
+        assert json.loads(b''.join(chunks)) == manager.list_directory(str(tmp_path))
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.list_directory_stream(str(tmp_path / 'missing'))
+        assert exc_info.value.status_code == 404
+    
+    def test_read_file_reports_opened_file_metadata(self, tmp_path):
+        """Test read_file reports size and mtime of the file it actually read"""
+        file_path = tmp_path / 'data.txt'
+        file_path.write_text('short')
+        manager = FileSystemManager()
+        real_open = open
+        
+        def open_after_replace(path, *args, **kwargs):
+            # Simulate a save landing between the pre-checks and the read
+            manager.write_file(str(file_path), 'a longer body')
+            return real_open(path, *args, **kwargs)
+        
+        with patch('builtins.open', side_effect=open_after_replace):
+            result = manager.read_file(str(file_path))
+        
+        assert result['content'] == 'a longer body'
+        assert result['size'] == len('a longer body')
+    
+    def test_delete_item(self, tmp_path):
+        """Test delete_item removes files and directories and 404s on missing paths"""
+        manager = FileSystemManager()
+        (tmp_path / 'file.txt').write_text('x')
+        (tmp_path / 'empty').mkdir()
+        (tmp_path / 'tree' / 'nested').mkdir(parents=True)
+        (tmp_path / 'tree' / 'nested' / 'a.txt').write_text('a')
+        
+        manager.delete_item(str(tmp_path / 'file.txt'))
+        manager.delete_item(str(tmp_path / 'empty'))
+        with pytest.raises(HTTPException) as exc_info:
+            manager.delete_item(str(tmp_path / 'tree'))
+        assert exc_info.value.status_code == 500
+        manager.delete_item(str(tmp_path / 'tree'), recursive=True)
+        assert list(tmp_path.iterdir()) == []
+        
+        with pytest.raises(HTTPException) as exc_info:
+            manager.delete_item(str(tmp_path / 'file.txt'))
+        assert exc_info.value.status_code == 404
+    
+    def test_list_directory_does_not_sniff_content(self, tmp_path):
+        """Test listings judge editability from the suffix without opening files"""
+        (tmp_path / 'blob.bin').write_bytes(b'\x00\x01')
+        (tmp_path / 'photo.png').write_bytes(b'\x89PNG')
+        (tmp_path / 'notes.md').write_text('# notes')
+        manager = FileSystemManager()
+        
+        with patch('backend.filesystem_editor._sniff_is_text') as mock_sniff:
+            listing = manager.list_directory(str(tmp_path))
+            mock_sniff.assert_not_called()
+        
+        editable = {item['name']: item['is_editable'] for item in listing['items']}
+        assert editable == {'blob.bin': False, 'notes.md': True, 'photo.png': False}
+    
+    def test_list_directory_binary_and_unknown_suffixes_not_editable(self, tmp_path):
+        """Test binary documents and archives, and unknown suffixes, are listed as not editable"""
+        (tmp_path / 'report.pdf').write_bytes(b'%PDF-1.4')
+        (tmp_path / 'bundle.zip').write_bytes(b'PK\x03\x04')
+        (tmp_path / 'model.pkl').write_bytes(b'\x80\x04')
+        (tmp_path / 'LICENSE').write_text('MIT')
+        manager = FileSystemManager()
+        
+        listing = manager.list_directory(str(tmp_path))
+        
+        assert {item['name']: item['is_editable'] for item in listing['items']} == {
+            'bundle.zip': False, 'LICENSE': False, 'model.pkl': False, 'report.pdf': False,
+        }
+        assert manager._is_editable_fast('.pdf') is False
+        assert manager._is_editable_fast('.zip') is False
+        # Unknown stays unknown so the editor can still try the file
+        assert manager._is_editable_fast('') is None
+    
+    def test_list_directory_columns_matches_items(self, tmp_path):
+        """Test the columnar listing carries the same rows as list_directory"""
+        (tmp_path / 'b.txt').write_text('bb')
+        (tmp_path / 'a.bin').write_bytes(b'\x00\x01')
+        (tmp_path / 'Makefile').write_text('all:\n')
+        (tmp_path / 'sub').mkdir()
+        manager = FileSystemManager()
+        
+        listing = manager.list_directory(str(tmp_path))
+        columnar = manager.list_directory_columns(str(tmp_path))
+        
+        columns = columnar['columns']
+        assert columns['name'] == ['sub', 'a.bin', 'b.txt', 'Makefile']
+        # Only the columns mark an unknown suffix (bit 2); the item says False
+        assert columns['flags'] == [1, 0, 2, 4]
+        assert columns['size'] == [item['size'] for item in listing['items']]
+        assert columns['modified'] == [item['modified'] for item in listing['items']]
+        assert [os.path.join(columnar['path'], name) for name in columns['name']] == [
+            item['path'] for item in listing['items']
+        ]
+        assert columnar['total_items'] == 4
+    
+    def test_list_directory_columns_cached_with_listing(self, tmp_path):
+        """Test repeat columnar views reuse the cached columns until the directory changes"""
+        (tmp_path / 'a.txt').write_text('a')
+        manager = FileSystemManager()
+        
+        first = manager.list_directory_columns(str(tmp_path))
+        assert manager.list_directory_columns(str(tmp_path)) is first
+        
+        manager.write_file(str(tmp_path / 'b.txt'), 'b')
+        second = manager.list_directory_columns(str(tmp_path))
+        assert second is not first
+        assert second['columns']['name'] == ['a.txt', 'b.txt']
+    
+    def test_stat_paths_batches_by_parent(self, tmp_path):
+        """Test stat_paths returns metadata keyed by the requested paths, one scan per directory"""
+        (tmp_path / 'a.txt').write_text('aa')
+        (tmp_path / 'b.py').write_text('b')
+        (tmp_path / 'sub').mkdir()
+        (tmp_path / 'sub' / 'c.md').write_text('ccc')
+        manager = FileSystemManager(base_path=str(tmp_path))
+        requested = [str(tmp_path / 'a.txt'), str(tmp_path / 'b.py'), str(tmp_path / 'sub' / 'c.md'),
+                     str(tmp_path / 'missing.txt'), '/etc/passwd']
+        
+        with patch('backend.filesystem_editor.os.scandir', wraps=os.scandir) as mock_scandir:
+            result = manager.stat_paths(requested)
+        
+        assert mock_scandir.call_count == 2
+        assert set(result) == set(requested[:3])
+        assert result[str(tmp_path / 'a.txt')]['size'] == 2
+        assert result[str(tmp_path / 'sub' / 'c.md')]['is_editable'] is True
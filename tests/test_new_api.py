@@ -1,6 +1,8 @@
 """Tests for the new SyftObject API"""
 
 import pytest
+from unittest.mock import patch
+
 from syft_objects import create_object
 
 
@@ -119,6 +121,64 @@ class TestNewAPI:
         obj.set_description("New Description")
         assert obj.get_description() == "New Description"
     
+    def test_apply_permissions_writes_each_file_once(self):
+        """Test apply_permissions batches all changes into one write per file"""
+        obj = create_object(
+            name="Batch Permissions",
+            private_contents="Private data",
+            mock_contents="Mock data"
+        )
+        current = {"read": ["reader@example.com"], "write": ["writer@example.com"], "admin": ["admin@example.com"]}
+        
+        with patch("syft_objects.accessors.MockAccessor.get_path", return_value="/tmp/mock.txt"), \
+             patch("syft_objects.accessors.PrivateAccessor.get_path", return_value="/tmp/private.txt"), \
+             patch("syft_objects.accessors.sp.get_file_permissions", return_value=current, create=True), \
+             patch("syft_objects.accessors.sp.set_file_permissions", create=True) as mock_set:
+            updated = obj.apply_permissions({
+                "mock_read": ["public"],
+                "mock_write": ["new@example.com"],
+                "private_admin": ["new@example.com"],
+            })
+        
+        assert updated == ["mock_read", "mock_write", "private_admin"]
+        assert mock_set.call_count == 2
+        mock_call, private_call = mock_set.call_args_list
+        assert mock_call.args == ("/tmp/mock.txt",)
+        assert private_call.args == ("/tmp/private.txt",)
+        assert mock_call.kwargs == {
+            "read_users": ["public"],
+            "write_users": ["new@example.com"],
+            "admin_users": ["admin@example.com"],
+        }
+        assert private_call.kwargs == {
+            "read_users": ["reader@example.com"],
+            "write_users": ["writer@example.com"],
+            "admin_users": ["new@example.com"],
+        }
+    
+    def test_apply_permissions_seeds_missing_admin_like_read_setter(self):
+        """Test a read-only update copies write users into a missing admin list, as set_read_permissions does"""
+        obj = create_object(
+            name="Batch Permissions Without Admin",
+            private_contents="Private data",
+            mock_contents="Mock data"
+        )
+        current = {"read": ["reader@example.com"], "write": ["writer@example.com"]}
+        
+        with patch("syft_objects.accessors.MockAccessor.get_path", return_value="/tmp/mock.txt"), \
+             patch("syft_objects.accessors.PrivateAccessor.get_path", return_value="/tmp/private.txt"), \
+             patch("syft_objects.accessors.sp.get_file_permissions", return_value=current, create=True), \
+             patch("syft_objects.accessors.sp.set_file_permissions", create=True) as mock_set:
+            obj.apply_permissions({
+                "mock_read": ["public"],
+                "private_write": ["new@example.com"],
+            })
+        
+        mock_call, private_call = mock_set.call_args_list
+        assert mock_call.kwargs["admin_users"] == ["writer@example.com"]
+        # A write-only update keeps the (missing) admin list empty, as set_write_permissions does
+        assert private_call.kwargs["admin_users"] == []
+    
     def test_dir_shows_new_api(self):
         """Test that dir() shows the new API methods"""
         obj = create_object(
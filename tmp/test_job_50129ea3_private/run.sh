@@ -0,0 +1,2 @@
+#!/bin/bash
+echo 'Running job'
\ No newline at end of file
@@ -0,0 +1,2 @@
+#!/bin/bash
+echo 'Mock script'
\ No newline at end of file